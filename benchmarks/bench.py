@@ -0,0 +1,280 @@
+"""
+Micro-benchmarks for the CPU stages on a synthetic corpus
+
+Run from the repository root:
+    python -m benchmarks.bench run                      # 1k / 10k / 100k articles
+    python -m benchmarks.bench run --sizes 1000,5000 --output /tmp/new.json
+    python -m benchmarks.bench save-baseline            # results.json becomes baseline.json
+    python -m benchmarks.bench compare benchmarks/baseline.json benchmarks/results.json
+
+Timings are machine-specific, so the baseline is not committed: save one
+from a run of the reference commit on the same machine, then compare.
+compare exits with status 1 when a benchmark got slower than --threshold
+or a result file is missing.
+"""
+import argparse
+import io
+import json
+import platform
+import re
+import subprocess
+import sys
+import time
+from contextlib import redirect_stdout
+from datetime import datetime, timezone
+
+from financial_news.config import load_topics
+from financial_news.config_bundle import build_topic_index
+from financial_news.dedup import (entity_index, entity_matcher, extract_entities, extract_first_n_words,
+                                  is_duplicate_advanced)
+from financial_news.categorize import categorize_article, categorize_indexed
+from financial_news import categorize_vector
+from financial_news.trending import identify_trending_wordcloud
+from financial_news.render import build_messages
+from benchmarks.corpus import make_corpus
+
+# ============================================
+# CONFIGURATION
+# ============================================
+DEFAULT_SIZES = [1000, 10000, 100000]
+RESULTS_PATH = 'benchmarks/results.json'
+BASELINE_PATH = 'benchmarks/baseline.json'
+DEDUP_PROBES = 500  # is_duplicate_advanced calls timed against the full corpus
+DEDUP_PASS_LIMIT = 10000  # Full pairwise dedup pass only up to this size (quadratic)
+DEFAULT_THRESHOLD = 0.15  # 15% slower counts as a regression
+
+# ============================================
+# BENCHMARKS
+# ============================================
+# Each benchmark takes (articles, topics) and returns a function to time,
+# or None to skip (reason in SKIPPED). Returned functions must leave
+# articles as they found them.
+
+def bench_extract_entities(articles, topics):
+    """With the config bundle's entity matcher, as the pipeline runs it"""
+    titles = [a.title for a in articles]
+    matcher = entity_matcher(entity_index())
+    return lambda: [extract_entities(t, matcher) for t in titles]
+
+def bench_extract_first_n_words(articles, topics):
+    titles = [a.title for a in articles]
+    return lambda: [extract_first_n_words(t, n=7) for t in titles]
+
+def reset_signatures(articles):
+    for article in articles:
+        article.signature = None
+
+def bench_is_duplicate_advanced(articles, topics):
+    """DEDUP_PROBES fresh articles checked against the whole corpus (one dedup step on a full day)"""
+    probes = make_corpus(DEDUP_PROBES, duplicate_rate=0, seed=7)
+    matcher = entity_matcher(entity_index())
+
+    def run():
+        reset_signatures(articles)
+        reset_signatures(probes)
+        for probe in probes:
+            is_duplicate_advanced(probe, articles, matcher)
+    return run
+
+def bench_dedup_pass(articles, topics):
+    """The pipeline's full dedup: every article against the kept ones"""
+    if len(articles) > DEDUP_PASS_LIMIT:
+        return None
+    matcher = entity_matcher(entity_index())
+
+    def run():
+        reset_signatures(articles)
+        kept = []
+        for article in articles:
+            if not is_duplicate_advanced(article, kept, matcher):
+                kept.append(article)
+    return run
+
+def bench_categorize_article(articles, topics):
+    return lambda: [categorize_article(a.title, a.description, topics) for a in articles]
+
+def bench_categorize_indexed(articles, topics):
+    """The keyword engine as the pipeline runs it"""
+    topic_index = build_topic_index(topics)
+    topic_matcher = re.compile(topic_index['prefilter'])
+    return lambda: [categorize_indexed(a.title, a.description, topic_index, topic_matcher) for a in articles]
+
+def bench_categorize_vector(articles, topics):
+    """The same topics from one sparse-matrix batch (--categorize vector)"""
+    if not categorize_vector.AVAILABLE:
+        return None
+    topic_index = build_topic_index(topics)
+    scanner = categorize_vector.topic_scanner(topic_index)
+    categorize_vector.categorize_batch(['warm up'], topic_index, None, scanner)  # scipy import
+
+    def run():
+        texts = [categorize_vector.article_text(a.title, a.description) for a in articles]
+        categorize_vector.categorize_batch(texts, topic_index, None, scanner)
+    return run
+
+def bench_identify_trending_wordcloud(articles, topics):
+    return lambda: identify_trending_wordcloud(articles, top_n=10)
+
+def bench_build_messages(articles, topics):
+    trending_topics = identify_trending_wordcloud(articles, top_n=10)
+    return lambda: build_messages(articles, trending_topics, topics)
+
+BENCHMARKS = {
+    'extract_entities': bench_extract_entities,
+    'extract_first_n_words': bench_extract_first_n_words,
+    'is_duplicate_advanced': bench_is_duplicate_advanced,
+    'dedup_pass': bench_dedup_pass,
+    'categorize_article': bench_categorize_article,
+    'categorize_indexed': bench_categorize_indexed,
+    'categorize_vector': bench_categorize_vector,
+    'identify_trending_wordcloud': bench_identify_trending_wordcloud,
+    'build_messages': bench_build_messages
+}
+
+SKIPPED = {
+    'dedup_pass': f'quadratic, limit {DEDUP_PASS_LIMIT}',
+    'categorize_vector': 'needs numpy + scipy'
+}
+
+# ============================================
+# RUN
+# ============================================
+def time_best(fn, repeat):
+    """Best wall time of repeat calls (the stages' progress prints are swallowed)"""
+    best = None
+    for _ in range(repeat):
+        with redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            fn()
+            elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'],
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except Exception:
+        return None
+
+def run_benchmarks(sizes, repeat, only=None, duplicate_rate=0.2):
+    topics = load_topics()
+    results = {}
+
+    for size in sizes:
+        articles = make_corpus(size, duplicate_rate=duplicate_rate, topics=[t['name'] for t in topics])
+        print(f'\n{size} articles ({duplicate_rate:.0%} duplicate stories)')
+
+        for name, bench in BENCHMARKS.items():
+            if only and name not in only:
+                continue
+            with redirect_stdout(io.StringIO()):
+                fn = bench(articles, topics)
+            if fn is None:
+                print(f'  {name:30} skipped ({SKIPPED[name]})')
+                continue
+
+            seconds = time_best(fn, repeat if size <= 10000 else 1)
+            results.setdefault(name, {})[str(size)] = round(seconds, 6)
+            print(f'  {name:30} {seconds * 1000:10.1f} ms {seconds * 1e6 / size:9.2f} µs/article')
+
+    return {
+        'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'repeat': repeat,
+        'results': results
+    }
+
+# ============================================
+# COMPARE
+# ============================================
+def compare(baseline, current, threshold):
+    """Returns: list of (benchmark, size, baseline s, current s, change) that regressed"""
+    regressions = []
+
+    print(f"{'benchmark':30} {'size':>7} {'baseline':>11} {'current':>11} {'change':>8}")
+    for name, by_size in current['results'].items():
+        for size, seconds in by_size.items():
+            before = baseline['results'].get(name, {}).get(size)
+            if before is None:
+                print(f'{name:30} {size:>7} {"-":>11} {seconds * 1000:9.1f}ms {"new":>8}')
+                continue
+
+            change = (seconds - before) / before if before else 0.0
+            flag = '  ❌' if change > threshold else ''
+            print(f'{name:30} {size:>7} {before * 1000:9.1f}ms {seconds * 1000:9.1f}ms {change:+7.0%}{flag}')
+            if change > threshold:
+                regressions.append((name, size, before, seconds, change))
+
+    return regressions
+
+def load_result(path, hint):
+    """A run result, or None (after printing why) when the file is missing or unreadable"""
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        print(f'❌ {path} not found - {hint}')
+    except ValueError as e:
+        print(f'❌ {path} is not a benchmark result: {e}')
+    return None
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmarks for the CPU stages')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help='Run the benchmarks and write a JSON result')
+    run_parser.add_argument('--sizes', default=','.join(map(str, DEFAULT_SIZES)),
+                            help='Comma-separated corpus sizes (default: 1000,10000,100000)')
+    run_parser.add_argument('--repeat', type=int, default=3, help='Best of N runs (sizes above 10k run once)')
+    run_parser.add_argument('--duplicate-rate', type=float, default=0.2, help='Share of re-reported stories')
+    run_parser.add_argument('--only', help='Comma-separated benchmark names')
+    run_parser.add_argument('--output', default=RESULTS_PATH, help='Result file (default: ' + RESULTS_PATH + ')')
+
+    save_parser = commands.add_parser('save-baseline', help='Keep a run result as the baseline for compare')
+    save_parser.add_argument('result', nargs='?', default=RESULTS_PATH)
+    save_parser.add_argument('--baseline', default=BASELINE_PATH, help='Baseline file (default: ' + BASELINE_PATH + ')')
+
+    compare_parser = commands.add_parser('compare', help='Flag regressions against a baseline result')
+    compare_parser.add_argument('baseline', nargs='?', default=BASELINE_PATH)
+    compare_parser.add_argument('current', nargs='?', default=RESULTS_PATH)
+    compare_parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                                help='Slowdown that counts as a regression (default: 0.15 = 15%%)')
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'run':
+        sizes = [int(s) for s in args.sizes.split(',')]
+        only = set(args.only.split(',')) if args.only else None
+        result = run_benchmarks(sizes, args.repeat, only, args.duplicate_rate)
+        with open(args.output, 'w') as f:
+            json.dump(result, f, indent=2)
+        print('\n📈 Results written to ' + args.output)
+        return 0
+
+    run_hint = 'create it with: python -m benchmarks.bench run'
+    if args.command == 'save-baseline':
+        result = load_result(args.result, run_hint)
+        if result is None:
+            return 1
+        with open(args.baseline, 'w') as f:
+            json.dump(result, f, indent=2)
+        print(f"📌 Baseline {args.baseline}: results of commit {result.get('commit') or 'unknown'}")
+        return 0
+
+    baseline = load_result(args.baseline, run_hint + ' on the reference commit, then: python -m benchmarks.bench save-baseline')
+    current = load_result(args.current, run_hint)
+    if baseline is None or current is None:
+        return 1
+
+    regressions = compare(baseline, current, args.threshold)
+    if regressions:
+        print(f'\n❌ {len(regressions)} regressions above {args.threshold:.0%}')
+        return 1
+    print('\n✅ No regressions')
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,87 @@
+import random
+from datetime import datetime, timedelta
+
+from financial_news.article import make_article
+from financial_news.dedup import BANKS, INSURANCE, COMPANIES, INSTITUTIONS
+
+# ============================================
+# SYNTHETIC FINANCIAL HEADLINES
+# ============================================
+# Headlines are built from the extract_entities() dictionaries, so entity
+# extraction and dedup see the same names they see in real feeds.
+# duplicate_rate is the share of articles that re-report an earlier story
+# (same entities and numbers, reworded) the way another publication would.
+
+PUBLICATIONS = {'BS': 'BS Markets', 'ET': 'ET Banking', 'LM': 'LM Money', 'FE': 'FE Economy', 'MC': 'MC News'}
+
+EVENTS = [
+    'reports Q{q} net profit up {pct}%', 'cuts lending rates by {bps} bps', 'raises Rs {amount} crore via bonds',
+    'shares fall {pct}% after results', 'gets regulatory nod for {pct}% stake buy', 'NPA ratio improves to {small}%',
+    'announces Rs {amount} crore rights issue', 'deposit growth slows to {pct}%', 'hikes FD rates by {bps} bps',
+    'faces penalty of Rs {amount} crore', 'plans IPO worth Rs {amount} crore', 'loan book grows {pct}% in Q{q}',
+    'premium income rises {pct}%', 'board approves merger with {other}', 'market share climbs to {small}%'
+]
+
+REWORDINGS = [
+    '{entity}: {event}', '{entity} {event}, says report', 'Breaking: {entity} {event}',
+    '{entity} {event} amid market volatility', 'Why {entity} {event}', '{entity} {event} - analysts react'
+]
+
+MACRO = [
+    'Sensex ends {pct} points higher as banks rally', 'Rupee slips to {small} against dollar',
+    'GDP growth forecast revised to {small}%', 'Inflation eases to {small}% in {month}',
+    'FPIs pull out Rs {amount} crore from equities', 'Gold prices hit record on global cues'
+]
+
+MONTHS = ['January', 'February', 'March', 'April', 'May', 'June', 'July',
+          'August', 'September', 'October', 'November', 'December']
+
+def entity_name(entity):
+    return entity.title() if len(entity) > 4 else entity
+
+def fill(template, rng, entities):
+    return template.format(
+        q=rng.randint(1, 4), pct=rng.randint(1, 99), bps=rng.choice([10, 15, 25, 50]),
+        amount=rng.choice([500, 1000, 1500, 2500, 5000, 10000]), small=round(rng.uniform(1, 9), 1),
+        month=rng.choice(MONTHS), other=entity_name(rng.choice(entities))
+    )
+
+def make_corpus(size, duplicate_rate=0.2, topics=None, seed=42):
+    """
+    size Articles over the last 24 hours, newest first
+    topics (names) are assigned at random; categorize_article() is benchmarked separately
+    """
+    rng = random.Random(seed)
+    entities = list(BANKS + INSURANCE + COMPANIES + INSTITUTIONS)
+    topic_names = topics or ['BANKING & FINANCE', 'INSURANCE', 'MARKETS', 'ECONOMY', 'OTHER NEWS']
+    now = datetime.utcnow()
+    stories = []
+    articles = []
+
+    for i in range(size):
+        publication = rng.choice(list(PUBLICATIONS))
+
+        if stories and rng.random() < duplicate_rate:
+            entity, event = rng.choice(stories)
+        else:
+            if rng.random() < 0.15:
+                entity, event = '', fill(rng.choice(MACRO), rng, entities)
+            else:
+                entity, event = entity_name(rng.choice(entities)), fill(rng.choice(EVENTS), rng, entities)
+            stories.append((entity, event))
+
+        if entity:
+            title = rng.choice(REWORDINGS).format(entity=entity, event=event)
+        else:
+            title = event
+
+        articles.append(make_article(
+            PUBLICATIONS[publication], publication, title,
+            f'https://example.com/{publication.lower()}/{i}',
+            now - timedelta(seconds=rng.randint(0, 24 * 3600)),
+            rng.choice(topic_names),
+            f'<p>{title}. More details on the {rng.choice(topic_names).lower()} story inside.</p>'
+        ))
+
+    articles.sort(key=lambda a: a.ts, reverse=True)
+    return articles
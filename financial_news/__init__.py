@@ -0,0 +1,6 @@
+"""
+Financial news aggregator: fetch RSS feeds, filter, categorize, dedup,
+find trending topics and send the digest to Telegram.
+
+Run with `python -m financial_news` or call financial_news.pipeline.main().
+"""
@@ -0,0 +1,115 @@
+import calendar
+import sys
+from dataclasses import dataclass
+from datetime import datetime
+
+# ============================================
+# CONFIGURATION
+# ============================================
+DESCRIPTION_CHARS = 300  # Kept for profile keyword matching only
+
+# ============================================
+# COMPACT ARTICLE RECORD
+# ============================================
+@dataclass(slots=True)
+class Article:
+    """
+    One relevant article. Source / publication / topic strings are interned,
+    the publish time is UTC epoch seconds and the description is truncated.
+    """
+    source: str
+    publication: str
+    title: str
+    url: str
+    ts: int
+    topic: str
+    description: str = ''
+    signature: tuple = None  # (entities, first words) cached by article_signature()
+
+    @property
+    def date(self):
+        """Publish time as naive UTC datetime"""
+        return datetime.utcfromtimestamp(self.ts)
+
+def make_article(source, publication, title, url, date, topic, description):
+    """Build an Article from feed data (date: UTC epoch seconds, or a naive UTC datetime)"""
+    return Article(
+        source=sys.intern(source),
+        publication=sys.intern(publication),
+        title=title,
+        url=url,
+        ts=date if isinstance(date, int) else calendar.timegm(date.timetuple()),
+        topic=sys.intern(topic),
+        description=str(description)[:DESCRIPTION_CHARS]
+    )
+
+def article_to_dict(article):
+    """JSON-friendly dict (signature sets become sorted lists)"""
+    data = {
+        'source': article.source,
+        'publication': article.publication,
+        'title': article.title,
+        'url': article.url,
+        'ts': article.ts,
+        'topic': article.topic,
+        'description': article.description
+    }
+    if article.signature is not None:
+        entities, words = article.signature
+        data['signature'] = [sorted(entities), sorted(words)]
+    return data
+
+def article_from_dict(data):
+    """Inverse of article_to_dict()"""
+    signature = None
+    if data.get('signature'):
+        entities, words = data['signature']
+        signature = (set(entities), set(words))
+
+    return Article(
+        source=sys.intern(data['source']),
+        publication=sys.intern(data['publication']),
+        title=data['title'],
+        url=data['url'],
+        ts=int(data['ts']),
+        topic=sys.intern(data['topic']),
+        description=data.get('description', ''),
+        signature=signature
+    )
+
+# ============================================
+# MEMORY REPORT: python -m financial_news.article
+# ============================================
+if __name__ == '__main__':
+    import tracemalloc
+
+    N = 10000
+    description = '<p>' + 'Lenders reported higher credit growth in the quarter. ' * 20 + '</p>'
+
+    def build_dicts():
+        return [{
+            'source': 'BS Banking ' + str(i % 60),
+            'publication': 'BS',
+            'title': 'HDFC Bank raises deposit rates by ' + str(i) + ' bps',
+            'url': 'https://www.business-standard.com/article/' + str(i),
+            'time': '10:30',
+            'date': datetime(2026, 1, 1, 10, 30),
+            'topic': 'BANKING & FINANCE',
+            'description': description + str(i)
+        } for i in range(N)]
+
+    def build_articles():
+        return [make_article(
+            'BS Banking ' + str(i % 60), 'BS',
+            'HDFC Bank raises deposit rates by ' + str(i) + ' bps',
+            'https://www.business-standard.com/article/' + str(i),
+            datetime(2026, 1, 1, 10, 30), 'BANKING & FINANCE', description + str(i)
+        ) for i in range(N)]
+
+    for label, build in (('dict articles', build_dicts), ('Article records', build_articles)):
+        tracemalloc.start()
+        items = build()
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f'{label:16s}: {current / 1024 / 1024:.2f} MB per {N} articles')
+        del items
@@ -0,0 +1,183 @@
+import hashlib
+import sqlite3
+import time
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+from .article import article_from_dict
+
+# ============================================
+# CONFIGURATION
+# ============================================
+STORE_PATH = 'articles.db'
+TRACKING_PREFIXES = ('utm_',)  # utm_source, utm_medium, ...
+TRACKING_PARAMS = {'fbclid', 'gclid', 'ref', 'cmpid'}  # Exact names: refid= or reference= are real parameters
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS feeds (
+    url TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    acronym TEXT NOT NULL,
+    first_seen INTEGER NOT NULL,
+    last_fetched INTEGER
+);
+
+CREATE TABLE IF NOT EXISTS articles (
+    url_hash INTEGER PRIMARY KEY,
+    url TEXT NOT NULL,
+    title TEXT NOT NULL,
+    description TEXT,
+    source TEXT NOT NULL,
+    publication TEXT NOT NULL,
+    topic TEXT NOT NULL,
+    published_ts INTEGER NOT NULL,
+    fetched_ts INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_articles_published ON articles (published_ts);
+CREATE INDEX IF NOT EXISTS idx_articles_topic ON articles (topic, published_ts);
+CREATE INDEX IF NOT EXISTS idx_articles_publication ON articles (publication, published_ts);
+
+CREATE TABLE IF NOT EXISTS fetch_attempts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    feed_url TEXT NOT NULL,
+    fetched_ts INTEGER NOT NULL,
+    ok INTEGER NOT NULL,
+    duration_ms INTEGER,
+    entries INTEGER,
+    recent INTEGER,
+    relevant INTEGER,
+    duplicates INTEGER,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_fetch_attempts_feed ON fetch_attempts (feed_url, fetched_ts);
+
+CREATE TABLE IF NOT EXISTS feed_health (
+    url TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    success_streak INTEGER NOT NULL,
+    failure_streak INTEGER NOT NULL,
+    relevant INTEGER NOT NULL,
+    recent INTEGER NOT NULL,
+    freshest_age REAL NOT NULL,
+    last_checked INTEGER NOT NULL,
+    last_good INTEGER,
+    next_check INTEGER NOT NULL
+);
+'''
+
+# ============================================
+# OPEN
+# ============================================
+def open_store(path=STORE_PATH):
+    """Open the article store in WAL mode (one writer, concurrent readers)"""
+    conn = sqlite3.connect(path, timeout=30)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    conn.executescript(SCHEMA)
+    return conn
+
+# ============================================
+# URL CANONICALIZATION
+# ============================================
+def canonical_url(url):
+    """Lowercase scheme/host, drop fragment, tracking params and trailing slash"""
+    parts = urlsplit(url.strip())
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+             if not k.lower().startswith(TRACKING_PREFIXES) and k.lower() not in TRACKING_PARAMS]
+    path = parts.path.rstrip('/') or '/'
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, urlencode(query), ''))
+
+def url_hash(url):
+    """Signed 64-bit hash of the canonical URL (SQLite INTEGER key)"""
+    digest = hashlib.sha1(canonical_url(url).encode('utf-8')).digest()
+    return int.from_bytes(digest[:8], 'big', signed=True)
+
+# ============================================
+# BULK WRITES
+# ============================================
+def record_feeds(conn, feeds):
+    """Upsert feed definitions from load_feeds()"""
+    now = int(time.time())
+    with conn:
+        conn.executemany(
+            'INSERT INTO feeds (url, name, acronym, first_seen) VALUES (?, ?, ?, ?) '
+            'ON CONFLICT(url) DO UPDATE SET name = excluded.name, acronym = excluded.acronym',
+            [(info['url'], name, info['acronym'], now) for name, info in feeds.items()]
+        )
+
+def record_articles(conn, articles, batch_size=500):
+    """Insert articles in batched transactions (existing URLs are kept)"""
+    now = int(time.time())
+    inserted = 0
+
+    for start in range(0, len(articles), batch_size):
+        rows = [
+            (url_hash(a.url), a.url, a.title, a.description,
+             a.source, a.publication, a.topic, a.ts, now)
+            for a in articles[start:start + batch_size]
+        ]
+        with conn:
+            before = conn.total_changes
+            conn.executemany(
+                'INSERT OR IGNORE INTO articles (url_hash, url, title, description, source, '
+                'publication, topic, published_ts, fetched_ts) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                rows
+            )
+            inserted += conn.total_changes - before
+
+    return inserted
+
+def record_fetch_attempts(conn, attempts):
+    """
+    Record one row per feed fetch
+    attempts: list of dicts with feed_url, ok, duration_ms, entries,
+    recent, relevant, duplicates, error
+    """
+    now = int(time.time())
+    with conn:
+        conn.executemany(
+            'INSERT INTO fetch_attempts (feed_url, fetched_ts, ok, duration_ms, entries, recent, '
+            'relevant, duplicates, error) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            [(a['feed_url'], now, int(a['ok']), a.get('duration_ms'), a.get('entries', 0),
+              a.get('recent', 0), a.get('relevant', 0), a.get('duplicates', 0), a.get('error'))
+             for a in attempts]
+        )
+        conn.executemany(
+            'UPDATE feeds SET last_fetched = ? WHERE url = ?',
+            [(now, a['feed_url']) for a in attempts if a['ok']]
+        )
+
+# ============================================
+# QUERIES
+# ============================================
+def query_articles(conn, since_ts, topics=None, publications=None):
+    """Articles published since since_ts, newest first, as Article records"""
+    sql = ('SELECT source, publication, title, url, published_ts, topic, description '
+           'FROM articles WHERE published_ts >= ?')
+    params = [since_ts]
+
+    if topics:
+        sql += ' AND topic IN (' + ','.join('?' * len(topics)) + ')'
+        params.extend(topics)
+    if publications:
+        sql += ' AND publication IN (' + ','.join('?' * len(publications)) + ')'
+        params.extend(publications)
+
+    sql += ' ORDER BY published_ts DESC'
+
+    return [
+        article_from_dict({
+            'source': source, 'publication': publication, 'title': title, 'url': url,
+            'ts': published_ts, 'topic': topic, 'description': description or ''
+        })
+        for source, publication, title, url, published_ts, topic, description in conn.execute(sql, params)
+    ]
+
+def feed_health_report(conn, since_ts):
+    """Per-feed fetch success, latency and yield since since_ts"""
+    return conn.execute(
+        'SELECT f.name, f.acronym, f.url, COUNT(a.id), COALESCE(SUM(a.ok), 0), '
+        'AVG(a.duration_ms), AVG(a.relevant), MAX(CASE WHEN a.ok THEN a.fetched_ts END) '
+        'FROM feeds f LEFT JOIN fetch_attempts a ON a.feed_url = f.url AND a.fetched_ts >= ? '
+        'GROUP BY f.url ORDER BY f.acronym, f.name',
+        (since_ts,)
+    ).fetchall()
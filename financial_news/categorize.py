@@ -0,0 +1,45 @@
+# ============================================
+# CATEGORIZE ARTICLE
+# ============================================
+def categorize_article(title, description, topics):
+    """Categorize article using scoring"""
+    text = (title + ' ' + str(description)).lower()
+    
+    topic_scores = {}
+    
+    for topic in topics:
+        score = 0
+        for keyword in topic['keywords']:
+            if keyword in text:
+                score += 1
+        
+        if score > 0:
+            topic_scores[topic['name']] = score
+    
+    if topic_scores:
+        best_topic = max(topic_scores, key=topic_scores.get)
+        return best_topic
+    
+    return 'OTHER NEWS'
+
+def categorize_indexed(title, description, topic_index, topic_matcher):
+    """
+    categorize_article() over a build_topic_index() index: every distinct
+    keyword is tested once, and texts without any topic keyword skip scoring
+    """
+    text = (title + ' ' + str(description)).lower()
+    
+    if not topic_matcher.search(text):
+        return 'OTHER NEWS'
+    
+    scores = [0] * len(topic_index['names'])
+    for keyword, positions in topic_index['keywords']:
+        if keyword in text:
+            for position in positions:
+                scores[position] += 1
+    
+    best_score = max(scores, default=0)
+    if best_score > 0:
+        return topic_index['names'][scores.index(best_score)]
+    
+    return 'OTHER NEWS'
@@ -0,0 +1,245 @@
+import importlib.util
+import re
+
+# ============================================
+# CONFIGURATION
+# ============================================
+MIN_HISTORY_SIMILARITY = 0.3  # Cosine to a topic centroid for an article without keyword hits
+MIN_TOKEN_CHARS = 3
+TOKEN_PATTERN = re.compile(r'[a-z][a-z0-9]+')
+SEPARATOR = '\x00'  # Between texts in the search buffer; never inside a keyword
+
+# numpy + scipy are optional: without them categorize_indexed() is used
+AVAILABLE = bool(importlib.util.find_spec('numpy') and importlib.util.find_spec('scipy'))
+
+# ============================================
+# BATCH TOPIC SCORING (numpy + scipy)
+# ============================================
+# categorize_indexed() tests every topic keyword against one article at a
+# time. This engine scores a whole batch:
+#   1. all texts are joined into one string and scanned once for every
+#      keyword, giving the sparse article x keyword hit matrix H
+#   2. scores = H @ K, K being the keyword x topic incidence matrix of
+#      topics.txt - the same keyword counts categorize_article() adds up
+#   3. argmax per row; ties go to the first topic, as max() over topics does
+# So every article with a keyword hit gets the topic the keyword engine
+# gives it. Articles without hits are 'OTHER NEWS', unless topic centroids
+# from history are given (topic_centroids()): then the topic whose TF-IDF
+# centroid is closest, if at least MIN_HISTORY_SIMILARITY.
+
+def article_text(title, description):
+    """The text categorize_article() matches against"""
+    return (title + ' ' + str(description)).lower()
+
+def longest_match_pattern(keywords):
+    """
+    Regex source matching the longest keyword at a position: a trie where
+    a keyword's end is an optional continuation - 'bank(?:ing)?' - unlike
+    config_bundle.keyword_automaton(), which stops at the shortest
+    """
+    trie = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[''] = True
+
+    def build(node):
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        alternation = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        return '(?:' + alternation + ')?' if '' in node else alternation
+
+    return build(trie)
+
+def new_keyword_scanner(keywords):
+    """
+    One-pass search for all keywords. Matching the longest keyword at every
+    position (a lookahead, so matches may overlap) finds every keyword that
+    occurs: the others starting there are prefixes of the longest one.
+    Returns: {'pattern', 'columns': {longest keyword: columns of it and its prefixes}, 'everywhere': [columns]}
+    """
+    columns = {}
+    for col, keyword in enumerate(keywords):
+        if keyword:
+            columns.setdefault(keyword, []).append(col)
+
+    prefixes = {}
+    for keyword in columns:
+        prefixes[keyword] = [col for end in range(1, len(keyword) + 1)
+                             for col in columns.get(keyword[:end], ())]
+
+    return {
+        'pattern': re.compile('(?=(' + longest_match_pattern(columns) + '))') if columns else None,
+        'columns': prefixes,
+        # '' is in every text (validate_config() warns about it)
+        'everywhere': [col for col, keyword in enumerate(keywords) if not keyword]
+    }
+
+def keyword_hits(texts, keywords, scanner=None):
+    """
+    Sparse article x keyword matrix: 1 where keywords[j] occurs in texts[i]
+    (substring match, like the keyword engine)
+    """
+    import numpy as np
+    from scipy.sparse import csr_matrix
+
+    scanner = scanner or new_keyword_scanner(keywords)
+    buffer = SEPARATOR.join(texts)
+    starts = np.cumsum([0] + [len(text) + 1 for text in texts[:-1]])
+
+    positions = []
+    cols = []
+    if scanner['pattern']:
+        columns = scanner['columns']
+        for match in scanner['pattern'].finditer(buffer):
+            matched = columns[match.group(1)]
+            positions.extend([match.start()] * len(matched))
+            cols.extend(matched)
+
+    rows = list(np.searchsorted(starts, np.array(positions, dtype='int64'), side='right') - 1)
+    for col in scanner['everywhere']:
+        rows.extend(range(len(texts)))
+        cols.extend([col] * len(texts))
+
+    hits = csr_matrix((np.ones(len(rows), dtype='int32'), (rows, cols)), shape=(len(texts), len(keywords)))
+    hits.sum_duplicates()
+    hits.data[:] = 1  # Presence, however often a keyword occurs
+    return hits
+
+def topic_incidence(topic_index):
+    """Sparse keyword x topic matrix of a build_topic_index() index"""
+    from scipy.sparse import csr_matrix
+
+    rows = []
+    cols = []
+    for row, (keyword, positions) in enumerate(topic_index['keywords']):
+        for position in positions:
+            rows.append(row)
+            cols.append(position)
+
+    shape = (len(topic_index['keywords']), len(topic_index['names']))
+    return csr_matrix(([1] * len(rows), (rows, cols)), shape=shape, dtype='int32')
+
+def topic_scanner(topic_index):
+    """new_keyword_scanner() of the topic keywords - build once, pass to categorize_batch()"""
+    return new_keyword_scanner([keyword for keyword, _ in topic_index['keywords']])
+
+def keyword_scores(texts, topic_index, scanner=None):
+    """Dense article x topic keyword counts"""
+    hits = keyword_hits(texts, [keyword for keyword, _ in topic_index['keywords']], scanner)
+    return (hits @ topic_incidence(topic_index)).toarray()
+
+def best_topics(scores):
+    """Topic position per row (first of ties), -1 for rows without any score"""
+    import numpy as np
+
+    if not scores.shape[1]:
+        return np.full(scores.shape[0], -1)
+    best = scores.argmax(axis=1)
+    return np.where(scores.max(axis=1) > 0, best, -1)
+
+# ============================================
+# TF-IDF CENTROIDS FROM HISTORY
+# ============================================
+# centroids = {'vocabulary': {token: column}, 'idf': array, 'names': [topic],
+#              'matrix': sparse topic x token matrix of L2-normalized centroids}
+
+def tokenize(text):
+    return [token for token in TOKEN_PATTERN.findall(text) if len(token) >= MIN_TOKEN_CHARS]
+
+def tfidf_matrix(texts, vocabulary, idf):
+    """Sparse L2-normalized TF-IDF rows of texts over a fixed vocabulary"""
+    import numpy as np
+    from scipy.sparse import csr_matrix
+
+    rows = []
+    cols = []
+    counts = []
+    for row, text in enumerate(texts):
+        tf = {}
+        for token in tokenize(text):
+            col = vocabulary.get(token)
+            if col is not None:
+                tf[col] = tf.get(col, 0) + 1
+        for col, count in tf.items():
+            rows.append(row)
+            cols.append(col)
+            counts.append(count)
+
+    matrix = csr_matrix((np.array(counts, dtype='float64'), (rows, cols)), shape=(len(texts), len(vocabulary)))
+    matrix = matrix.multiply(idf).tocsr()
+    norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+    norms[norms == 0] = 1.0
+    return csr_matrix(matrix.multiply(1.0 / norms[:, None]))
+
+def topic_centroids(texts, topic_index):
+    """
+    TF-IDF centroid per topic from history texts (e.g. stored articles),
+    each labeled by its keyword score - so the centroids learn the words
+    that come with a topic's keywords without feeding back their own guesses
+    Returns: centroids, or None when no history text has a keyword hit
+    """
+    import numpy as np
+    from scipy.sparse import csr_matrix
+
+    labels = best_topics(keyword_scores(texts, topic_index))
+    labeled = [(text, label) for text, label in zip(texts, labels) if label >= 0]
+    if not labeled:
+        return None
+
+    vocabulary = {}
+    document_frequency = []
+    for text, _ in labeled:
+        for token in set(tokenize(text)):
+            if token not in vocabulary:
+                vocabulary[token] = len(vocabulary)
+                document_frequency.append(0)
+            document_frequency[vocabulary[token]] += 1
+
+    # Smoothed idf, as scikit-learn's TfidfVectorizer
+    idf = np.log((1 + len(labeled)) / (1 + np.array(document_frequency, dtype='float64'))) + 1
+    documents = tfidf_matrix([text for text, _ in labeled], vocabulary, idf)
+
+    names = topic_index['names']
+    membership = csr_matrix(
+        (np.ones(len(labeled)), ([label for _, label in labeled], range(len(labeled)))),
+        shape=(len(names), len(labeled))
+    )
+    sums = membership @ documents
+    norms = np.sqrt(np.asarray(sums.multiply(sums).sum(axis=1)).ravel())
+    norms[norms == 0] = 1.0
+    return {
+        'vocabulary': vocabulary,
+        'idf': idf,
+        'names': names,
+        'matrix': csr_matrix(sums.multiply(1.0 / norms[:, None]))
+    }
+
+# ============================================
+# CATEGORIZE A BATCH
+# ============================================
+def categorize_batch(texts, topic_index, centroids=None, scanner=None):
+    """
+    Topic names for texts (article_text() of each article) in one pass
+    scanner: topic_scanner(topic_index), built here when not given
+    Returns: list of topic names, 'OTHER NEWS' where nothing matched
+    """
+    if not texts:
+        return []
+
+    names = topic_index['names']
+    best = best_topics(keyword_scores(texts, topic_index, scanner))
+    topics = [names[position] if position >= 0 else 'OTHER NEWS' for position in best]
+
+    unmatched = [i for i, position in enumerate(best) if position < 0]
+    if centroids and unmatched:
+        vectors = tfidf_matrix([texts[i] for i in unmatched], centroids['vocabulary'], centroids['idf'])
+        similarity = (vectors @ centroids['matrix'].T).toarray()
+        for row, i in enumerate(unmatched):
+            position = similarity[row].argmax()
+            if similarity[row, position] >= MIN_HISTORY_SIMILARITY:
+                topics[i] = centroids['names'][position]
+
+    return topics
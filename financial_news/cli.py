@@ -0,0 +1,161 @@
+"""
+Feed tools on one shared fetch engine
+
+    python -m financial_news.cli validate test run
+    python -m financial_news.cli --max-age 0 test
+    python -m financial_news.cli discover --refresh
+
+Commands run in the order given. A feed downloaded by one command is
+reused by the next, and by later invocations within --max-age minutes
+(through feed_cache.json). Options after a command belong to it; run
+takes the aggregator's options (python telegram_aggregator.py -h). A
+command name given as an option's value (validate --profile test) is
+that value, not a command.
+"""
+import argparse
+import socket
+import sys
+
+from .feed_cache import FEED_CACHE_MAX_AGE_MINUTES
+from .fetch_engine import new_engine, save_engine, usable_feeds
+
+# ============================================
+# CONFIGURATION
+# ============================================
+FETCH_TIMEOUT = 10  # Seconds, as the standalone feed scripts used
+COMMANDS = ('validate', 'test', 'check', 'discover', 'run')
+
+# ============================================
+# ARGUMENTS
+# ============================================
+def build_parsers():
+    parser = argparse.ArgumentParser(
+        prog='python -m financial_news.cli', description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        usage='%(prog)s [--max-age MINUTES] COMMAND [options] [COMMAND [options] ...]'
+    )
+    parser.add_argument('--max-age', type=int, default=FEED_CACHE_MAX_AGE_MINUTES, metavar='MINUTES',
+                        help='Reuse feeds downloaded within MINUTES (default: 30, 0 = download everything)')
+
+    commands = {
+        'validate': argparse.ArgumentParser(prog='validate', description='Validate feeds_master.txt, '
+                                            'discover feeds and regenerate feeds.txt'),
+        'test': argparse.ArgumentParser(prog='test', description='Test feeds.txt, write feeds_cleaned.txt'),
+        'check': argparse.ArgumentParser(prog='check', description='Show feeds.txt age and its BS feeds'),
+        'discover': argparse.ArgumentParser(prog='discover', description='Probe candidate feed URLs, '
+                                            'write feeds_discovered.txt')
+    }
+    commands['validate'].add_argument('--profile', metavar='DIR',
+                                      help='Profile validation and discovery (cProfile + tracemalloc) and write the results to DIR')
+    commands['validate'].add_argument('--full', action='store_true',
+                                      help='Revalidate every feed, ignoring the health history (reliable feeds and backoff)')
+    commands['validate'].add_argument('--no-stream', action='store_true',
+                                      help='Download discovery probes in full instead of stopping early')
+    commands['discover'].add_argument('--refresh', action='store_true',
+                                      help='Probe every candidate again, ignoring the probe cache')
+
+    from .pipeline import build_parser
+    commands['run'] = build_parser()
+    return parser, commands
+
+def option_values(parser):
+    """
+    {option string: number of values it takes} of an argparse parser.
+    Options with a variable number ('?', '*', '+') count as taking none:
+    a command name after them starts the next command.
+    """
+    values = {}
+    for action in parser._actions:
+        count = 1 if action.nargs is None else action.nargs if isinstance(action.nargs, int) else 0
+        for option in action.option_strings:
+            values[option] = count
+    return values
+
+def value_count(values, arg):
+    """Values taken by option arg (argparse also accepts unique prefixes; --opt=value takes none)"""
+    if not arg.startswith('-') or '=' in arg:
+        return 0
+    if arg in values:
+        return values[arg]
+    matches = [option for option in values if option.startswith(arg)]
+    return values[matches[0]] if len(matches) == 1 else 0
+
+def split_commands(argv, parser, command_parsers):
+    """['--max-age', '5', 'validate', '--full', 'run'] -> (['--max-age', '5'], [('validate', ['--full']), ('run', [])])"""
+    global_argv = []
+    chain = []
+    values = option_values(parser)
+    skip = 0
+    for arg in argv:
+        if skip:
+            skip -= 1  # An option's value, even if it is a command name
+        elif arg in COMMANDS:
+            chain.append((arg, []))
+            values = option_values(command_parsers[arg])
+            continue
+        else:
+            skip = value_count(values, arg)
+        (chain[-1][1] if chain else global_argv).append(arg)
+    return global_argv, chain
+
+# ============================================
+# COMMANDS
+# ============================================
+def run_command(engine, command, args, later):
+    """args: parsed options (argv list for run); later: commands still to come"""
+    if command == 'validate':
+        from .feed_validate import run_validate
+        # Early-exit probes are partial downloads: no use to test / run
+        stream = not args.no_stream and not ({'test', 'run'} & set(later))
+        return run_validate(engine, args.full, args.profile, stream)
+    if command == 'test':
+        from .feed_test import run_test
+        return run_test(engine)
+    if command == 'check':
+        from .feed_check import run_check
+        return run_check()
+    if command == 'discover':
+        from .feed_discover import run_discover
+        return run_discover(engine, args.refresh)
+
+    from .pipeline import main as run_aggregator
+    # The aggregator exits on its own for some modes and errors (--resume, no feeds):
+    # the exit status ends the chain, but the engine is still saved
+    try:
+        run_aggregator(args, feed_cache=usable_feeds(engine))
+    except SystemExit as e:
+        return e.code if isinstance(e.code, int) else int(e.code is not None)
+    return 0
+
+def main(argv=None):
+    parser, command_parsers = build_parsers()
+    global_argv, chain = split_commands(sys.argv[1:] if argv is None else argv, parser, command_parsers)
+    options = parser.parse_args(global_argv)
+    if not chain:
+        parser.print_help()
+        return 2
+
+    # Parse every command's options before anything runs (run re-parses its argv itself)
+    from .pipeline import parse_args as parse_run_args
+    for command, args in chain:
+        if command == 'run':
+            parse_run_args(args)
+    chain = [(command, args if command == 'run' else command_parsers[command].parse_args(args))
+             for command, args in chain]
+
+    socket.setdefaulttimeout(FETCH_TIMEOUT)
+    engine = new_engine(options.max_age)
+
+    status = 0
+    for i, (command, args) in enumerate(chain):
+        status = run_command(engine, command, args, [c for c, _ in chain[i + 1:]])
+        save_engine(engine)
+        if status:
+            break
+
+    stats = engine['stats']
+    print(f"\n♻️  Fetch engine: {stats['downloaded']} feeds downloaded, {stats['reused']} reused")
+    return status
+
+if __name__ == '__main__':
+    sys.exit(main())
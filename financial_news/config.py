@@ -0,0 +1,176 @@
+import os
+
+from .profiles import default_profile, parse_recipient_line
+
+# ============================================
+# CONFIGURATION
+# ============================================
+MIN_ARTICLES_FOR_TRENDING = 50
+MAX_TRENDING_TOPICS = 10  # Show top 10 trending topics
+MESSAGE_CHAR_LIMIT = 3800  # Increased from 2500 to fit more per message
+TIME_WINDOW_HOURS = 24  # 24 hours = 1 day of news
+DIGEST_TIMES_UTC = ['01:00']  # Daemon mode - matches the daily-news cron
+SOCKET_TIMEOUT = 10  # Global timeout for all network operations
+FETCH_WORKERS = 8  # Feeds downloaded at once while earlier feeds are processed
+FETCH_AHEAD = 16  # Feeds fetched ahead of processing at most (parsed feeds held in memory)
+MAX_FEED_ENTRIES = 100  # Entries downloaded and parsed per feed - filter_entries() never reads further
+
+# ============================================
+# LOAD RECIPIENTS from recipients.txt
+# ============================================
+def read_recipient_entries():
+    """
+    Parse recipients.txt as (chat_id, profile) lines
+    The chat id 'TELEGRAM_CHAT_ID' stands for the recipient from the secret
+    """
+    entries = []
+    
+    try:
+        with open('recipients.txt', 'r') as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith('#'):
+                    continue
+                entries.append(parse_recipient_line(line))
+        return entries
+    except FileNotFoundError:
+        print('⚠ recipients.txt not found')
+        return entries
+    except Exception as e:
+        print('⚠ Error loading recipients: ' + str(e))
+        return entries
+
+def resolve_recipients(entries, chat):
+    """Merge the primary recipient from the secret into the recipients.txt entries"""
+    recipients = []
+    
+    if chat:
+        recipients.append((chat, default_profile()))
+        print('✓ Added primary recipient from secret')
+    
+    for chat_id, profile in entries:
+        # Profile for the primary recipient from secret
+        if chat_id == 'TELEGRAM_CHAT_ID':
+            if chat:
+                recipients[0] = (chat, profile)
+            continue
+        
+        recipients.append((chat_id, profile))
+    
+    customized = sum(1 for _, profile in recipients if profile != default_profile())
+    print('✓ Loaded ' + str(len(recipients)) + ' total recipients (' + str(customized) + ' with custom profiles)')
+    return recipients
+
+def load_recipients():
+    """Load recipients as (chat_id, profile) from recipients.txt file"""
+    return resolve_recipients(read_recipient_entries(), os.getenv('TELEGRAM_CHAT_ID'))
+
+# ============================================
+# LOAD KEYWORDS from keywords.txt
+# ============================================
+def load_keywords():
+    """Load keywords from keywords.txt file"""
+    keywords = []
+    
+    try:
+        with open('keywords.txt', 'r') as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith('#'):
+                    continue
+                keywords.append(line.lower())
+        print('✓ Loaded ' + str(len(keywords)) + ' keywords')
+        return keywords
+    except FileNotFoundError:
+        print('⚠ keywords.txt not found - using minimal defaults')
+        return ['bank', 'banking', 'finance', 'insurance', 'market', 'economy']
+    except Exception as e:
+        print('⚠ Error loading keywords: ' + str(e))
+        return ['bank', 'banking', 'finance', 'insurance', 'market', 'economy']
+
+# ============================================
+# LOAD FEEDS from feeds.txt
+# ============================================
+def load_feeds():
+    """Load RSS feeds from feeds.txt file with acronyms"""
+    feeds = {}
+    
+    try:
+        with open('feeds.txt', 'r') as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith('#'):
+                    continue
+                
+                if '|' in line:
+                    parts = line.split('|')
+                    
+                    if len(parts) == 3:
+                        feed_name = parts[0].strip()
+                        acronym = parts[1].strip()
+                        url = parts[2].strip()
+                        feeds[feed_name] = {'url': url, 'acronym': acronym}
+                    elif len(parts) == 2:
+                        feed_name = parts[0].strip()
+                        url = parts[1].strip()
+                        acronym = feed_name.split(' ')[0] if ' ' in feed_name else feed_name
+                        feeds[feed_name] = {'url': url, 'acronym': acronym}
+        
+        print('✓ Loaded ' + str(len(feeds)) + ' RSS feeds')
+        return feeds
+    except FileNotFoundError:
+        print('⚠ feeds.txt not found')
+        return {}
+    except Exception as e:
+        print('⚠ Error loading feeds: ' + str(e))
+        return {}
+
+# ============================================
+# LOAD TOPICS from topics.txt
+# ============================================
+def load_topics():
+    """Load topic categorization from topics.txt file"""
+    topics = []
+    
+    try:
+        with open('topics.txt', 'r') as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith('#'):
+                    continue
+                
+                if '|' in line:
+                    parts = line.split('|', 1)
+                    if len(parts) == 2:
+                        topic_name = parts[0].strip()
+                        keywords_str = parts[1].strip()
+                        keywords = [kw.strip().lower() for kw in keywords_str.split(',')]
+                        
+                        topics.append({
+                            'name': topic_name,
+                            'keywords': keywords
+                        })
+        
+        print('✓ Loaded ' + str(len(topics)) + ' topic categories')
+        return topics
+    except FileNotFoundError:
+        print('⚠ topics.txt not found - using minimal defaults')
+        return [
+            {'name': 'BANKING & FINANCE', 'keywords': ['bank', 'banking', 'loan', 'credit']},
+            {'name': 'OTHER NEWS', 'keywords': ['other', 'news']}
+        ]
+    except Exception as e:
+        print('⚠ Error loading topics: ' + str(e))
+        return [{'name': 'OTHER NEWS', 'keywords': ['other', 'news']}]
+
+# ============================================
+# LOAD EVERYTHING
+# ============================================
+def load_config():
+    """Load recipients, keywords, feeds and topics"""
+    return {
+        'recipients': load_recipients(),
+        'keywords': load_keywords(),
+        'feeds': load_feeds(),
+        'topics': load_topics()
+    }
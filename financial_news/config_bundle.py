@@ -0,0 +1,194 @@
+import hashlib
+import os
+import pickle
+import re
+
+from .config import load_keywords, load_feeds, load_topics, read_recipient_entries, resolve_recipients
+from .dedup import ALL_ENTITIES, entity_index, entity_matcher
+
+# ============================================
+# CONFIGURATION
+# ============================================
+CONFIG_FILES = ('keywords.txt', 'topics.txt', 'feeds.txt', 'recipients.txt')
+BUNDLE_CACHE_PATH = 'config_cache.pkl'
+BUNDLE_VERSION = 2  # Bump when compile_bundle() output changes
+
+# ============================================
+# COMPILED CONFIG BUNDLE
+# ============================================
+# {
+#   'fingerprint': sha256 of BUNDLE_VERSION + the four config files + the dedup entities,
+#   'mtimes': {path: st_mtime_ns or None} when loaded,
+#   'keywords', 'feeds', 'topics': as returned by the config loaders,
+#   'recipient_entries': read_recipient_entries(),
+#   'recipients': resolve_recipients() (never written to the cache),
+#   'keyword_pattern': regex source of the keyword automaton,
+#   'keyword_matcher': compiled keyword_pattern,
+#   'topic_index': see build_topic_index(),
+#   'topic_matcher': compiled topic_index['prefilter'],
+#   'entity_index': dedup.entity_index() of the dedup entity dictionary,
+#   'entity_matcher': dedup.entity_matcher() of entity_index,
+#   'problems': validation warnings
+# }
+
+def config_fingerprint(paths=CONFIG_FILES):
+    """Hash of the config file contents (missing files hash as missing)"""
+    digest = hashlib.sha256(str(BUNDLE_VERSION).encode())
+    digest.update('\n'.join(ALL_ENTITIES).encode() + b'\0')  # Compiled into the bundle too
+    for path in paths:
+        digest.update(path.encode() + b'\0')
+        try:
+            with open(path, 'rb') as f:
+                digest.update(f.read())
+        except OSError:
+            digest.update(b'<missing>')
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+def config_mtimes(paths=CONFIG_FILES):
+    mtimes = {}
+    for path in paths:
+        try:
+            mtimes[path] = os.stat(path).st_mtime_ns
+        except OSError:
+            mtimes[path] = None
+    return mtimes
+
+def keyword_automaton(keywords):
+    """
+    Regex source matching any of the keywords, built as a character trie
+    so the regex engine walks shared prefixes once per text position.
+    search() is equivalent to any(kw in text for kw in keywords)
+    """
+    trie = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[''] = True
+
+    def build(node):
+        # A keyword ends here - any longer keyword through this node matches it too
+        if '' in node:
+            return ''
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items())]
+        return branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+
+    if not trie:
+        return '(?!)'  # Matches nothing
+    return build(trie)
+
+def build_topic_index(topics):
+    """
+    Every distinct topic keyword once, with the topics it scores for
+    Returns: {'names': [topic name], 'keywords': [(keyword, (topic positions))],
+              'prefilter': regex source matching any topic keyword}
+    """
+    index = {}
+    for position, topic in enumerate(topics):
+        for keyword in topic['keywords']:
+            index.setdefault(keyword, []).append(position)
+
+    return {
+        'names': [topic['name'] for topic in topics],
+        'keywords': [(keyword, tuple(positions)) for keyword, positions in index.items()],
+        'prefilter': keyword_automaton(index)
+    }
+
+def validate_config(bundle):
+    """Returns: list of problems found in the loaded config"""
+    problems = []
+
+    if not bundle['keywords']:
+        problems.append('keywords.txt: no keywords - no article will be relevant')
+
+    for feed_name, feed_info in bundle['feeds'].items():
+        if not feed_info['url'].startswith(('http://', 'https://')):
+            problems.append(f"feeds.txt: {feed_name} has no http(s) URL: {feed_info['url']}")
+        if not feed_info['acronym']:
+            problems.append(f'feeds.txt: {feed_name} has an empty acronym')
+
+    seen_names = set()
+    for topic in bundle['topics']:
+        if topic['name'] in seen_names:
+            problems.append(f"topics.txt: {topic['name']} is listed twice")
+        seen_names.add(topic['name'])
+        if '' in topic['keywords']:
+            problems.append(f"topics.txt: {topic['name']} has an empty keyword - it matches every article")
+
+    topic_names = {name.upper() for name in seen_names}
+    for chat_id, profile in bundle['recipient_entries']:
+        for topic in profile['topics'] or ():
+            if topic not in topic_names:
+                problems.append(f'recipients.txt: {chat_id} subscribes to unknown topic {topic}')
+
+    return problems
+
+def compile_bundle():
+    """Parse, validate and compile the config files"""
+    bundle = {
+        'keywords': load_keywords(),
+        'feeds': load_feeds(),
+        'topics': load_topics(),
+        'recipient_entries': read_recipient_entries()
+    }
+    bundle['keyword_pattern'] = keyword_automaton(bundle['keywords'])
+    bundle['topic_index'] = build_topic_index(bundle['topics'])
+    bundle['entity_index'] = entity_index()
+    bundle['problems'] = validate_config(bundle)
+    return bundle
+
+def read_bundle_cache(fingerprint, path=BUNDLE_CACHE_PATH):
+    try:
+        with open(path, 'rb') as f:
+            cached = pickle.load(f)
+        if cached.get('fingerprint') == fingerprint:
+            return cached
+    except Exception:
+        pass
+    return None
+
+def write_bundle_cache(bundle, path=BUNDLE_CACHE_PATH):
+    cached = {k: v for k, v in bundle.items() if k not in ('recipients', 'keyword_matcher', 'topic_matcher', 'entity_matcher', 'mtimes')}
+    try:
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(cached, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print('⚠ Could not write config cache: ' + str(e))
+
+def load_bundle(path=BUNDLE_CACHE_PATH):
+    """
+    Compiled config, from the cache when the config files are unchanged
+    Returns: bundle dict (a superset of load_config())
+    """
+    mtimes = config_mtimes()
+    fingerprint = config_fingerprint()
+    bundle = read_bundle_cache(fingerprint, path)
+
+    if bundle:
+        print(f"✓ Loaded compiled config from cache ({len(bundle['feeds'])} feeds, "
+              f"{len(bundle['keywords'])} keywords, {len(bundle['topics'])} topics)")
+    else:
+        bundle = compile_bundle()
+        bundle['fingerprint'] = fingerprint
+        write_bundle_cache(bundle, path)
+
+    for problem in bundle['problems']:
+        print('⚠ ' + problem)
+
+    bundle['mtimes'] = mtimes
+    bundle['keyword_matcher'] = re.compile(bundle['keyword_pattern'])
+    bundle['topic_matcher'] = re.compile(bundle['topic_index']['prefilter'])
+    bundle['entity_matcher'] = entity_matcher(bundle['entity_index'])
+    bundle['recipients'] = resolve_recipients(bundle['recipient_entries'], os.getenv('TELEGRAM_CHAT_ID'))
+    return bundle
+
+def reload_if_changed(bundle):
+    """Hot reload for long-running processes: a new bundle if a config file's mtime changed"""
+    if config_mtimes() == bundle['mtimes']:
+        return bundle
+
+    print('\n🔄 Config files changed - reloading')
+    return load_bundle()
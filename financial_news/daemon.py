@@ -0,0 +1,116 @@
+import time
+
+from .config import TIME_WINDOW_HOURS
+from .config_bundle import reload_if_changed
+from .metrics import new_run_metrics, timed, record_fetch, record_feed_counts, finish_run
+from .poll_schedule import new_schedule, entry_timestamps, record_poll, due_digest_slot
+from .stages import fetch_one, ingest_feed, trend, render, send, print_run_summary
+
+# ============================================
+# DAEMON MODE - adaptive per-feed polling
+# ============================================
+# Counts that add up over the polls between two digests; the other filter
+# stats (total, recent, ...) describe the feed as of its last poll
+ACCUMULATED_COUNTS = ('relevant', 'duplicates')
+
+def add_poll_stats(digest_stats, feed_name, stats):
+    """Fold one poll's filter stats into the stats since the last digest"""
+    previous = digest_stats.get(feed_name)
+    digest_stats[feed_name] = dict(stats)
+    if previous:
+        for count in ACCUMULATED_COUNTS:
+            digest_stats[feed_name][count] += previous.get(count, 0)
+
+def run_daemon(config, token, digest_times, on_ingest=None, on_digest=None, on_reload=None):
+    """
+    Keep articles in memory, poll every feed on its own schedule and
+    send the digest at each HH:MM (UTC) in digest_times.
+    config is a config bundle; it is reloaded when the config files change.
+    on_ingest({feed_name: feed_info}, {feed_name: stats}, new_articles) is
+    called after every poll, on_digest(metrics) after every digest with the
+    metrics since the previous one, on_reload(config) on every reloaded
+    bundle (settings that are not in the config files, e.g. the topic engine).
+    """
+    articles = []
+    seen_urls = set()
+    first_seen = {}  # url -> when seen_urls got it
+    feed_stats = {}  # Last poll of each feed
+    digest_stats = {}  # Since the last digest (add_poll_stats())
+    schedules = {}
+    last_digest_slot = None
+    metrics = new_run_metrics('daemon')
+
+    print('\n' + '=' * 60)
+    print('DAEMON MODE: polling ' + str(len(config['feeds'])) + ' feeds, digests at ' + ', '.join(digest_times) + ' UTC')
+    print('=' * 60)
+
+    while True:
+        reloaded = reload_if_changed(config)
+        if reloaded is not config and on_reload:
+            on_reload(reloaded)
+        config = reloaded
+        feeds = config['feeds']
+        for feed_name in feeds:
+            schedules.setdefault(feed_name, new_schedule())
+
+        now = time.time()
+
+        for feed_name, feed_info in feeds.items():
+            schedule = schedules[feed_name]
+            if schedule['next_poll'] > now:
+                continue
+
+            result = fetch_one(feed_name, feed_info, schedule['etag'], schedule['modified'])
+            record_fetch(metrics, feed_name, feed_info, result)
+            feed = result['feed']
+
+            if feed is None:
+                record_poll(schedule, None, [], failed=True)
+            elif feed.get('status') == 304:
+                print('  Not modified')
+                record_poll(schedule, feed, [])
+            else:
+                new_articles = ingest_feed(feed_name, feed_info, feed, config, articles, seen_urls, feed_stats, metrics)
+                feed_stats[feed_name]['duration_ms'] = result['duration_ms']
+                if result['error']:
+                    feed_stats[feed_name]['error'] = result['error']
+                record_poll(schedule, feed, entry_timestamps(feed), failed=bool(result['error']))
+                add_poll_stats(digest_stats, feed_name, feed_stats[feed_name])
+
+                if on_ingest:
+                    on_ingest({feed_name: feed_info}, {feed_name: feed_stats[feed_name]}, new_articles)
+
+            print(f"  Next poll in {schedule['interval']:.0f} min")
+
+        # Evict articles that fell out of the window. URLs - duplicates too, so
+        # they are not counted again every poll - are forgotten a window after
+        # they were first seen, when their entry is out of the window as well.
+        cutoff = int(time.time()) - TIME_WINDOW_HOURS * 3600
+        articles[:] = [a for a in articles if a.ts >= cutoff]
+        for url in seen_urls.difference(first_seen):
+            first_seen[url] = now
+        expired_urls = [url for url, seen in first_seen.items() if seen < cutoff]
+        seen_urls.difference_update(expired_urls)
+        for url in expired_urls:
+            del first_seen[url]
+
+        slot = due_digest_slot(digest_times)
+        if slot and slot != last_digest_slot:
+            last_digest_slot = slot
+            print_run_summary(articles, digest_stats, feeds)
+            with timed(metrics, 'trending'):
+                trending_topics = trend(articles)
+            with timed(metrics, 'render'):
+                deliveries = render(config['recipients'], list(articles), trending_topics, config['topics'])
+            with timed(metrics, 'send'):
+                send(deliveries, token)
+
+            record_feed_counts(metrics, digest_stats)
+            finish_run(metrics, len(articles))
+            if on_digest:
+                on_digest(metrics)
+            metrics = new_run_metrics('daemon')
+            digest_stats = {}
+
+        next_wake = min((schedules[feed_name]['next_poll'] for feed_name in feeds), default=now + 60)
+        time.sleep(max(1, min(60, next_wake - time.time())))
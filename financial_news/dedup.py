@@ -0,0 +1,162 @@
+import re
+
+from .categorize_vector import longest_match_pattern
+
+# ============================================
+# ADVANCED DEDUPLICATION - OPTION A
+# ============================================
+
+# Indian banks and financial institutions
+BANKS = (
+    'HDFC', 'ICICI', 'SBI', 'AXIS', 'KOTAK', 'INDUSIND', 'YES BANK', 'IDFC',
+    'PNB', 'BOB', 'BOI', 'CANARA', 'UNION BANK', 'INDIAN BANK',
+    'FEDERAL BANK', 'RBL', 'BANDHAN', 'AU SMALL FINANCE', 'IDBI'
+)
+
+# Insurance companies
+INSURANCE = (
+    'LIC', 'ICICI PRUDENTIAL', 'HDFC LIFE', 'SBI LIFE', 'MAX LIFE',
+    'BAJAJ ALLIANZ', 'RELIANCE GENERAL', 'IFFCO TOKIO', 'TATA AIG'
+)
+
+# Major companies
+COMPANIES = (
+    'RELIANCE', 'TCS', 'INFOSYS', 'WIPRO', 'HCL', 'TATA', 'ADANI',
+    'BHARTI AIRTEL', 'MARUTI', 'MAHINDRA', 'ITC', 'LARSEN', 'L&T',
+    'ASIAN PAINTS', 'ULTRATECH', 'BAJAJ', 'GODREJ', 'VEDANTA',
+    'CIPLA', 'SUN PHARMA', 'DR REDDY', 'DIVIS'
+)
+
+# Regulators and institutions
+INSTITUTIONS = (
+    'RBI', 'SEBI', 'IRDAI', 'NPCI', 'NITI AAYOG', 'FINANCE MINISTRY',
+    'MINISTRY OF FINANCE', 'SUPREME COURT', 'CBDT', 'GST COUNCIL'
+)
+
+# Built once at import instead of on every call
+ALL_ENTITIES = BANKS + INSURANCE + COMPANIES + INSTITUTIONS
+NUMBER_PATTERN = re.compile(r'\d+(?:\.\d+)?%|\d+(?:,\d+)*(?:\.\d+)?')
+
+def entity_index(entities=ALL_ENTITIES):
+    """
+    The entity dictionary compiled for config_bundle: one scan finds the
+    longest entity at every position, and the entities that are prefixes of
+    it ('HDFC' of 'HDFC LIFE') come from 'prefixes'
+    Returns: {'pattern': regex source, 'prefixes': {entity: (entities it starts with)}}
+    """
+    entity_set = set(entities)
+    return {
+        'pattern': '(?=(' + longest_match_pattern(entity_set) + '))',
+        'prefixes': {entity: tuple(entity[:end] for end in range(1, len(entity) + 1) if entity[:end] in entity_set)
+                     for entity in entity_set}
+    }
+
+def entity_matcher(index):
+    """Returns: entity_index() with its pattern compiled, for extract_entities()"""
+    return {'pattern': re.compile(index['pattern']), 'prefixes': index['prefixes']}
+
+def extract_entities(title, matcher=None):
+    """
+    Extract key entities from title (companies, banks, people, organizations)
+    matcher: entity_matcher() - finds the same entities as the dictionary scan
+    Returns set of entity strings
+    """
+    title_upper = title.upper()
+    
+    # Common financial entities
+    if matcher:
+        prefixes = matcher['prefixes']
+        entities = set()
+        for match in matcher['pattern'].finditer(title_upper):
+            entities.update(prefixes[match.group(1)])
+    else:
+        entities = {entity for entity in ALL_ENTITIES if entity in title_upper}
+    
+    # Extract numbers (percentages, amounts)
+    entities.update(NUMBER_PATTERN.findall(title))
+    
+    return entities
+
+def extract_first_n_words(title, n=7):
+    """
+    Extract first N meaningful words from title
+    Removes common stop words
+    """
+    stop_words = {
+        'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+        'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were',
+        'says', 'said', 'after', 'amid', 'over'
+    }
+    
+    # Clean and tokenize
+    text = title.lower()
+    text = re.sub(r'[^\w\s]', ' ', text)
+    words = text.split()
+    
+    # Keep meaningful words
+    meaningful = []
+    for word in words:
+        if word not in stop_words and len(word) > 2:
+            meaningful.append(word)
+        if len(meaningful) >= n:
+            break
+    
+    return set(meaningful)
+
+def article_signature(article, matcher=None):
+    """
+    Dedup signature of an article: (entities, first-7-words)
+    Computed once per article and kept on it as article.signature
+    """
+    if article.signature is None:
+        article.signature = (
+            extract_entities(article.title, matcher),
+            extract_first_n_words(article.title, n=7)
+        )
+    return article.signature
+
+def is_duplicate_advanced(new_article, existing_articles, matcher=None):
+    """
+    Advanced deduplication using:
+    1. Entity matching (same companies/banks mentioned)
+    2. First-N-words matching (similar opening)
+    
+    matcher: entity_matcher() of the config bundle
+    Returns True if duplicate detected
+    """
+    new_entities, new_words = article_signature(new_article, matcher)
+    
+    for existing in existing_articles:
+        existing_entities, existing_words = article_signature(existing, matcher)
+        
+        # Check 1: Entity overlap
+        if new_entities and existing_entities:
+            common_entities = new_entities.intersection(existing_entities)
+            
+            # If they share 2+ entities, likely same story
+            if len(common_entities) >= 2:
+                return True
+            
+            # If they share 1 major entity AND similar words, likely duplicate
+            if len(common_entities) >= 1:
+                word_overlap = len(new_words.intersection(existing_words))
+                total_words = len(new_words.union(existing_words))
+                
+                if total_words > 0:
+                    word_similarity = word_overlap / total_words
+                    if word_similarity >= 0.5:  # 50% word overlap
+                        return True
+        
+        # Check 2: First-7-words matching
+        if new_words and existing_words:
+            word_overlap = len(new_words.intersection(existing_words))
+            total_words = len(new_words.union(existing_words))
+            
+            if total_words > 0:
+                word_similarity = word_overlap / total_words
+                
+                # If 70%+ of first words match, it's a duplicate
+                if word_similarity >= 0.7:
+                    return True
+    
+    return False
@@ -0,0 +1,86 @@
+import json
+from datetime import datetime, timezone
+
+from .article import article_from_dict
+from .metrics import write_atomic
+
+# ============================================
+# CONFIGURATION
+# ============================================
+ARTIFACT_VERSION = 1
+ARTIFACT_PATH = 'digest.jsonl'
+ARTICLE_FIELDS = ('source', 'publication', 'title', 'url', 'ts', 'topic', 'description')
+
+# ============================================
+# DIGEST ARTIFACT
+# ============================================
+# Everything a digest is rendered from, written before it is sent, so
+# re-sends, later editions and message format changes need no fetching
+# or processing. One compact JSON record per line:
+#   {'type': 'digest', 'version': ARTIFACT_VERSION, 'created': ISO UTC time,
+#    'date': YYYY-MM-DD the messages are dated (local, as build_messages()), 'mode': run mode, 'topics': [topic names in topics.txt order],
+#    'fields': ARTICLE_FIELDS, 'articles': count}
+#   {'type': 'trending', 'topic', 'count', 'summary'}      - in rank order
+#   {'type': 'feed', 'name': feed name, 'stats': filter stats}
+#   {'type': 'article', 'row': [values of ARTICLE_FIELDS]} - deduplicated, categorized
+
+def write_artifact(path, articles, trending_topics, topics, feed_stats=None, mode='run', date=None):
+    """date: the digest's date as its messages show it (default: today)"""
+    header = {
+        'type': 'digest',
+        'version': ARTIFACT_VERSION,
+        'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'date': (date or datetime.now()).strftime('%Y-%m-%d'),
+        'mode': mode,
+        'topics': [topic['name'] for topic in topics],
+        'fields': ARTICLE_FIELDS,
+        'articles': len(articles)
+    }
+
+    records = [header]
+    records.extend({'type': 'trending', **trending} for trending in trending_topics)
+    records.extend({'type': 'feed', 'name': name, 'stats': stats} for name, stats in (feed_stats or {}).items())
+    records.extend({'type': 'article', 'row': [getattr(article, field) for field in ARTICLE_FIELDS]}
+                   for article in articles)
+
+    write_atomic(path, ''.join(json.dumps(record, separators=(',', ':')) + '\n' for record in records))
+    print(f'💾 Digest artifact: {len(articles)} articles, {len(trending_topics)} trending topics written to {path}')
+
+def load_artifact(path):
+    """
+    Read a write_artifact() file
+    Returns: {'created': datetime, 'date': digest date (datetime), 'mode', 'topics': [{'name'}], 'articles': [Article],
+              'trending': [trending topic], 'feed_stats': {feed_name: stats}}
+    Raises: ValueError if the file is not a version ARTIFACT_VERSION digest artifact
+    """
+    with open(path, 'r') as f:
+        lines = [line for line in f if line.strip()]
+
+    header = json.loads(lines[0]) if lines else {}
+    if header.get('type') != 'digest' or header.get('version') != ARTIFACT_VERSION:
+        raise ValueError(f'{path} is not a version {ARTIFACT_VERSION} digest artifact')
+
+    fields = header['fields']
+    artifact = {
+        'created': datetime.fromisoformat(header['created']),
+        # Artifacts written before the date was recorded: their UTC creation date
+        'date': datetime.strptime(header.get('date') or header['created'][:10], '%Y-%m-%d'),
+        'mode': header['mode'],
+        'topics': [{'name': name} for name in header['topics']],
+        'articles': [],
+        'trending': [],
+        'feed_stats': {}
+    }
+    for line in lines[1:]:
+        record = json.loads(line)
+        kind = record.pop('type')
+        if kind == 'article':
+            artifact['articles'].append(article_from_dict(dict(zip(fields, record['row']))))
+        elif kind == 'trending':
+            artifact['trending'].append(record)
+        elif kind == 'feed':
+            artifact['feed_stats'][record['name']] = record['stats']
+
+    if len(artifact['articles']) != header['articles']:
+        raise ValueError(f"{path} is incomplete: {len(artifact['articles'])} of {header['articles']} articles")
+    return artifact
@@ -0,0 +1,89 @@
+import json
+import os
+import time
+from collections import Counter
+
+from .article import article_to_dict, article_from_dict
+
+# ============================================
+# CONFIGURATION
+# ============================================
+STATE_PATH = 'digest_state.json'
+STATE_VERSION = 2
+
+# ============================================
+# PROCESSED-ARTICLE STATE BETWEEN RUNS
+# ============================================
+# {
+#   'version': STATE_VERSION,
+#   'high_water': {feed_url: newest published epoch processed},
+#   'last_digest': ISO time of the last digest sent,
+#   'articles': [article_to_dict() of every processed article],
+#   'trend_counts': {'bigrams': {...}, 'trigrams': {...}}
+# }
+
+def empty_state():
+    """State of a first run"""
+    return {
+        'version': STATE_VERSION,
+        'high_water': {},
+        'last_digest': None,
+        'articles': [],
+        'trend_counts': None
+    }
+
+def load_state(path=STATE_PATH):
+    """Load the previous run's state (empty state if missing or incompatible)"""
+    try:
+        with open(path, 'r') as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        print('⚠ No previous state - processing everything')
+        return empty_state()
+    except Exception as e:
+        print('⚠ Error loading state: ' + str(e) + ' - processing everything')
+        return empty_state()
+
+    if data.get('version') != STATE_VERSION:
+        print('⚠ State version changed - processing everything')
+        return empty_state()
+
+    state = empty_state()
+    state['high_water'] = data.get('high_water', {})
+    state['last_digest'] = data.get('last_digest')
+    state['articles'] = [article_from_dict(a) for a in data.get('articles', [])]
+
+    if data.get('trend_counts'):
+        state['trend_counts'] = {
+            'bigrams': Counter(data['trend_counts'].get('bigrams', {})),
+            'trigrams': Counter(data['trend_counts'].get('trigrams', {}))
+        }
+
+    print('✓ Loaded state: ' + str(len(state['articles'])) + ' processed articles, '
+          + str(len(state['high_water'])) + ' feed high-water marks')
+    return state
+
+def save_state(state, path=STATE_PATH):
+    """Write state atomically"""
+    data = {
+        'version': STATE_VERSION,
+        'high_water': state['high_water'],
+        'last_digest': state['last_digest'],
+        'articles': [article_to_dict(a) for a in state['articles']],
+        'trend_counts': {
+            'bigrams': dict(state['trend_counts']['bigrams']),
+            'trigrams': dict(state['trend_counts']['trigrams'])
+        } if state['trend_counts'] else None
+    }
+
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f)
+    os.replace(tmp_path, path)
+
+def split_expired(articles, hours, now=None):
+    """Split articles into (kept, expired) by the time window ending at now (UTC epoch, default: current time)"""
+    cutoff = (now or int(time.time())) - hours * 3600
+    kept = [a for a in articles if a.ts >= cutoff]
+    expired = [a for a in articles if a.ts < cutoff]
+    return kept, expired
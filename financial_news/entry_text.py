@@ -0,0 +1,51 @@
+import html
+import re
+
+# ============================================
+# CONFIGURATION
+# ============================================
+MAX_DESCRIPTION_CHARS = 1000  # Cleaned description text searched for keywords and topics
+MAX_RAW_CHARS = 20000  # Raw summary HTML looked at (some publishers embed whole pages)
+
+# ============================================
+# DESCRIPTION NORMALIZATION
+# ============================================
+# RSS summaries are often HTML - images, tables, embedded widgets - while
+# only their text matters for keyword relevance and topics. The text is
+# taken with regexes (no BeautifulSoup): scripts, styles and comments are
+# dropped with their content, other tags become spaces, entities are
+# decoded and whitespace is collapsed. Only a bounded prefix of the raw
+# HTML is read and only MAX_DESCRIPTION_CHARS of text are kept, so a huge
+# summary costs no more than a normal one.
+
+BLOCK_PATTERN = re.compile(r'<(script|style)\b.*?</\1\s*>|<!--.*?-->', re.IGNORECASE | re.DOTALL)
+TAG_PATTERN = re.compile(r'<[^>]*>')
+OPEN_TAG_PATTERN = re.compile(r'<[^>]*$')  # A tag cut off by MAX_RAW_CHARS
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+def clean_description(description, limit=MAX_DESCRIPTION_CHARS):
+    """Plain-text prefix (at most limit chars) of an RSS summary that may be HTML"""
+    text = str(description or '')
+    if '<' not in text and '&' not in text:
+        return WHITESPACE_PATTERN.sub(' ', text[:limit * 2]).strip()[:limit]
+
+    text = text[:MAX_RAW_CHARS]
+    if '<' in text:
+        text = BLOCK_PATTERN.sub(' ', text)
+        text = OPEN_TAG_PATTERN.sub('', TAG_PATTERN.sub(' ', text))
+    if '&' in text:
+        text = html.unescape(text)
+    return WHITESPACE_PATTERN.sub(' ', text).strip()[:limit]
+
+def entry_is_relevant(title, description, keyword_matcher):
+    """
+    Keyword relevance of an entry, title first: the description is only
+    cleaned and searched when the title has no keyword. Only a caller that
+    keeps no text (the validator) saves the cleaning; the pipeline cleans
+    every relevant description for categorize() either way
+    Returns: (relevant, cleaned description or None if it was not cleaned)
+    """
+    if keyword_matcher.search(title.lower()):
+        return True, None
+    cleaned = clean_description(description)
+    return keyword_matcher.search((title + ' ' + cleaned).lower()) is not None, cleaned
@@ -0,0 +1,50 @@
+import hashlib
+import json
+import os
+import time
+
+# ============================================
+# RECORD / REPLAY OF FEED RESPONSES
+# ============================================
+# --record DIR keeps every feed response, --replay DIR answers fetches
+# from it without touching the network, so a run (and its profile) can
+# be repeated exactly:
+#   DIR/<sha1 of url>.json   {'url', 'status', 'headers', 'recorded_at'}
+#   DIR/<sha1 of url>.body   body bytes as received (after gzip decoding)
+#
+# archive is {'mode': 'record' or 'replay', 'dir': DIR}
+
+def archive_paths(archive_dir, url):
+    key = hashlib.sha1(url.encode()).hexdigest()
+    return os.path.join(archive_dir, key + '.json'), os.path.join(archive_dir, key + '.body')
+
+def record_response(archive_dir, url, response):
+    """Save a timed_get() response for url"""
+    os.makedirs(archive_dir, exist_ok=True)
+    meta_path, body_path = archive_paths(archive_dir, url)
+
+    with open(body_path, 'wb') as f:
+        f.write(response['body'])
+    with open(meta_path, 'w') as f:
+        json.dump({
+            'url': response['url'],
+            'status': response['status'],
+            'headers': response['headers'],
+            'recorded_at': time.time()
+        }, f, indent=1)
+
+def replay_response(archive_dir, url):
+    """The recorded response for url, shaped like timed_get() with zero timings"""
+    meta_path, body_path = archive_paths(archive_dir, url)
+
+    try:
+        with open(meta_path, 'r') as f:
+            meta = json.load(f)
+        with open(body_path, 'rb') as f:
+            body = f.read()
+    except FileNotFoundError:
+        raise OSError('not in replay archive: ' + url)
+
+    meta['body'] = body
+    meta['timings'] = {'dns_ms': 0.0, 'connect_ms': 0.0, 'ttfb_ms': 0.0, 'total_ms': 0.0, 'bytes': len(body)}
+    return meta
@@ -0,0 +1,83 @@
+import json
+import os
+import time
+
+from .entry_text import clean_description
+
+# ============================================
+# CONFIGURATION
+# ============================================
+FEED_CACHE_PATH = 'feed_cache.json'
+FEED_CACHE_MAX_AGE_MINUTES = 30  # The daily workflow runs the aggregator right after the validator
+MAX_CACHED_ENTRIES = 100  # filter_entries() never looks further
+
+# ============================================
+# PARSED-FEED CACHE (validator -> aggregator)
+# ============================================
+# The validator downloads and parses every feed minutes before the
+# aggregator does the same. It leaves the parsed feeds here:
+# {
+#   feed_url: {
+#     'fetched_at': epoch, 'status', 'etag', 'modified', 'timings',
+#     'entries': [{'title', 'link', 'summary' (text, see entry_text), 'published_parsed': [9 ints] or None}]
+#   }
+# }
+
+def compact_feed(feed, timings=None):
+    """The parts of a parsed feed the aggregator reads"""
+    entries = []
+    for entry in feed.entries[:MAX_CACHED_ENTRIES]:
+        published = entry.get('published_parsed')
+        entries.append({
+            'title': entry.get('title', ''),
+            'link': entry.get('link', ''),
+            'summary': clean_description(entry.get('summary', '') or entry.get('description', '')),
+            'published_parsed': list(published) if published else None
+        })
+
+    return {
+        'fetched_at': time.time(),
+        'status': feed.get('status'),
+        'etag': feed.get('etag'),
+        'modified': feed.get('modified'),
+        'timings': timings,
+        'entries': entries
+    }
+
+def write_feed_cache(feeds_by_url, path=FEED_CACHE_PATH):
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(feeds_by_url, f)
+    os.replace(tmp_path, path)
+
+def load_feed_cache(max_age_minutes=FEED_CACHE_MAX_AGE_MINUTES, path=FEED_CACHE_PATH):
+    """Cached feeds fetched within max_age_minutes: {url: compact feed}"""
+    if not max_age_minutes:
+        return {}
+
+    try:
+        with open(path, 'r') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+    oldest = time.time() - max_age_minutes * 60
+    return {url: feed for url, feed in cached.items() if feed.get('fetched_at', 0) >= oldest}
+
+def cached_feed(compact):
+    """A feedparser-style result from a compact feed (entries support .attr and .get())"""
+    import feedparser
+
+    entries = []
+    for entry in compact['entries']:
+        entry = dict(entry)
+        if entry['published_parsed']:
+            entry['published_parsed'] = time.struct_time(entry['published_parsed'])
+        else:
+            del entry['published_parsed']
+        entries.append(feedparser.FeedParserDict(entry))
+
+    return feedparser.FeedParserDict(
+        bozo=False, entries=entries, feed=feedparser.FeedParserDict(),
+        status=compact['status'], etag=compact['etag'], modified=compact['modified']
+    )
@@ -0,0 +1,316 @@
+import calendar
+import socket
+import time
+from datetime import datetime
+
+from .fetch_engine import get_feed, get_feeds
+from .probe_cache import PROBE_CACHE_PATH, load_probe_cache, save_probe_cache, fresh_probe, store_probe
+
+# ============================================
+# DISCOVER FEEDS (cli: discover)
+# ============================================
+# Probes every base_url + pattern candidate below (through the shared
+# engine, concurrently) and writes the ones with recent entries to
+# feeds_discovered.txt. Probe results are cached by outcome (see
+# probe_cache), so a re-run only touches new or expired candidates.
+
+DISCOVERED_FEEDS_PATH = 'feeds_discovered.txt'
+
+# Define publications and their potential feed URLs to test
+PUBLICATIONS = {
+    'Economic Times': {
+        'base_url': 'https://economictimes.indiatimes.com',
+        'patterns': [
+            '/markets/rssfeeds/1977021501.cms',
+            '/industry/banking/finance/banking/rssfeeds/13358256.cms',
+            '/industry/banking/finance/rssfeeds/13358259.cms',
+            '/industry/banking/finance/insure/rssfeeds/13358276.cms',
+            '/markets/stocks/rssfeeds/2146842.cms',
+            '/news/economy/rssfeeds/1373380680.cms',
+            '/wealth/rssfeeds/837555174.cms',
+            '/tech/rssfeeds/13357270.cms',
+            '/small-biz/rssfeeds/11324812.cms',
+            '/jobs/rssfeeds/107115618.cms',
+            '/industry/telecom/rssfeeds/13357555.cms',
+            '/industry/energy/rssfeeds/13358225.cms',
+            '/industry/healthcare/biotech/rssfeeds/13358080.cms',
+        ]
+    },
+    
+    'LiveMint': {
+        'base_url': 'https://www.livemint.com/rss',
+        'patterns': [
+            '/markets',
+            '/money',
+            '/industry/banking',
+            '/insurance',
+            '/companies',
+            '/news/india',
+            '/technology',
+            '/industry',
+            '/opinion',
+            '/politics',
+            '/ai',
+            '/mutual-fund',
+            '/personal-finance',
+            '/budget',
+            '/premium',
+            '/news/world',
+            '/elections',
+            '/economy',
+            '/auto-news',
+            '/education',
+            '/sports',
+            '/latest-news',
+            '/homepage',
+        ]
+    },
+    
+    'Financial Times': {
+        'base_url': 'https://www.ft.com',
+        'patterns': [
+            '/markets?format=rss',
+            '/companies/financials?format=rss',
+            '/world/economy?format=rss',
+            '/companies?format=rss',
+            '/india?format=rss',
+            '/markets/asia-pacific?format=rss',
+            '/technology?format=rss',
+            '/equities?format=rss',
+            '/currencies?format=rss',
+            '/commodities?format=rss',
+            '/opinion?format=rss',
+            '/lex?format=rss',
+            '/world/uk?format=rss',
+            '/world/us?format=rss',
+            '/climate-capital?format=rss',
+            '/cryptocurrencies?format=rss',
+            '/energy?format=rss',
+        ]
+    },
+    
+    'Wall Street Journal': {
+        'base_url': 'https://feeds.content.dowjones.io/public/rss',
+        'patterns': [
+            '/RSSMarketsMain',
+            '/WSJcomUSBusiness',
+            '/RSSWorldNews',
+            '/WSJcomIndia',
+            '/WSJcomAsia',
+            '/WSJcomTech',
+            '/WSJcomOpinion',
+            '/RSSWSJD',
+            '/RSSLifestyle',
+        ]
+    },
+    
+    'Business Standard': {
+        'base_url': 'https://www.business-standard.com/rss',
+        'patterns': [
+            '/finance-bs-banking-finance-101.rss',
+            '/markets-106.rss',
+            '/economy-policy-102.rss',
+            '/companies-101.rss',
+            '/finance-bs-insurance-103.rss',
+            '/finance-news-101.rss',
+            '/technology-108.rss',
+            '/international-109.rss',
+            '/opinion-103.rss',
+            '/current-affairs-news-114.rss',
+        ]
+    },
+    
+    'MoneyControl': {
+        'base_url': 'https://www.moneycontrol.com/rss',
+        'patterns': [
+            '/marketreports.xml',
+            '/latestnews.xml',
+            '/mutualfunds.xml',
+            '/business.xml',
+            '/stocksexpertsviews.xml',
+            '/technicals.xml',
+            '/MCNews.xml',
+            '/commodities.xml',
+            '/IPO.xml',
+            '/forex.xml',
+        ]
+    },
+    
+    'New York Times': {
+        'base_url': 'https://rss.nytimes.com/services/xml/rss/nyt',
+        'patterns': [
+            '/Business.xml',
+            '/Economy.xml',
+            '/DealBook.xml',
+            '/YourMoney.xml',
+            '/Technology.xml',
+            '/Markets.xml',
+            '/SmallBusiness.xml',
+            '/InternationalBusiness.xml',
+            '/World.xml',
+            '/Politics.xml',
+            '/Science.xml',
+            '/Health.xml',
+            '/Climate.xml',
+        ]
+    },
+    
+    'Reuters': {
+        'base_url': 'https://www.reuters.com/rssfeed',
+        'patterns': [
+            '/businessNews',
+            '/marketsNews',
+            '/financialsNews',
+            '/economyNews',
+            '/technologyNews',
+            '/companyNews',
+        ]
+    },
+    
+    'Bloomberg': {
+        'base_url': 'https://www.bloomberg.com/feed',
+        'patterns': [
+            '/podcast/markets.xml',
+            '/podcast/technology.xml',
+            '/podcast/politics.xml',
+        ]
+    },
+}
+
+def probe(engine, url, now):
+    """
+    Download one candidate and count its recent entries (as of now, UTC epoch)
+    Returns: {'outcome': 'ok' | 'stale' | 'empty' | 'http' | 'error' | 'timeout', 'total', 'recent', 'error'}
+    """
+    try:
+        feed = get_feed(engine, url)
+    except socket.timeout:
+        return {'outcome': 'timeout', 'total': 0, 'recent': 0, 'error': 'Timeout'}
+    except Exception as e:
+        return {'outcome': 'error', 'total': 0, 'recent': 0, 'error': str(e)[:30]}
+    
+    total = len(feed.entries)
+    if total == 0:
+        if feed.get('status', 200) >= 400:
+            return {'outcome': 'http', 'total': 0, 'recent': 0, 'error': f"HTTP {feed['status']}"}
+        return {'outcome': 'empty', 'total': 0, 'recent': 0, 'error': 'No entries'}
+    
+    # Check for recent content
+    recent = 0
+    for entry in feed.entries[:10]:
+        try:
+            if hasattr(entry, 'published_parsed') and entry.published_parsed:
+                if (now - calendar.timegm(entry.published_parsed)) // 86400 <= 7:
+                    recent += 1
+            else:
+                recent += 1
+        except:
+            continue
+    
+    return {'outcome': 'ok' if recent > 0 else 'stale', 'total': total, 'recent': recent, 'error': None}
+
+def run_discover(engine, refresh=False):
+    """refresh=True probes every candidate again, ignoring the probe cache"""
+    print('=' * 70)
+    print('RSS FEED DISCOVERY TOOL')
+    print('=' * 70)
+    
+    print(f'\nTesting {sum(len(p["patterns"]) for p in PUBLICATIONS.values())} potential feed URLs...\n')
+    
+    probe_cache = {} if refresh else load_probe_cache()
+    candidates = [pub_info['base_url'] + pattern for pub_info in PUBLICATIONS.values() for pattern in pub_info['patterns']]
+    results = {url: fresh_probe(probe_cache, url) for url in candidates}
+    to_probe = [url for url, result in results.items() if result is None]
+
+    print(f'Probing {len(to_probe)} new or expired candidates '
+          f'({len(results) - len(to_probe)} cached in {PROBE_CACHE_PATH})...')
+
+    now = int(time.time())
+    for url, result in zip(to_probe, get_feeds(engine, to_probe, lambda url: probe(engine, url, now))):
+        results[url] = result
+        store_probe(probe_cache, url, result)
+    save_probe_cache(probe_cache)
+
+    discovered_feeds = []
+    broken_feeds = []
+
+    for pub_name, pub_info in PUBLICATIONS.items():
+        print(f'\n{"=" * 70}')
+        print(f'{pub_name}')
+        print(f'{"=" * 70}')
+
+        for pattern in pub_info['patterns']:
+            url = pub_info['base_url'] + pattern
+
+            # Extract feed name from pattern
+            feed_name = pattern.split('/')[-1].replace('.rss', '').replace('.xml', '').replace('.cms', '').replace('?format=rss', '')
+
+            result = results[url]
+            cached = ' (cached)' if url not in to_probe else ''
+
+            if result['outcome'] == 'timeout':
+                print(f'⏱️  {feed_name}: Timeout{cached}')
+                broken_feeds.append((pub_name, feed_name, url, 'Timeout'))
+            elif result['outcome'] in ('empty', 'http', 'error'):
+                print(f"❌ {feed_name}: {result['error']}{cached}")
+                broken_feeds.append((pub_name, feed_name, url, result['error']))
+            else:
+                total, recent = result['total'], result['recent']
+                status = '✅' if recent > 0 else '⚠️'
+                print(f'{status} {feed_name}: {total} entries, {recent} recent (7d){cached}')
+
+                if recent > 0:
+                    discovered_feeds.append({
+                        'publication': pub_name,
+                        'name': feed_name,
+                        'url': url,
+                        'total': total,
+                        'recent': recent
+                    })
+
+    # Print summary
+    print('\n' + '=' * 70)
+    print('DISCOVERY SUMMARY')
+    print('=' * 70)
+    print(f'\n✅ WORKING FEEDS DISCOVERED: {len(discovered_feeds)}')
+    print(f'❌ BROKEN/UNAVAILABLE: {len(broken_feeds)}')
+
+    # Generate feeds.txt format
+    print('\n' + '=' * 70)
+    print('SUGGESTED FEEDS TO ADD')
+    print('=' * 70)
+
+    # Group by publication
+    by_pub = {}
+    for feed in discovered_feeds:
+        pub = feed['publication']
+        if pub not in by_pub:
+            by_pub[pub] = []
+        by_pub[pub].append(feed)
+
+    output_content = '# Discovered RSS Feeds\n'
+    output_content += f'# Generated: {datetime.now().strftime("%Y-%m-%d %H:%M")}\n'
+    output_content += f'# Total: {len(discovered_feeds)} working feeds\n\n'
+
+    for pub in sorted(by_pub.keys()):
+        feeds = by_pub[pub]
+        output_content += f'# {pub} - {len(feeds)} feeds\n'
+
+        for feed in feeds:
+            feed_label = f"{pub} {feed['name'].title()}"
+            output_content += f'{feed_label}|{feed["url"]}\n'
+
+        output_content += '\n'
+
+    # Save to file
+    with open(DISCOVERED_FEEDS_PATH, 'w') as f:
+        f.write(output_content)
+
+    print(f'\n✅ Discovered feeds saved to: {DISCOVERED_FEEDS_PATH}')
+    print(f'\nTop feeds by activity:')
+    top_feeds = sorted(discovered_feeds, key=lambda x: x['recent'], reverse=True)[:10]
+    for i, feed in enumerate(top_feeds, 1):
+        print(f"{i}. {feed['publication']} - {feed['name']}: {feed['recent']} recent articles")
+
+    print('\n' + '=' * 70)
+    return 0
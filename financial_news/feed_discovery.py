@@ -0,0 +1,129 @@
+import importlib.util
+import time
+from urllib.parse import urljoin, urlsplit
+
+from .fetch_pool import MAX_WORKERS, run_parallel
+from .http_fetch import timed_get
+
+# ============================================
+# CONFIGURATION
+# ============================================
+MAX_DEPTH = 1  # Links followed from a seed page (0 = seed pages only)
+MAX_PAGES_PER_PUBLICATION = 25
+FEED_TYPES = ('application/rss+xml', 'application/atom+xml', 'application/rdf+xml')
+FEED_SUFFIXES = ('.rss', '.xml', '.atom', '.rdf')
+
+# lxml is much faster when it is installed; html.parser is always there
+HTML_PARSER = 'lxml' if importlib.util.find_spec('lxml') else 'html.parser'
+
+# ============================================
+# RSS AUTODISCOVERY CRAWLER
+# ============================================
+# seeds = {page_url: acronym}, usually publication homepages and RSS
+# listing pages. Every page is read for:
+#   <link rel="alternate" type="application/rss+xml" href="...">   -> feed
+#   <a href="...rss..."> that looks like a feed (.rss/.xml, rssfeeds/, format=rss) -> feed
+#   other <a href="...rss..."> on the same host    -> page, crawled up to MAX_DEPTH
+# Pages that turn out to be XML are feeds. Each depth is fetched
+# concurrently within the host limits.
+#
+# Returns: ({acronym: [{'name': link text, 'url': feed url}]} in discovery order,
+#           {'pages': pages fetched, 'seconds'})
+
+def looks_like_feed(url):
+    parts = urlsplit(url)
+    path = parts.path.lower()
+    return (path.endswith(FEED_SUFFIXES) or 'rssfeeds' in path or path.rstrip('/').endswith('/feed')
+            or 'format=rss' in parts.query.lower())
+
+def is_xml(response):
+    content_type = response['headers'].get('content-type', '').lower()
+    return 'xml' in content_type or response['body'].lstrip()[:5] in (b'<?xml', b'<rss ', b'<feed')
+
+def extract_links(page_url, body):
+    """
+    Feed links and crawlable RSS pages on one HTML page
+    Returns: (feeds [(name, url)], pages [(name, url)])
+    """
+    from bs4 import BeautifulSoup, SoupStrainer
+
+    soup = BeautifulSoup(body, HTML_PARSER, parse_only=SoupStrainer(['a', 'link']))
+    host = urlsplit(page_url).hostname
+    feeds = []
+    pages = []
+
+    for tag in soup.find_all(['a', 'link']):
+        href = (tag.get('href') or '').strip()
+        if not href or href.startswith(('#', 'javascript:', 'mailto:')):
+            continue
+        url = urljoin(page_url, href).split('#')[0]
+
+        if tag.name == 'link':
+            rel = tag.get('rel') or []
+            if 'alternate' in rel and (tag.get('type') or '').lower() in FEED_TYPES:
+                feeds.append((tag.get('title') or '', url))
+            continue
+
+        if 'rss' not in url.lower():
+            continue
+        if looks_like_feed(url) or urlsplit(url).hostname != host:
+            feeds.append((tag.get_text(strip=True), url))
+        else:
+            pages.append((tag.get_text(strip=True), url))
+
+    return feeds, pages
+
+def crawl_feeds(seeds, limits=None, max_depth=MAX_DEPTH, max_pages=MAX_PAGES_PER_PUBLICATION, workers=MAX_WORKERS):
+    """Autodiscover feed URLs from seed pages (see above); workers=1 fetches them on the calling thread"""
+    found = {acronym: [] for acronym in seeds.values()}
+    seen_feeds = set()
+    owner = dict(seeds)
+    page_names = {}
+    pages_left = {acronym: max_pages for acronym in found}  # Beyond the seeds
+    stats = {'pages': 0, 'seconds': 0.0}
+
+    def add_feed(acronym, name, url):
+        if url not in seen_feeds:
+            seen_feeds.add(url)
+            found[acronym].append({'name': name or 'Unknown', 'url': url})
+
+    def fetch_page(url):
+        try:
+            return timed_get(url)
+        except Exception:
+            return None
+
+    start = time.time()
+    level = list(seeds)
+    for depth in range(max_depth + 1):
+        responses = run_parallel(level, fetch_page, limits, workers)
+        stats['pages'] += len(level)
+
+        next_level = []
+        for page_url, response in zip(level, responses):
+            acronym = owner[page_url]
+            if response is None or response['status'] != 200:
+                continue
+            if is_xml(response):
+                if depth:  # An RSS link that turned out to be a feed
+                    add_feed(acronym, page_names.get(page_url, ''), page_url)
+                continue
+
+            feeds, pages = extract_links(response['url'], response['body'])
+            for name, url in feeds:
+                add_feed(acronym, name, url)
+            for name, url in pages:
+                if url in owner:
+                    continue
+                owner[url] = acronym
+                page_names[url] = name
+                if depth < max_depth and pages_left[acronym] > 0:
+                    pages_left[acronym] -= 1
+                    next_level.append(url)
+                else:
+                    add_feed(acronym, name, url)  # Not crawled: let validation decide
+
+        level = next_level
+
+    stats['seconds'] = time.time() - start
+    return found, stats
@@ -0,0 +1,118 @@
+import time
+
+from .article_store import record_fetch_attempts
+
+# ============================================
+# CONFIGURATION
+# ============================================
+RELIABLE_STREAK = 5  # Consecutive active checks before a feed counts as reliable
+RELIABLE_RECHECK_DAYS = 7
+RECHECK_HOURS = 20  # Uncertain feeds: every daily run (a bit under 24h so cron jitter doesn't skip a day)
+MAX_BACKOFF_DAYS = 30
+LATENCY_DAYS = 30  # History used for latency percentiles
+
+# ============================================
+# FEED HEALTH HISTORY (validator)
+# ============================================
+# One feed_health row per validated URL in the article store, next to the
+# fetch_attempts rows every check also writes:
+#   status          'active' | 'weak' (recent but too few relevant) | 'stale' (nothing recent) | 'broken' (fetch failed)
+#   success_streak  consecutive active checks
+#   failure_streak  consecutive non-active checks
+#   next_check      epoch; the validator skips the feed until then and reuses the last result
+# Active feeds are rechecked every run until RELIABLE_STREAK, then weekly.
+# Other feeds back off exponentially: 20h, 40h, 80h ... up to MAX_BACKOFF_DAYS.
+
+def classify(result, error=None):
+    is_active, relevant, recent, age = result
+    if error:
+        return 'broken'
+    if is_active:
+        return 'active'
+    return 'weak' if recent else 'stale'
+
+def next_check_after(status, success_streak, failure_streak, now):
+    if status == 'active':
+        if success_streak >= RELIABLE_STREAK:
+            return now + RELIABLE_RECHECK_DAYS * 86400
+        return now + RECHECK_HOURS * 3600
+
+    backoff = RECHECK_HOURS * 3600 * 2 ** min(failure_streak - 1, 10)
+    return now + min(backoff, MAX_BACKOFF_DAYS * 86400)
+
+def load_health(conn):
+    """{url: feed_health row as a dict}"""
+    cursor = conn.execute('SELECT * FROM feed_health')
+    columns = [c[0] for c in cursor.description]
+    return {row[0]: dict(zip(columns, row)) for row in cursor}
+
+def due_urls(health, urls, now=None):
+    """The urls whose status is uncertain: never checked or past next_check"""
+    now = now or time.time()
+    return [url for url in urls if url not in health or health[url]['next_check'] <= now]
+
+def health_result(row):
+    """The last check of a skipped feed, as (is_active, relevant_count, total_count, freshest_age)"""
+    return row['status'] == 'active', row['relevant'], row['recent'], row['freshest_age']
+
+def record_checks(conn, checks):
+    """
+    Update streaks and next_check, and write a fetch_attempts row per check
+    checks: list of dicts with url, result (is_feed_active_and_relevant()), duration_ms, error
+    Returns: the updated rows {url: row}
+    """
+    now = int(time.time())
+    health = load_health(conn)
+    updated = {}
+
+    for check in checks:
+        url = check['url']
+        is_active, relevant, recent, age = check['result']
+        status = classify(check['result'], check.get('error'))
+        previous = health.get(url, {'success_streak': 0, 'failure_streak': 0, 'last_good': None})
+
+        if status == 'active':
+            success_streak, failure_streak, last_good = previous['success_streak'] + 1, 0, now
+        else:
+            success_streak, failure_streak, last_good = 0, previous['failure_streak'] + 1, previous['last_good']
+
+        updated[url] = {
+            'url': url, 'status': status,
+            'success_streak': success_streak, 'failure_streak': failure_streak,
+            'relevant': relevant, 'recent': recent, 'freshest_age': age,
+            'last_checked': now, 'last_good': last_good,
+            'next_check': int(next_check_after(status, success_streak, failure_streak, now))
+        }
+
+    with conn:
+        conn.executemany(
+            'INSERT OR REPLACE INTO feed_health (url, status, success_streak, failure_streak, relevant, '
+            'recent, freshest_age, last_checked, last_good, next_check) '
+            'VALUES (:url, :status, :success_streak, :failure_streak, :relevant, :recent, '
+            ':freshest_age, :last_checked, :last_good, :next_check)',
+            list(updated.values())
+        )
+
+    record_fetch_attempts(conn, [
+        {'feed_url': check['url'], 'ok': not check.get('error'), 'duration_ms': check.get('duration_ms'),
+         'recent': check['result'][2], 'relevant': check['result'][1], 'error': check.get('error')}
+        for check in checks
+    ])
+
+    return updated
+
+def latency_percentiles(conn, urls, days=LATENCY_DAYS):
+    """{url: (p50_ms, p95_ms)} of successful fetches over the last days"""
+    since = int(time.time()) - days * 86400
+    durations = {}
+    for url, duration_ms in conn.execute(
+            'SELECT feed_url, duration_ms FROM fetch_attempts '
+            'WHERE ok = 1 AND duration_ms IS NOT NULL AND fetched_ts >= ?', (since,)):
+        durations.setdefault(url, []).append(duration_ms)
+
+    percentiles = {}
+    for url in urls:
+        values = sorted(durations.get(url, []))
+        if values:
+            percentiles[url] = (values[len(values) // 2], values[min(len(values) - 1, int(len(values) * 0.95))])
+    return percentiles
@@ -0,0 +1,118 @@
+import email.utils
+import re
+from datetime import datetime, timezone
+from xml.etree import ElementTree
+
+from .http_fetch import timed_get
+
+# ============================================
+# STREAMING ENTRY PARSER
+# ============================================
+# feedparser needs the whole document. For a yes/no question about the
+# first few entries (is this feed active?), entries are parsed here as the
+# bytes arrive and the caller can stop the download after any entry.
+#
+# Entries are dicts shaped like feedparser's:
+#   {'title', 'summary', 'published_parsed': UTC struct_time or None}
+# Only RSS <item> and Atom <entry> elements are read. Documents that aren't
+# well-formed XML (undeclared HTML entities, broken markup) raise
+# ElementTree.ParseError - use feedparser for those.
+
+ENTRY_TAGS = ('item', 'entry')
+ENTRY_END = re.compile(rb'</(?:[\w.-]+:)?(?:item|entry)\s*>', re.IGNORECASE)
+SUMMARY_TAGS = ('description', 'summary', 'content', 'encoded')
+DATE_TAGS = ('pubDate', 'published', 'updated', 'date')
+
+def local_name(tag):
+    return tag.rsplit('}', 1)[-1]
+
+def parse_date(text):
+    """RFC 822 (RSS) or ISO 8601 (Atom, dc:date) -> UTC struct_time"""
+    text = (text or '').strip()
+    if not text:
+        return None
+
+    try:
+        date = email.utils.parsedate_to_datetime(text)
+    except (TypeError, ValueError, IndexError):
+        try:
+            date = datetime.fromisoformat(text.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+
+    if date.tzinfo:
+        date = date.astimezone(timezone.utc)
+    return date.utctimetuple()
+
+def entry_fields(element):
+    fields = {}
+    for child in element:
+        name = local_name(child.tag)
+        if name == 'title' and 'title' not in fields:
+            fields['title'] = ''.join(child.itertext()).strip()
+        elif name in SUMMARY_TAGS and 'summary' not in fields:
+            fields['summary'] = ''.join(child.itertext()).strip()
+        elif name in DATE_TAGS and 'published_parsed' not in fields:
+            fields['published_parsed'] = parse_date(child.text)
+
+    fields.setdefault('title', '')
+    fields.setdefault('summary', '')
+    fields.setdefault('published_parsed', None)
+    return fields
+
+def stream_entries(url, on_entry, headers=None, timeout=None):
+    """
+    Download url, handing every entry to on_entry(entry) as soon as it is parsed
+    on_entry returns True to stop the download
+    Returns: the timed_get() response ('complete' is False when stopped early)
+    """
+    parser = ElementTree.XMLPullParser(events=('end',))
+
+    def on_chunk(data):
+        parser.feed(data)
+        for _, element in parser.read_events():
+            if local_name(element.tag) in ENTRY_TAGS:
+                entry = entry_fields(element)
+                element.clear()
+                if on_entry(entry):
+                    return True
+        return False
+
+    response = timed_get(url, headers, timeout, on_chunk=on_chunk)
+    if response['status'] == 200 and response['complete']:
+        parser.close()
+    return response
+
+# ============================================
+# ENTRY CAP FOR FEEDPARSER DOWNLOADS
+# ============================================
+# Counts closing </item> / </entry> tags in the raw bytes as they arrive,
+# without parsing, so a feed with thousands of entries stops downloading
+# after max_entries and feedparser only sees those:
+#   cap = new_entry_cap(100)
+#   response = timed_get(url, on_chunk=lambda data: count_entry_ends(cap, data))
+#   body = cut_at_cap(cap, response['body'])
+
+def new_entry_cap(max_entries):
+    return {'max': max_entries, 'count': 0, 'tail': b'', 'offset': 0, 'end': None, 'stopped': False}
+
+def count_entry_ends(cap, data):
+    """Feed the next decoded chunk; True once an entry beyond the cap ends (stop the download)"""
+    window = cap['tail'] + data
+    window_start = cap['offset'] - len(cap['tail'])
+    for match in ENTRY_END.finditer(window):
+        if match.end() <= len(cap['tail']):
+            continue  # Counted with the previous chunk
+        cap['count'] += 1
+        if cap['count'] == cap['max']:
+            cap['end'] = window_start + match.end()
+        elif cap['count'] > cap['max']:
+            cap['stopped'] = True
+            return True
+    cap['offset'] += len(data)
+    cap['tail'] = window[-32:]
+    return False
+
+def cut_at_cap(cap, body):
+    """body up to the end of the last entry within the cap (unchanged when the cap wasn't hit)"""
+    return body[:cap['end']] if cap['stopped'] else body
@@ -0,0 +1,132 @@
+import calendar
+import socket
+import time
+from collections import defaultdict
+from datetime import datetime
+
+from .config import load_feeds
+from .fetch_engine import get_feed, get_feeds
+
+# ============================================
+# TEST feeds.txt (cli: test)
+# ============================================
+# Every feed in feeds.txt is downloaded (through the shared engine) and
+# sorted into working / stale (nothing in 48h) / timeout / broken.
+# The working ones are written to feeds_cleaned.txt.
+
+CLEANED_FEEDS_PATH = 'feeds_cleaned.txt'
+
+def test_feed(engine, url, now):
+    """Returns: (outcome, total entries, recent entries, error) - recent as of now (UTC epoch)"""
+    try:
+        feed = get_feed(engine, url)
+    except socket.timeout:
+        return 'timeout', 0, 0, None
+    except Exception as e:
+        return 'broken', 0, 0, str(e)[:50]
+
+    if not feed.entries:
+        return 'broken', 0, 0, None
+
+    # Check for recent content (last 48 hours)
+    recent_count = 0
+    for entry in feed.entries[:20]:  # Check first 20 entries
+        try:
+            if hasattr(entry, 'published_parsed') and entry.published_parsed:
+                if now - calendar.timegm(entry.published_parsed) <= 48 * 3600:
+                    recent_count += 1
+        except:
+            pass
+
+    return ('working' if recent_count else 'stale'), len(feed.entries), recent_count, None
+
+def write_cleaned_feeds(working_feeds, path=CLEANED_FEEDS_PATH):
+    by_publication = defaultdict(list)
+    for feed_info in working_feeds:
+        by_publication[feed_info['acronym']].append(feed_info)
+
+    with open(path, 'w') as f:
+        f.write('# Working RSS Feeds (Auto-Generated)\n')
+        f.write(f'# Validated: {datetime.now().strftime("%Y-%m-%d %H:%M")}\n')
+        f.write(f'# Total: {len(working_feeds)} working feeds\n\n')
+
+        for pub in sorted(by_publication.keys()):
+            feeds_list = by_publication[pub]
+            f.write(f'# {pub} - {len(feeds_list)} feeds\n')
+
+            for feed_info in sorted(feeds_list, key=lambda x: x['name']):
+                f.write(f'{feed_info["name"]}|{feed_info["acronym"]}|{feed_info["url"]}\n')
+
+            f.write('\n')
+
+def run_test(engine):
+    print('=' * 60)
+    print('RSS Feed Validator')
+    print('Testing all feeds from feeds.txt')
+    print('=' * 60)
+
+    feeds = [dict(info, name=name) for name, info in load_feeds().items()]
+    if not feeds:
+        print('No feeds loaded!')
+        return 1
+
+    print(f'\nLoaded {len(feeds)} feeds from feeds.txt\n')
+
+    now = int(time.time())
+    results = get_feeds(engine, [f['url'] for f in feeds], lambda url: test_feed(engine, url, now))
+    by_outcome = defaultdict(list)
+
+    for i, (feed_info, (outcome, total_entries, recent_count, error)) in enumerate(zip(feeds, results), 1):
+        print(f'[{i}/{len(feeds)}] Testing: {feed_info["name"]}')
+        by_outcome[outcome].append(feed_info)
+
+        if outcome == 'timeout':
+            print(f'  ⏱️  TIMEOUT: Request timed out')
+        elif error:
+            print(f'  ❌ ERROR: {error}')
+        elif outcome == 'broken':
+            print(f'  ❌ BROKEN: 0 entries found')
+        elif outcome == 'stale':
+            print(f'  ⚠️  STALE: {total_entries} total entries, but 0 from last 48hrs')
+        else:
+            print(f'  ✅ Working: {total_entries} total entries, {recent_count} recent (48hrs)')
+
+    # ============================================
+    # SUMMARY
+    # ============================================
+    print('\n' + '=' * 60)
+    print('SUMMARY')
+    print('=' * 60)
+    print(f'Total feeds tested: {len(feeds)}')
+    print(f'✅ Working: {len(by_outcome["working"])}')
+    print(f'⚠️  Stale (>48hrs): {len(by_outcome["stale"])}')
+    print(f'⏱️  Timeout: {len(by_outcome["timeout"])}')
+    print(f'❌ Broken: {len(by_outcome["broken"])}')
+    print('=' * 60)
+
+    for outcome, title in (('broken', '❌ BROKEN FEEDS:'),
+                           ('stale', '⚠️  STALE FEEDS (no content in last 48hrs):'),
+                           ('timeout', '⏱️  TIMEOUT FEEDS:')):
+        if by_outcome[outcome]:
+            print('\n' + title)
+            for feed_info in by_outcome[outcome]:
+                print(f'  - {feed_info["name"]}')
+
+    # ============================================
+    # GENERATE CLEANED FEEDS FILE
+    # ============================================
+    print('\n' + '=' * 60)
+    print('GENERATING CLEANED FEEDS FILE')
+    print('=' * 60)
+
+    try:
+        write_cleaned_feeds(by_outcome['working'])
+        print(f'✅ Generated {CLEANED_FEEDS_PATH} with {len(by_outcome["working"])} working feeds')
+        print('   Download this file and replace your feeds.txt with it')
+    except Exception as e:
+        print(f'❌ Error writing cleaned feeds: {str(e)}')
+
+    print('\n' + '=' * 60)
+    print('Feed validation complete!')
+    print('=' * 60)
+    return 0
@@ -0,0 +1,676 @@
+import calendar
+import time
+from collections import defaultdict
+from datetime import datetime
+from urllib.parse import urlsplit
+from xml.etree import ElementTree
+
+from .config_bundle import load_bundle
+from .profiling import new_profiler, profile_stage, dump_profiles
+from .fetch_pool import MAX_WORKERS
+from .fetch_engine import get_feed, get_feeds
+from .feed_stream import stream_entries
+from .entry_text import entry_is_relevant
+from .feed_discovery import crawl_feeds
+from .article_store import open_store
+from .feed_health import LATENCY_DAYS, load_health, due_urls, health_result, record_checks, latency_percentiles
+
+# ============================================
+# VALIDATE feeds_master.txt (cli: validate)
+# ============================================
+# Checks every master feed for 3+ recent keyword-relevant articles,
+# discovers more feeds for under-covered publications, and regenerates
+# feeds.txt from the active ones.
+
+MIN_FEEDS_PER_PUB = 3
+
+# ============================================
+# LOAD MASTER FEEDS
+# ============================================
+def load_master_feeds():
+    feeds = []
+    try:
+        with open('feeds_master.txt', 'r') as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith('#'):
+                    continue
+                
+                if '|' in line:
+                    parts = line.split('|')
+                    if len(parts) == 3:
+                        feeds.append({
+                            'name': parts[0].strip(),
+                            'acronym': parts[1].strip(),
+                            'url': parts[2].strip()
+                        })
+        return feeds
+    except:
+        return []
+
+# ============================================
+# BS FALLBACK (listing page unreachable)
+# ============================================
+def get_bs_fallback_feeds():
+    """Fallback BS RSS feeds if scraping fails"""
+    return [
+        {'name': 'Home Page Top Stories', 'url': 'https://www.business-standard.com/rss/home_page_top_stories.rss'},
+        {'name': 'Latest News', 'url': 'https://www.business-standard.com/rss/latest.rss'},
+        {'name': 'Markets', 'url': 'https://www.business-standard.com/rss/markets-106.rss'},
+        {'name': 'Banking Finance', 'url': 'https://www.business-standard.com/rss/finance-101.rss'},
+        {'name': 'Economy Policy', 'url': 'https://www.business-standard.com/rss/economy-policy-102.rss'},
+        {'name': 'Companies', 'url': 'https://www.business-standard.com/rss/companies-101.rss'},
+        {'name': 'Technology', 'url': 'https://www.business-standard.com/rss/technology-108.rss'},
+        {'name': 'Opinion', 'url': 'https://www.business-standard.com/rss/opinion-103.rss'},
+    ]
+
+# ============================================
+# PREDEFINED PATTERNS FOR OTHER PUBLICATIONS
+# ============================================
+DISCOVERY_PATTERNS = {
+    'ET': {
+        'name': 'Economic Times',
+        'patterns': [
+            'https://economictimes.indiatimes.com/rssfeedstopstories.cms',
+            'https://economictimes.indiatimes.com/markets/rssfeeds/1977021501.cms',
+            'https://economictimes.indiatimes.com/industry/banking/finance/rssfeeds/13358259.cms',
+            'https://economictimes.indiatimes.com/news/economy/rssfeeds/1373380680.cms',
+            'https://economictimes.indiatimes.com/markets/stocks/rssfeeds/2146842.cms',
+        ]
+    },
+    'FT': {
+        'name': 'Financial Times',
+        'patterns': [
+            'https://www.ft.com/?format=rss',
+            'https://www.ft.com/companies?format=rss',
+            'https://www.ft.com/markets?format=rss',
+            'https://www.ft.com/world/economy?format=rss',
+        ]
+    },
+    'Mint': {
+        'name': 'LiveMint',
+        'patterns': [
+            'https://www.livemint.com/rss/homepage',
+            'https://www.livemint.com/rss/markets',
+            'https://www.livemint.com/rss/money',
+            'https://www.livemint.com/rss/companies',
+            'https://www.livemint.com/rss/economy',
+        ]
+    },
+    'Barrons': {
+        'name': "Barron's",
+        'patterns': [
+            'https://feeds.content.dowjones.io/public/rss/barrons_marketupdate',
+            'https://feeds.content.dowjones.io/public/rss/barrons_topnews',
+            'https://feeds.content.dowjones.io/public/rss/barrons_stockstowatch',
+            'https://feeds.content.dowjones.io/public/rss/barrons_streetwise',
+        ]
+    },
+    'MC': {
+        'name': 'MoneyControl',
+        'patterns': [
+            'https://www.moneycontrol.com/rss/latestnews.xml',
+            'https://www.moneycontrol.com/rss/business.xml',
+            'https://www.moneycontrol.com/rss/marketreports.xml',
+            'https://www.moneycontrol.com/rss/results.xml',
+            'https://www.moneycontrol.com/rss/MCtopnews.xml',
+            'https://www.moneycontrol.com/rss/mostpopular.xml',
+            'https://www.moneycontrol.com/rss/mfnews.xml',
+            'https://www.moneycontrol.com/rss/insurance.xml',
+            'https://www.moneycontrol.com/rss/bankingnews.xml',
+            'https://www.moneycontrol.com/rss/economy.xml',
+        ]
+    },
+    'NYT': {
+        'name': 'New York Times',
+        'patterns': [
+            'https://rss.nytimes.com/services/xml/rss/nyt/HomePage.xml',
+            'https://rss.nytimes.com/services/xml/rss/nyt/Business.xml',
+            'https://rss.nytimes.com/services/xml/rss/nyt/Economy.xml',
+        ]
+    },
+    'WSJ': {
+        'name': 'Wall Street Journal',
+        'patterns': [
+            'https://feeds.content.dowjones.io/public/rss/RSSMarketsMain',
+            'https://feeds.content.dowjones.io/public/rss/WSJcomUSBusiness',
+            'https://feeds.content.dowjones.io/public/rss/RSSWorldNews',
+        ]
+    }
+}
+
+# ============================================
+# CRAWL PUBLICATIONS FOR RSS FEEDS
+# ============================================
+# RSS listing pages, plus the homepage of every publication host in
+# feeds_master.txt and DISCOVERY_PATTERNS (see financial_news.feed_discovery)
+LISTING_PAGES = {
+    'BS': ['https://www.business-standard.com/rss-feeds/listing'],
+    'ET': ['https://economictimes.indiatimes.com/rss.cms'],
+    'Mint': ['https://www.livemint.com/rss'],
+    'NYT': ['https://www.nytimes.com/rss'],
+}
+FEED_ONLY_HOSTS = ('rss.', 'feeds.')  # Nothing to crawl on these
+
+def crawl_seeds(master_feeds):
+    seeds = {url: acronym for acronym, pages in LISTING_PAGES.items() for url in pages}
+    
+    publication_urls = [(f['acronym'], f['url']) for f in master_feeds]
+    publication_urls += [(pub, url) for pub, config in DISCOVERY_PATTERNS.items() for url in config['patterns']]
+    for acronym, url in publication_urls:
+        parts = urlsplit(url)
+        if parts.hostname and not parts.hostname.startswith(FEED_ONLY_HOSTS):
+            seeds.setdefault(f'{parts.scheme}://{parts.netloc}/', acronym)
+    
+    return seeds
+
+def crawl_publications(master_feeds, limits, workers=MAX_WORKERS):
+    """
+    Autodiscover feeds for every publication
+    Returns: {acronym: [{'name', 'url'}]}
+    """
+    seeds = crawl_seeds(master_feeds)
+    print(f'  🕸️  Crawling {len(seeds)} homepages and RSS listing pages for feed links...')
+    
+    crawled, stats = crawl_feeds(seeds, limits, workers=workers)
+    
+    found = sum(len(feeds) for feeds in crawled.values())
+    print(f"    ✓ Found {found} feed URLs on {stats['pages']} pages in {stats['seconds']:.1f}s")
+    for acronym in sorted(crawled):
+        print(f'      {acronym}: {len(crawled[acronym])}')
+    
+    return crawled
+
+# ============================================
+# VALIDATE WITH KEYWORDS
+# ============================================
+MAX_ENTRIES_CHECKED = 50
+
+def new_tally():
+    return {'relevant': 0, 'recent': 0, 'freshest_age': 999, 'seen': 0, 'ordered': True, 'last_age': None, 'expired': False}
+
+def tally_entry(tally, entry, keyword_matcher, hours, now):
+    """Count one entry as recent / relevant as of now (UTC epoch)"""
+    tally['seen'] += 1
+    try:
+        is_recent = False
+        published = entry.get('published_parsed')
+        if published:
+            age_hours = (now - calendar.timegm(published)) / 3600
+            
+            if age_hours < hours:
+                is_recent = True
+                tally['recent'] += 1
+            else:
+                tally['expired'] = True
+            
+            if age_hours < tally['freshest_age']:
+                tally['freshest_age'] = age_hours
+            
+            # Newest first so far? Then everything after an expired entry is expired too
+            if tally['last_age'] is not None and age_hours < tally['last_age']:
+                tally['ordered'] = False
+            tally['last_age'] = age_hours
+        else:
+            is_recent = True
+            tally['recent'] += 1
+        
+        if is_recent:
+            title = entry.get('title', '')
+            description = entry.get('summary', '') or entry.get('description', '')
+            is_relevant, _ = entry_is_relevant(title, description, keyword_matcher)
+            
+            if is_relevant:
+                tally['relevant'] += 1
+                
+    except:
+        pass
+
+def is_feed_active_and_relevant(engine, url, keyword_matcher, min_relevant=3, hours=48, stream_stats=None, now=None):
+    """
+    Validate feed: recent + keyword relevant, as of now (UTC epoch, default: the current time)
+    The feed comes from the shared fetch engine (downloaded at most once)
+    With stream_stats, a feed the engine doesn't have yet is parsed as it
+    downloads and the download stops as soon as the counts are final (see
+    stream_check)
+    Returns: (is_active, relevant_count, total_count, freshest_age)
+    """
+    now = now or int(time.time())
+    try:
+        if stream_stats is not None and url not in engine['feeds']:
+            result = stream_check(url, keyword_matcher, min_relevant, hours, stream_stats, now)
+            if result:
+                return result
+        
+        feed = get_feed(engine, url)
+        
+        # feedparser returns an error page as a feed, usually without entries
+        status = feed.get('status') or 200
+        if status >= 400:
+            raise OSError(f'HTTP {status}')
+        
+        if not feed.entries:
+            return False, 0, 0, 999
+        
+        tally = new_tally()
+        for entry in feed.entries[:MAX_ENTRIES_CHECKED]:
+            tally_entry(tally, entry, keyword_matcher, hours, now)
+        
+        is_active = tally['relevant'] >= min_relevant
+        
+        return is_active, tally['relevant'], tally['recent'], tally['freshest_age']
+        
+    except Exception as e:
+        engine['errors'].setdefault(url, e)  # feed health: 'broken'
+        return False, 0, 0, 999
+
+def stream_check(url, keyword_matcher, min_relevant, hours, stream_stats, now):
+    """
+    Streaming is_feed_active_and_relevant(): stops the download after
+    MAX_ENTRIES_CHECKED entries, or once a newest-first feed reaches entries
+    older than hours - nothing after them counts. Not at min_relevant: the
+    relevant count orders feeds.txt, so it must be the one a full check gives
+    Returns: the result tuple, or None when the document needs feedparser
+    Raises: OSError for an HTTP error status (the feed is broken either way)
+    """
+    tally = new_tally()
+    
+    def on_entry(entry):
+        tally_entry(tally, entry, keyword_matcher, hours, now)
+        return (tally['expired'] and tally['ordered']) or tally['seen'] >= MAX_ENTRIES_CHECKED
+    
+    try:
+        response = stream_entries(url, on_entry)
+    except ElementTree.ParseError:
+        return None
+    
+    if response['status'] != 200:
+        raise OSError('HTTP ' + str(response['status']))
+    if not tally['seen']:
+        return None
+    
+    stream_stats[url] = (response['timings']['bytes'], not response['complete'])
+    return tally['relevant'] >= min_relevant, tally['relevant'], tally['recent'], tally['freshest_age']
+
+# ============================================
+# VALIDATE MANY FEEDS CONCURRENTLY
+# ============================================
+BS_POLITENESS_DELAY = 0.3  # Serial runs slept this long after every BS feed
+
+# run = {
+#   'engine', 'keyword_matcher', 'full' (ignore the health history),
+#   'stream' (early-exit discovery probes), 'workers' (concurrent checks), 'health_store', 'health' ({url: feed_health row}),
+#   'skipped' (urls not rechecked), 'timing' ({'wall', 'serial'}), 'stream_stats' ({url: (bytes, stopped early)}),
+#   'now' (UTC epoch every feed's entries are aged against)
+# }
+
+def new_validation_run(engine, full=False, stream=True, workers=MAX_WORKERS):
+    health_store = open_store()
+    return {
+        'engine': engine,
+        'keyword_matcher': load_bundle()['keyword_matcher'],  # Compiled once, cached until the config changes
+        'full': full,
+        'stream': stream,
+        'workers': workers,
+        'health_store': health_store,
+        # Feeds whose status is certain (reliable, or backing off) reuse their last result
+        'health': load_health(health_store),
+        'skipped': set(),
+        'timing': {'wall': 0.0, 'serial': 0.0},
+        'stream_stats': {},
+        'now': int(time.time())
+    }
+
+def check_feeds(run, urls, stream_urls=()):
+    """
+    is_feed_active_and_relevant() for every url that is due (see feed_health),
+    run concurrently within the engine's per-host politeness limits
+    stream_urls (discovery probes) are checked with early exit when run['stream']
+    Returns: {url: (is_active, relevant_count, total_count, freshest_age)}
+    """
+    engine, health = run['engine'], run['health']
+    urls = list(dict.fromkeys(urls))
+    due = urls if run['full'] else due_urls(health, urls)
+    run['skipped'].update(set(urls) - set(due))
+
+    def check(url):
+        start = time.time()
+        stream_stats = run['stream_stats'] if run['stream'] and url in stream_urls else None
+        result = is_feed_active_and_relevant(engine, url, run['keyword_matcher'], stream_stats=stream_stats,
+                                             now=run['now'])
+        return result, time.time() - start
+
+    start = time.time()
+    checked = get_feeds(engine, due, check, run['workers'])
+    run['timing']['wall'] += time.time() - start
+    run['timing']['serial'] += sum(elapsed for _, elapsed in checked)
+
+    errors = {url: str(e) or type(e).__name__ for url, e in engine['errors'].items()}
+    health.update(record_checks(run['health_store'], [
+        {'url': url, 'result': result, 'duration_ms': int(elapsed * 1000), 'error': errors.get(url)}
+        for url, (result, elapsed) in zip(due, checked)
+    ]))
+
+    results = {url: result for url, (result, _) in zip(due, checked)}
+    for url in urls:
+        if url not in results:
+            results[url] = health_result(health[url])
+    return results
+
+def skip_note(health, url):
+    """Why a feed wasn't rechecked this run"""
+    row = health[url]
+    next_check = datetime.fromtimestamp(row['next_check']).strftime('%Y-%m-%d')
+    if row['status'] == 'active':
+        return f'active {row["success_streak"]} times in a row, next check {next_check}'
+    return f'{row["status"]} {row["failure_streak"]} times in a row, backing off until {next_check}'
+
+# ============================================
+# DISCOVER FEEDS FOR BS (SCRAPE ALL)
+# ============================================
+def discover_bs_feeds(all_bs_feeds, checks):
+    """
+    Discover ALL Business Standard feeds scraped from their listing page
+    Picks the active + relevant ones from the check_feeds() results
+    """
+    
+    print('  🔍 Discovering Business Standard feeds...')
+    print('     Method: Crawled listing page and homepage links')
+    print(f'     Tested {len(all_bs_feeds)} feeds...')
+    
+    discovered = []
+    
+    for i, feed_info in enumerate(all_bs_feeds, 1):
+        try:
+            is_active, relevant, total_recent, age = checks[feed_info['url']]
+            
+            if is_active:
+                feed_name = feed_info['name']
+                
+                # Clean up name
+                if not feed_name or feed_name == 'Unknown' or len(feed_name) < 3:
+                    # Generate from URL
+                    feed_name = feed_info['url'].split('/')[-1]
+                    feed_name = feed_name.replace('.rss', '').replace('-', ' ').title()
+                
+                feed_name = f'BS {feed_name}'
+                
+                discovered.append({
+                    'name': feed_name,
+                    'acronym': 'BS',
+                    'url': feed_info['url'],
+                    'relevant': relevant,
+                    'age': age
+                })
+                
+                print(f'    [{i}/{len(all_bs_feeds)}] ✅ {feed_name}: {relevant} relevant ({age:.1f}h)')
+            
+        except Exception as e:
+            continue
+    
+    print(f'     ✓ Found {len(discovered)} active & relevant BS feeds')
+    return discovered
+
+# ============================================
+# DISCOVER FEEDS FOR OTHER PUBLICATIONS
+# ============================================
+def discovery_candidates(pub_acronym, crawled):
+    """Predefined patterns, then crawled feeds: [{'name', 'url'}]"""
+    candidates = [{'name': '', 'url': url} for url in DISCOVERY_PATTERNS.get(pub_acronym, {}).get('patterns', [])]
+    seen = {c['url'] for c in candidates}
+    for feed_info in crawled.get(pub_acronym, []):
+        if feed_info['url'] not in seen:
+            seen.add(feed_info['url'])
+            candidates.append(feed_info)
+    return candidates
+
+def discover_other_feeds(pub_acronym, candidates, checks):
+    """
+    Discover feeds for non-BS publications from discovery_candidates()
+    checks holds the check_feeds() results of the candidates
+    """
+    
+    print(f'  🔍 Discovering {publication_name(pub_acronym)} feeds...')
+    
+    discovered = []
+    
+    for candidate in candidates:
+        url = candidate['url']
+        is_active, relevant, total, age = checks[url]
+        
+        if is_active:
+            feed_name = candidate['name']
+            if not feed_name or feed_name == 'Unknown' or len(feed_name) < 3:
+                feed_name = url.split('/')[-1].replace('.rss', '').replace('.xml', '').replace('.cms', '')
+                feed_name = feed_name.replace('-', ' ').replace('_', ' ').title()
+            feed_name = f'{pub_acronym} {feed_name}'
+            
+            discovered.append({
+                'name': feed_name,
+                'acronym': pub_acronym,
+                'url': url,
+                'relevant': relevant,
+                'age': age
+            })
+            
+            print(f'    ✅ {feed_name}: {relevant} relevant ({age:.1f}h)')
+    
+    print(f'     ✓ Found {len(discovered)} active feeds')
+    return discovered
+
+def publication_name(pub_acronym):
+    return DISCOVERY_PATTERNS.get(pub_acronym, {}).get('name', pub_acronym)
+
+# ============================================
+# MAIN VALIDATION
+# ============================================
+def run_validate(engine, full=False, profile_dir=None, stream=True):
+    """
+    full=True ignores the health history; stream=False fetches discovery
+    probes in full (so later commands can reuse them)
+    """
+    profiler = new_profiler(profile_dir) if profile_dir else None
+    # Stage profiles are per thread: profile the feed checks one by one
+    run = new_validation_run(engine, full, stream, 1 if profile_dir else MAX_WORKERS)
+    
+    print('=' * 60)
+    print('Active Feed Discovery & Validation')
+    print('Testing for freshness AND keyword relevance')
+    print('=' * 60)
+    
+    master_feeds = load_master_feeds()
+
+    if not master_feeds:
+        print('⚠️  No feeds in feeds_master.txt - will only use auto-discovery')
+        master_feeds = []
+
+    print(f'Testing {len(master_feeds)} feeds from feeds_master.txt')
+    print('Criteria: 3+ RELEVANT articles (matching keywords) from last 48h\n')
+
+    working_feeds = []
+    by_publication = defaultdict(list)
+
+    total_tested = 0
+    broken_feeds = []
+    irrelevant_feeds = []
+
+    with profile_stage(profiler, 'validate'):
+        # Publications are crawled up front so the BS feeds are tested together with the master list
+        crawled = crawl_publications(master_feeds, engine['limits'], run['workers'])
+        all_bs_feeds = crawled.get('BS') or get_bs_fallback_feeds()
+        if not crawled.get('BS'):
+            print('    ⚠️  No BS feeds found - using fallback patterns')
+        master_urls = {f['url'] for f in master_feeds}
+        probe_urls = {f['url'] for f in all_bs_feeds} - master_urls
+        checks = check_feeds(run, [f['url'] for f in master_feeds] + [f['url'] for f in all_bs_feeds],
+                             stream_urls=probe_urls)
+        run['timing']['serial'] += BS_POLITENESS_DELAY * len(all_bs_feeds)
+
+        for i, feed_info in enumerate(master_feeds, 1):
+            print(f'[{i}/{len(master_feeds)}] {feed_info["name"]}')
+            total_tested += 1
+
+            is_active, relevant, total_recent, age = checks[feed_info['url']]
+            if feed_info['url'] in run['skipped']:
+                print(f'  ⏭️  Not rechecked: {skip_note(run["health"], feed_info["url"])}')
+
+            if is_active:
+                print(f'  ✅ Active: {relevant} relevant articles ({total_recent} total recent, {age:.1f}h ago)')
+                feed_info['relevant'] = relevant
+                feed_info['age'] = age
+                working_feeds.append(feed_info)
+                by_publication[feed_info['acronym']].append(feed_info)
+            else:
+                if total_recent == 0:
+                    print(f'  ❌ Stale/Broken: 0 recent articles')
+                    broken_feeds.append(feed_info)
+                elif relevant == 0:
+                    print(f'  ⚠️  Irrelevant: {total_recent} recent articles but 0 match keywords')
+                    irrelevant_feeds.append(feed_info)
+                else:
+                    print(f'  ⚠️  Insufficient: Only {relevant} relevant articles (need 3+)')
+                    irrelevant_feeds.append(feed_info)
+
+    # ============================================
+    # AUTO-DISCOVERY FOR ALL PUBLICATIONS
+    # ============================================
+    print('\n' + '=' * 60)
+    print('AUTO-DISCOVERY FOR ALL PUBLICATIONS')
+    print('=' * 60)
+
+    with profile_stage(profiler, 'discover'):
+        # Always discover BS feeds (special scraping)
+        print(f'\n🔍 Business Standard (BS):')
+        current_bs_count = len(by_publication.get('BS', []))
+        print(f'   Current: {current_bs_count} feeds - discovering all available...')
+
+        discovered = discover_bs_feeds(all_bs_feeds, checks)
+
+        # Add discovered feeds (avoid duplicates)
+        existing_urls = {f['url'] for f in by_publication.get('BS', [])}
+
+        for feed_info in discovered:
+            if feed_info['url'] not in existing_urls:
+                working_feeds.append(feed_info)
+                by_publication['BS'].append(feed_info)
+
+        new_bs_count = len(by_publication['BS'])
+        print(f'   ✅ Total BS feeds: {new_bs_count} (+{new_bs_count - current_bs_count} discovered)')
+
+        # Check other publications - test the candidates of every under-covered one at once
+        publications = list(DISCOVERY_PATTERNS) + sorted(set(crawled) - set(DISCOVERY_PATTERNS) - {'BS'})
+        candidates = {pub: discovery_candidates(pub, crawled) for pub in publications
+                      if len(by_publication.get(pub, [])) < MIN_FEEDS_PER_PUB}
+        candidate_urls = [c['url'] for pub_candidates in candidates.values() for c in pub_candidates]
+        checks.update(check_feeds(run, candidate_urls, stream_urls=set(candidate_urls) - master_urls))
+
+        for pub_acronym in publications:
+            current_count = len(by_publication.get(pub_acronym, []))
+
+            if current_count < MIN_FEEDS_PER_PUB:
+                print(f'\n⚠️  {publication_name(pub_acronym)} ({pub_acronym}): Only {current_count} active feeds')
+                print(f'   Target: {MIN_FEEDS_PER_PUB} feeds - discovering alternatives...')
+
+                discovered = discover_other_feeds(pub_acronym, candidates[pub_acronym], checks)
+
+                existing_urls = {f['url'] for f in by_publication.get(pub_acronym, [])}
+
+                for feed_info in discovered:
+                    if feed_info['url'] not in existing_urls:
+                        working_feeds.append(feed_info)
+                        by_publication[pub_acronym].append(feed_info)
+
+                new_count = len(by_publication[pub_acronym])
+                print(f'   ✅ Now has {new_count} active feeds (+{new_count - current_count} discovered)')
+            else:
+                print(f'\n✅ {publication_name(pub_acronym)} ({pub_acronym}): {current_count} active feeds')
+
+    # ============================================
+    # FINAL SUMMARY
+    # ============================================
+    print('\n' + '=' * 60)
+    print('VALIDATION SUMMARY')
+    print('=' * 60)
+    print(f'Feeds from master file: {total_tested}')
+    print(f'✅ Active & Relevant: {len(working_feeds)}')
+    print(f'⚠️  Has content but irrelevant: {len(irrelevant_feeds)}')
+    print(f'❌ Broken/Stale: {len(broken_feeds)}')
+    timing, stream_stats, skipped, health = run['timing'], run['stream_stats'], run['skipped'], run['health']
+    saved = timing['serial'] - timing['wall']
+    print(f"⏱️  Feed checks took {timing['wall']:.1f}s (serial: ~{timing['serial']:.1f}s, saved {saved:.1f}s)")
+
+    if stream_stats:
+        stopped_early = sum(1 for _, early in stream_stats.values() if early)
+        stream_kb = sum(read for read, _ in stream_stats.values()) / 1024
+        print(f'📉 Streamed {len(stream_stats)} discovery probes: {stopped_early} stopped early, {stream_kb:.0f} KB read')
+
+    healthy = sum(1 for url in skipped if health[url]['status'] == 'active')
+    checked_count = len(set(checks) - skipped)
+    print(f'🩺 Feed health: {checked_count} feeds checked, {len(skipped)} skipped '
+          f'({healthy} healthy, {len(skipped) - healthy} backing off)')
+
+    latencies = latency_percentiles(run['health_store'], [f['url'] for f in working_feeds], LATENCY_DAYS)
+    slowest = sorted(latencies.items(), key=lambda item: item[1][1], reverse=True)[:5]
+    if slowest:
+        print(f'   Slowest working feeds (p50 / p95 over {LATENCY_DAYS} days):')
+        for url, (p50, p95) in slowest:
+            print(f'     {p50:.0f}ms / {p95:.0f}ms  {url}')
+    run['health_store'].close()
+
+    print(f'\n📊 BY PUBLICATION:')
+    for pub in sorted(by_publication.keys()):
+        feeds = by_publication[pub]
+        avg_relevant = sum(f.get('relevant', 0) for f in feeds) / len(feeds) if feeds else 0
+        print(f'  {pub}: {len(feeds)} active feeds (avg {avg_relevant:.1f} relevant articles)')
+
+    # ============================================
+    # GENERATE feeds.txt
+    # ============================================
+    print('\n' + '=' * 60)
+    print('GENERATING feeds.txt')
+    print('=' * 60)
+
+    if len(working_feeds) == 0:
+        print('❌ ERROR: No working feeds found!')
+        return 1
+
+    try:
+        with open('feeds.txt', 'w') as f:
+            f.write('# AUTO-GENERATED - Only Active & Relevant Feeds\n')
+            f.write('# Criteria: 3+ articles matching keywords from last 48h\n')
+            f.write(f'# Last validated: {datetime.now().strftime("%Y-%m-%d %H:%M UTC")}\n')
+            f.write(f'# Active feeds: {len(working_feeds)}\n\n')
+
+            for pub in sorted(by_publication.keys()):
+                feeds_list = by_publication[pub]
+
+                # Sort by relevance
+                feeds_list.sort(key=lambda x: x.get('relevant', 0), reverse=True)
+
+                f.write(f'# {pub} - {len(feeds_list)} feeds\n')
+
+                for feed_info in feeds_list:
+                    f.write(f'{feed_info["name"]}|{feed_info["acronym"]}|{feed_info["url"]}\n')
+
+                f.write('\n')
+
+        print(f'✅ Generated feeds.txt with {len(working_feeds)} active & relevant feeds')
+
+        total_expected_articles = sum(f.get('relevant', 0) for f in working_feeds)
+        print(f'   Expected relevant articles in main run: ~{total_expected_articles}')
+
+        # The engine keeps these for test / run and writes them to the feed cache
+        cached = sum(1 for f in working_feeds if f['url'] in engine['feeds'])
+        print(f'♻️  {cached} working feeds already downloaded for the aggregator')
+
+    except Exception as e:
+        print(f'❌ Error: {str(e)}')
+        return 1
+
+    if profiler:
+        dump_profiles(profiler)
+
+    print('\n' + '=' * 60)
+    print('✅ Validation complete!')
+    print('=' * 60)
+    return 0
@@ -0,0 +1,83 @@
+import threading
+
+from .feed_cache import FEED_CACHE_MAX_AGE_MINUTES, FEED_CACHE_PATH, compact_feed, cached_feed, load_feed_cache, write_feed_cache
+from .fetch_pool import MAX_WORKERS, new_host_limits, run_parallel
+from .stages import fetch_feed
+
+# ============================================
+# SHARED FETCH ENGINE (feed tools)
+# ============================================
+# One engine per process: every feed tool (validate, test, discover, run)
+# asks it for feeds, so a URL is downloaded at most once per invocation.
+# Feeds younger than max_age_minutes in the on-disk feed cache count as
+# already downloaded; save_engine() writes the good ones back for the next
+# invocation (and for a separate aggregator run).
+#
+# engine = {
+#   'feeds':  {url: compact_feed()},
+#   'errors': {url: exception from the download},
+#   'limits': per-host limits shared by every command,
+#   'stats':  {'downloaded', 'reused'},
+#   'lock': guards stats and url_locks,
+#   'url_locks': {url: lock held while the url is downloaded}
+# }
+
+def new_engine(max_age_minutes=FEED_CACHE_MAX_AGE_MINUTES, path=FEED_CACHE_PATH):
+    return {
+        'feeds': load_feed_cache(max_age_minutes, path),
+        'errors': {},
+        'path': path,
+        'limits': new_host_limits(),
+        'stats': {'downloaded': 0, 'reused': 0},
+        'lock': threading.Lock(),
+        'url_locks': {}
+    }
+
+def count(engine, stat):
+    with engine['lock']:
+        engine['stats'][stat] += 1
+
+def url_lock(engine, url):
+    with engine['lock']:
+        return engine['url_locks'].setdefault(url, threading.Lock())
+
+def get_feed(engine, url):
+    """
+    Feed for url as cached_feed() of its compact form, downloaded at most
+    once: concurrent callers for the same url wait for the one download
+    Raises the download's exception - again on later calls for the same url
+    """
+    with url_lock(engine, url):
+        compact = engine['feeds'].get(url)
+        if compact is not None:
+            count(engine, 'reused')
+        elif url in engine['errors']:
+            count(engine, 'reused')
+            raise engine['errors'][url]
+        else:
+            try:
+                feed, timings = fetch_feed(url)
+            except Exception as e:
+                engine['errors'][url] = e
+                raise
+            compact = engine['feeds'][url] = compact_feed(feed, timings)
+            count(engine, 'downloaded')
+
+    # Every caller gets the same view, whether it downloaded the feed or not
+    return cached_feed(compact)
+
+def get_feeds(engine, urls, check, workers=MAX_WORKERS):
+    """
+    check(url) for every url concurrently within the engine's host limits
+    (check calls get_feed); returns results in the order of urls
+    workers=1 checks them one by one on the calling thread
+    """
+    return run_parallel(urls, check, engine['limits'], workers)
+
+def usable_feeds(engine):
+    """{url: compact feed} of downloads worth reusing: entries and no HTTP error"""
+    return {url: feed for url, feed in engine['feeds'].items()
+            if feed['entries'] and (feed.get('status') or 200) < 400}
+
+def save_engine(engine):
+    write_feed_cache(usable_feeds(engine), engine['path'])
@@ -0,0 +1,106 @@
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+# ============================================
+# CONFIGURATION
+# ============================================
+MAX_WORKERS = 16
+PER_HOST = 2  # Concurrent requests per host
+MIN_INTERVAL = 0.3  # Seconds between request starts on the same host (be polite)
+MAX_AHEAD = 16  # stream_parallel(): results in flight or waiting for the consumer
+
+# ============================================
+# PER-HOST POLITENESS LIMITS
+# ============================================
+# limits = new_host_limits(); with host_slot(limits, url): ... fetch url
+# At most per_host requests to one host run at once, and request starts
+# on one host are at least min_interval apart.
+
+def new_host_limits(per_host=PER_HOST, min_interval=MIN_INTERVAL):
+    return {'per_host': per_host, 'min_interval': min_interval, 'lock': threading.Lock(), 'hosts': {}}
+
+@contextmanager
+def host_slot(limits, url):
+    host = urlsplit(url).hostname or ''
+
+    with limits['lock']:
+        slot = limits['hosts'].setdefault(host, {
+            'semaphore': threading.Semaphore(limits['per_host']), 'next_start': 0.0
+        })
+
+    with slot['semaphore']:
+        with limits['lock']:
+            start = max(time.monotonic(), slot['next_start'])
+            slot['next_start'] = start + limits['min_interval']
+        delay = start - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        yield
+
+def interleave_by_host(urls):
+    """Indexes of urls, round-robin over hosts, so one big host doesn't hold every worker"""
+    by_host = {}
+    for i, url in enumerate(urls):
+        by_host.setdefault(urlsplit(url).hostname or '', []).append(i)
+
+    order = []
+    queues = list(by_host.values())
+    while queues:
+        order.extend(queue.pop(0) for queue in queues)
+        queues = [queue for queue in queues if queue]
+    return order
+
+def run_parallel(urls, fetch, limits=None, max_workers=MAX_WORKERS):
+    """
+    fetch(url) for every url on a thread pool, within the host limits
+    max_workers=1 fetches one by one on the calling thread (e.g. to profile them)
+    Returns: results in the order of urls
+    """
+    if not urls:
+        return []
+    if limits is None:
+        limits = new_host_limits()
+
+    def limited(url):
+        with host_slot(limits, url):
+            return fetch(url)
+
+    if max_workers <= 1:
+        return [limited(url) for url in urls]
+
+    results = [None] * len(urls)
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as pool:
+        futures = {i: pool.submit(limited, urls[i]) for i in interleave_by_host(urls)}
+        for i, future in futures.items():
+            results[i] = future.result()
+    return results
+
+def stream_parallel(urls, fetch, limits=None, max_workers=MAX_WORKERS, ahead=MAX_AHEAD):
+    """
+    fetch(i) for every index i of urls on a thread pool, within the host
+    limits (urls[i] is the host slot), yielding the results in the order
+    of urls. Only ahead fetches are submitted past the result the
+    consumer is waiting for: results are never held for more than ahead
+    urls at once, and a slow consumer holds the downloads back.
+    """
+    if not urls:
+        return
+    if limits is None:
+        limits = new_host_limits()
+
+    def limited(i):
+        with host_slot(limits, urls[i]):
+            return fetch(i)
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as pool:
+        pending = deque()
+        next_i = 0
+        while pending or next_i < len(urls):
+            while next_i < len(urls) and len(pending) < ahead:
+                pending.append(pool.submit(limited, next_i))
+                next_i += 1
+            yield pending.popleft().result()
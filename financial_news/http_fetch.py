@@ -0,0 +1,174 @@
+import http.client
+import socket
+import ssl
+import time
+import zlib
+from urllib.parse import urlsplit, urljoin
+
+# ============================================
+# CONFIGURATION
+# ============================================
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+MAX_REDIRECTS = 5
+CHUNK_SIZE = 8192  # Streaming reads
+MAX_BODY_BYTES = 4 * 1024 * 1024  # Per response, on the wire and decoded (the largest real feeds are < 1 MB)
+REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+
+# ============================================
+# TIMED HTTP GET
+# ============================================
+# feedparser.parse(url) downloads through urllib and reports no timings,
+# so feeds are downloaded here and only the bytes are handed to feedparser.
+#
+# Returns: {
+#   'url': final URL after redirects,
+#   'status': HTTP status,
+#   'headers': {lowercase name: value},
+#   'body': decoded body bytes,
+#   'complete': False when on_chunk or the size cap stopped the download,
+#   'truncated': 'bytes' when the body was cut at max_bytes, else None,
+#   'timings': {'dns_ms', 'connect_ms', 'ttfb_ms', 'total_ms', 'bytes'}
+# }
+# bytes is the size on the wire (before gzip/deflate decoding). Timings
+# add up over redirects.
+#
+# Bodies are read CHUNK_SIZE at a time and decoded as they arrive. Neither
+# the wire bytes nor the decoded bytes may exceed max_bytes: the download
+# stops there and the body is cut, so a huge page or a gzip bomb costs at
+# most max_bytes of memory. With on_chunk, every decoded chunk of a 200
+# body goes to on_chunk(data) as it arrives; returning True closes the
+# connection without reading the rest.
+
+def elapsed_ms(start):
+    return (time.perf_counter() - start) * 1000
+
+def open_connection(scheme, host, port, timeout, timings):
+    """Resolve and connect (TCP + TLS), timing each step"""
+    start = time.perf_counter()
+    addresses = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+    timings['dns_ms'] += elapsed_ms(start)
+
+    start = time.perf_counter()
+    sock = None
+    last_error = None
+    for family, socktype, proto, _, address in addresses:
+        try:
+            sock = socket.socket(family, socktype, proto)
+            sock.settimeout(timeout)
+            sock.connect(address)
+            break
+        except OSError as e:
+            last_error = e
+            sock.close()
+            sock = None
+    if sock is None:
+        raise last_error or OSError('no address for ' + host)
+
+    if scheme == 'https':
+        sock = ssl.create_default_context().wrap_socket(sock, server_hostname=host)
+    timings['connect_ms'] += elapsed_ms(start)
+
+    conn = http.client.HTTPConnection(host, port, timeout=timeout)
+    conn.sock = sock
+    return conn
+
+def new_decoder(encoding, first_chunk):
+    """Incremental gzip/deflate decoder (None for identity)"""
+    encoding = (encoding or '').lower()
+    if encoding in ('gzip', 'x-gzip'):
+        return zlib.decompressobj(16 + zlib.MAX_WBITS)
+    if encoding == 'deflate':
+        # zlib-wrapped deflate starts with a CM=8 header byte, raw deflate doesn't
+        is_zlib = first_chunk and (first_chunk[0] & 0x0f) == 8
+        return zlib.decompressobj(zlib.MAX_WBITS if is_zlib else -zlib.MAX_WBITS)
+    return None
+
+def stream_body(response, encoding, on_chunk, timings, max_bytes):
+    """
+    Read the body chunk by chunk up to max_bytes, handing decoded chunks to on_chunk
+    Returns: (decoded body read so far, complete, truncated)
+    """
+    decoder = None
+    parts = []
+    size = 0
+    wire = 0
+
+    while True:
+        chunk = response.read1(CHUNK_SIZE)
+        if not chunk:
+            data = decoder.flush() if decoder else b''
+            truncated = 'bytes' if size + len(data) > max_bytes else None
+            data = data[:max_bytes - size]
+            parts.append(data)
+            if data and on_chunk:
+                on_chunk(data)
+            return b''.join(parts), not truncated, truncated
+
+        timings['bytes'] += len(chunk)
+        wire += len(chunk)
+        if decoder is None and not parts:
+            decoder = new_decoder(encoding, chunk)
+        # max_length: one small compressed chunk can't inflate past the cap
+        data = decoder.decompress(chunk, max_bytes - size + 1) if decoder else chunk[:max_bytes - size + 1]
+        truncated = size + len(data) > max_bytes or wire > max_bytes
+        data = data[:max_bytes - size]
+        size += len(data)
+        parts.append(data)
+
+        if truncated:
+            if data and on_chunk:
+                on_chunk(data)
+            return b''.join(parts), False, 'bytes'
+        if data and on_chunk and on_chunk(data):
+            return b''.join(parts), False, None
+
+def timed_get(url, headers=None, timeout=None, on_chunk=None, max_bytes=MAX_BODY_BYTES):
+    """GET url following redirects, with per-phase timings"""
+    if timeout is None:
+        timeout = socket.getdefaulttimeout()
+
+    request_headers = {'User-Agent': USER_AGENT, 'Accept-Encoding': 'gzip, deflate'}
+    request_headers.update(headers or {})
+    timings = {'dns_ms': 0.0, 'connect_ms': 0.0, 'ttfb_ms': 0.0, 'total_ms': 0.0, 'bytes': 0}
+    start = time.perf_counter()
+
+    for _ in range(MAX_REDIRECTS + 1):
+        parts = urlsplit(url)
+        if parts.scheme not in ('http', 'https'):
+            raise ValueError('unsupported URL scheme: ' + url)
+        port = parts.port or (443 if parts.scheme == 'https' else 80)
+        path = parts.path or '/'
+        if parts.query:
+            path += '?' + parts.query
+
+        conn = open_connection(parts.scheme, parts.hostname, port, timeout, timings)
+        try:
+            request_start = time.perf_counter()
+            conn.request('GET', path, headers=dict(request_headers, Host=parts.netloc))
+            response = conn.getresponse()
+            timings['ttfb_ms'] += elapsed_ms(request_start)
+
+            response_headers = {k.lower(): v for k, v in response.getheaders()}
+            body, complete, truncated = stream_body(
+                response, response_headers.get('content-encoding'),
+                on_chunk if response.status == 200 else None, timings, max_bytes
+            )
+        finally:
+            conn.close()
+
+        if response.status in REDIRECT_STATUSES and 'location' in response_headers:
+            url = urljoin(url, response_headers['location'])
+            continue
+
+        timings['total_ms'] = elapsed_ms(start)
+        return {
+            'url': url,
+            'status': response.status,
+            'headers': response_headers,
+            'body': body,
+            'complete': complete,
+            'truncated': truncated,
+            'timings': timings
+        }
+
+    raise OSError('too many redirects: ' + url)
@@ -0,0 +1,169 @@
+import json
+import os
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+from .profiling import profile_stage
+
+# ============================================
+# CONFIGURATION
+# ============================================
+RUN_REPORT_PATH = 'run_report.json'
+STAGES = ('fetch', 'parse', 'relevance', 'categorize', 'dedup', 'trending', 'render', 'send')
+FEED_COUNTS = ('entries', 'recent', 'relevant', 'duplicates')
+FEED_LATENCIES = ('dns_ms', 'connect_ms', 'ttfb_ms', 'total_ms')
+
+# ============================================
+# RUN METRICS
+# ============================================
+# {
+#   'mode': 'run' / 'incremental' / 'delta' / 'from-store' / 'from-artifact' / 'daemon' / 'shard' / 'reduce',
+#   'started': ISO UTC time,
+#   'wall_ms': whole run,
+#   'stages': {stage: ms spent, summed over feeds},
+#   'feeds': {feed_name: {'url', 'ok', 'error', 'cached', 'truncated', 'entries_capped', 'dns_ms', 'connect_ms',
+#             'ttfb_ms', 'total_ms', 'parse_ms', 'bytes', 'entries',
+#             'recent', 'relevant', 'duplicates'}},
+#   'articles': unique articles in the digest
+# }
+
+def new_run_metrics(mode):
+    return {
+        'mode': mode,
+        'started': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'start_clock': time.perf_counter(),
+        'wall_ms': None,
+        'stages': {stage: 0.0 for stage in STAGES},
+        'feeds': {},
+        'articles': 0
+    }
+
+def add_stage_ms(metrics, stage, ms):
+    metrics['stages'][stage] = metrics['stages'].get(stage, 0.0) + ms
+
+@contextmanager
+def timed(metrics, stage):
+    """
+    with timed(metrics, 'dedup'): ... adds the block's wall time to the stage
+    (and profiles it when metrics['profiler'] is set, see profiling)
+    """
+    start = time.perf_counter()
+    try:
+        with profile_stage(metrics.get('profiler'), stage):
+            yield
+    finally:
+        add_stage_ms(metrics, stage, (time.perf_counter() - start) * 1000)
+
+def record_fetch(metrics, feed_name, feed_info, result):
+    """Network and parse metrics of one stages.fetch_one() result"""
+    timings = {k: round(v, 2) for k, v in (result['timings'] or {}).items()}
+    metrics['feeds'][feed_name] = {
+        'url': feed_info['url'],
+        'ok': not result['error'],
+        'error': result['error'],
+        'dns_ms': timings.get('dns_ms'),
+        'connect_ms': timings.get('connect_ms'),
+        'ttfb_ms': timings.get('ttfb_ms'),
+        'total_ms': timings.get('total_ms', result['duration_ms']),
+        'parse_ms': timings.get('parse_ms'),
+        'bytes': timings.get('bytes', 0),
+        'cached': result.get('cached', False),
+        'truncated': result.get('truncated'),
+        'entries_capped': result.get('entries_capped', False)
+    }
+    add_stage_ms(metrics, 'fetch', timings.get('total_ms', result['duration_ms']))
+    add_stage_ms(metrics, 'parse', timings.get('parse_ms', 0.0))
+
+def record_feed_counts(metrics, feed_stats):
+    """Entry counts from the pipeline's feed_stats"""
+    for feed_name, stats in feed_stats.items():
+        feed = metrics['feeds'].setdefault(feed_name, {})
+        feed['entries'] = stats.get('total', 0)
+        for count in FEED_COUNTS[1:]:
+            feed[count] = stats.get(count, 0)
+
+def finish_run(metrics, articles_count):
+    metrics['wall_ms'] = (time.perf_counter() - metrics['start_clock']) * 1000
+    metrics['articles'] = articles_count
+
+# ============================================
+# OUTPUT
+# ============================================
+def write_atomic(path, text):
+    """Write via a temp file so readers (e.g. node_exporter) never see half a file"""
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+def write_run_report(metrics, path=RUN_REPORT_PATH):
+    report = {k: v for k, v in metrics.items() if k not in ('start_clock', 'profiler')}
+    report['wall_ms'] = round(report['wall_ms'] or 0, 2)
+    report['stages'] = {stage: round(ms, 2) for stage, ms in report['stages'].items()}
+    write_atomic(path, json.dumps(report, indent=2, sort_keys=True))
+
+def prometheus_label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def write_prometheus(metrics, path):
+    """Prometheus textfile-collector format"""
+    lines = [
+        '# HELP financial_news_run_seconds Wall time of the last run',
+        '# TYPE financial_news_run_seconds gauge',
+        f"financial_news_run_seconds {(metrics['wall_ms'] or 0) / 1000:.6f}",
+        '# HELP financial_news_run_timestamp_seconds When the last run finished',
+        '# TYPE financial_news_run_timestamp_seconds gauge',
+        f'financial_news_run_timestamp_seconds {time.time():.0f}',
+        '# HELP financial_news_articles Unique articles in the last digest',
+        '# TYPE financial_news_articles gauge',
+        f"financial_news_articles {metrics['articles']}",
+        '# HELP financial_news_stage_seconds Time spent per pipeline stage in the last run',
+        '# TYPE financial_news_stage_seconds gauge'
+    ]
+    for stage, ms in metrics['stages'].items():
+        lines.append(f'financial_news_stage_seconds{{stage="{stage}"}} {ms / 1000:.6f}')
+
+    # Every metric family's samples have to be contiguous
+    feeds = [(f'feed="{prometheus_label(name)}"', feed) for name, feed in metrics['feeds'].items()]
+
+    lines += ['# HELP financial_news_feed_up 1 if the feed was fetched and parsed',
+              '# TYPE financial_news_feed_up gauge']
+    for label, feed in feeds:
+        lines.append(f"financial_news_feed_up{{{label}}} {1 if feed.get('ok') else 0}")
+
+    lines += ['# HELP financial_news_feed_latency_seconds Feed download and parse latency by phase',
+              '# TYPE financial_news_feed_latency_seconds gauge']
+    for label, feed in feeds:
+        for latency in FEED_LATENCIES + ('parse_ms',):
+            if feed.get(latency) is not None:
+                phase = latency[:-3]
+                lines.append(f'financial_news_feed_latency_seconds{{{label},phase="{phase}"}} {feed[latency] / 1000:.6f}')
+
+    lines += ['# HELP financial_news_feed_bytes Feed size on the wire',
+              '# TYPE financial_news_feed_bytes gauge']
+    for label, feed in feeds:
+        lines.append(f"financial_news_feed_bytes{{{label}}} {feed.get('bytes', 0)}")
+
+    lines += ['# HELP financial_news_feed_entries Feed entries by filter step',
+              '# TYPE financial_news_feed_entries gauge']
+    for label, feed in feeds:
+        for count in FEED_COUNTS:
+            lines.append(f'financial_news_feed_entries{{{label},kind="{count}"}} {feed.get(count, 0)}')
+
+    write_atomic(path, '\n'.join(lines) + '\n')
+
+def write_metrics(metrics, report_path=RUN_REPORT_PATH, prometheus_path=None):
+    """Write the JSON run report (and the Prometheus textfile when asked)"""
+    try:
+        write_run_report(metrics, report_path)
+        if prometheus_path:
+            write_prometheus(metrics, prometheus_path)
+    except OSError as e:
+        print('⚠ Error writing metrics: ' + str(e))
+        return
+
+    slowest = sorted(metrics['stages'].items(), key=lambda item: item[1], reverse=True)[:3]
+    print('⏱️  Run took ' + f"{(metrics['wall_ms'] or 0) / 1000:.1f}s - slowest stages: "
+          + ', '.join(f'{stage} {ms / 1000:.2f}s' for stage, ms in slowest))
+    print('📈 Run report written to ' + report_path)
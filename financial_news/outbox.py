@@ -0,0 +1,193 @@
+import sqlite3
+import time
+from datetime import datetime
+
+# ============================================
+# CONFIGURATION
+# ============================================
+OUTBOX_PATH = 'outbox.db'
+MAX_ATTEMPTS = 5  # Per part, per delivery pass
+BASE_BACKOFF_SECONDS = 2  # Doubled on every retry of a 5xx / timeout
+MAX_BACKOFF_SECONDS = 60
+PART_DELAY_SECONDS = 1  # Pause between parts to the same chat
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS outbox (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id TEXT NOT NULL,
+    recipient TEXT NOT NULL,
+    part INTEGER NOT NULL,
+    total_parts INTEGER NOT NULL,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT,
+    updated_at TEXT,
+    UNIQUE (run_id, recipient, part)
+);
+CREATE INDEX IF NOT EXISTS idx_outbox_run_status ON outbox (run_id, status);
+'''
+
+# ============================================
+# OPEN / ENQUEUE
+# ============================================
+def open_outbox(path=OUTBOX_PATH):
+    """Open (and create if needed) the SQLite outbox"""
+    conn = sqlite3.connect(path)
+    conn.executescript(SCHEMA)
+    return conn
+
+def new_run_id():
+    """Run identifier used to group the parts of one digest"""
+    return datetime.now().strftime('%Y%m%d-%H%M%S-%f')
+
+def enqueue_digest(conn, run_id, deliveries):
+    """
+    Journal every (recipient, part) of a digest as pending
+    deliveries: list of (recipient, messages) tuples
+    """
+    rows = []
+    for recipient, messages in deliveries:
+        for i, msg in enumerate(messages):
+            rows.append((run_id, str(recipient), i + 1, len(messages), msg))
+
+    with conn:
+        conn.executemany(
+            'INSERT OR IGNORE INTO outbox (run_id, recipient, part, total_parts, payload) '
+            'VALUES (?, ?, ?, ?, ?)',
+            rows
+        )
+    return len(rows)
+
+def latest_pending_run(conn):
+    """Return the most recent run_id that still has undelivered parts"""
+    row = conn.execute(
+        "SELECT run_id FROM outbox WHERE status = 'pending' ORDER BY run_id DESC LIMIT 1"
+    ).fetchone()
+    return row[0] if row else None
+
+def _mark(conn, row_id, status, attempts, error=None):
+    with conn:
+        conn.execute(
+            'UPDATE outbox SET status = ?, attempts = ?, last_error = ?, updated_at = ? WHERE id = ?',
+            (status, attempts, error, datetime.now().isoformat(timespec='seconds'), row_id)
+        )
+
+# ============================================
+# SEND WITH RETRY
+# ============================================
+def send_part(url, recipient, text):
+    """
+    Send one message part
+    Returns: (outcome, retry_after_seconds, error) with outcome in
+    'sent', 'retry' (429 / 5xx / timeout) or 'failed' (permanent 4xx)
+    """
+    import requests
+    
+    data = {
+        'chat_id': recipient,
+        'text': text,
+        'parse_mode': 'Markdown',
+        'disable_web_page_preview': True
+    }
+
+    try:
+        response = requests.post(url, json=data, timeout=15)
+    except requests.Timeout:
+        return 'retry', None, 'timeout'
+    except Exception as e:
+        return 'retry', None, str(e)[:100]
+
+    if response.status_code == 200:
+        return 'sent', None, None
+
+    try:
+        body = response.json()
+    except Exception:
+        body = {}
+
+    error = str(response.status_code) + ' ' + str(body.get('description', ''))[:100]
+
+    if response.status_code == 429:
+        retry_after = body.get('parameters', {}).get('retry_after')
+        if retry_after is None:
+            retry_after = response.headers.get('Retry-After')
+        try:
+            retry_after = float(retry_after)
+        except (TypeError, ValueError):
+            retry_after = None
+        return 'retry', retry_after, error
+
+    if response.status_code >= 500:
+        return 'retry', None, error
+
+    return 'failed', None, error
+
+def deliver_pending(conn, token, run_id):
+    """
+    Deliver every pending part of run_id, in part order per recipient.
+    429 honours retry_after, 5xx / timeouts back off exponentially.
+    A part that still fails stays pending (for --resume) and the rest
+    of that recipient's digest is held back so parts never arrive out of order.
+    Returns: dict with sent / failed / pending counts
+    """
+    url = 'https://api.telegram.org/bot' + token + '/sendMessage'
+
+    rows = conn.execute(
+        "SELECT id, recipient, part, total_parts, payload, attempts FROM outbox "
+        "WHERE run_id = ? AND status = 'pending' ORDER BY recipient, part",
+        (run_id,)
+    ).fetchall()
+
+    summary = {'sent': 0, 'failed': 0, 'pending': 0}
+    blocked_recipients = set()
+    current_recipient = None
+
+    for row_id, recipient, part, total_parts, payload, attempts in rows:
+        if recipient in blocked_recipients:
+            summary['pending'] += 1
+            continue
+
+        if recipient != current_recipient:
+            print('\n📤 Sending to: ' + str(recipient)[:3] + '...')
+            current_recipient = recipient
+        else:
+            time.sleep(PART_DELAY_SECONDS)
+
+        print('  Part ' + str(part) + '/' + str(total_parts))
+
+        backoff = BASE_BACKOFF_SECONDS
+        outcome = 'retry'
+        error = None
+
+        for attempt in range(MAX_ATTEMPTS):
+            attempts += 1
+            outcome, retry_after, error = send_part(url, recipient, payload)
+
+            if outcome != 'retry' or attempt == MAX_ATTEMPTS - 1:
+                break
+
+            if retry_after is not None:
+                wait = retry_after
+                print(f'  ⏳ Rate limited - retrying after {wait:.0f}s')
+            else:
+                wait = backoff
+                backoff = min(backoff * 2, MAX_BACKOFF_SECONDS)
+                print(f'  ⚠️  {error} - retrying in {wait:.0f}s')
+            time.sleep(wait)
+
+        if outcome == 'sent':
+            print('  ✅ Sent')
+            _mark(conn, row_id, 'sent', attempts)
+            summary['sent'] += 1
+        elif outcome == 'failed':
+            print('  ❌ Error: ' + str(error))
+            _mark(conn, row_id, 'failed', attempts, error)
+            summary['failed'] += 1
+        else:
+            print('  ❌ Giving up for now (left pending): ' + str(error))
+            _mark(conn, row_id, 'pending', attempts, error)
+            summary['pending'] += 1
+            blocked_recipients.add(recipient)
+
+    return summary
@@ -0,0 +1,502 @@
+import argparse
+import os
+import socket
+import sys
+import time
+from datetime import datetime
+
+from .config import TIME_WINDOW_HOURS, DIGEST_TIMES_UTC, SOCKET_TIMEOUT, FETCH_WORKERS
+from .config_bundle import load_bundle
+from .dedup import is_duplicate_advanced
+from .trending import update_trend_counts
+from .digest_state import load_state, save_state, split_expired
+from .article_store import (open_store, record_feeds, record_articles, record_fetch_attempts,
+                            query_articles, feed_health_report)
+from .outbox import open_outbox, latest_pending_run, deliver_pending
+from .metrics import (RUN_REPORT_PATH, new_run_metrics, timed, record_fetch, record_feed_counts, finish_run,
+                      write_metrics)
+from .profiling import new_profiler, profile_stage, dump_profiles
+from .poll_schedule import parse_digest_time
+from .feed_cache import FEED_CACHE_MAX_AGE_MINUTES, load_feed_cache
+from .sharding import (PARTIAL_PATH, parse_shard, shard_feeds, new_partial, add_feed, write_partial, load_partials,
+                       merge_partials, merged_trend_counts)
+from .digest_artifact import ARTIFACT_PATH, write_artifact, load_artifact
+from .stages import (fetch_stream, filter_entries, categorize, dedup, print_feed_result, trend, new_trend_counts,
+                     render, send, print_run_summary)
+
+# ============================================
+# COMMAND LINE
+# ============================================
+def build_parser():
+    parser = argparse.ArgumentParser(description='Financial News Aggregator')
+    parser.add_argument('--resume', action='store_true',
+                        help='Deliver undelivered parts of the last digest from the outbox and exit')
+    parser.add_argument('--daemon', action='store_true',
+                        help='Keep running: poll each feed on its own schedule and send digests at --digest-at times')
+    parser.add_argument('--digest-at', action='append', metavar='HH:MM',
+                        help='Digest time in UTC for --daemon (repeatable, default: 01:00)')
+    parser.add_argument('--incremental', action='store_true',
+                        help='Reuse the previous run\'s processed articles and only process newer entries')
+    parser.add_argument('--delta', action='store_true',
+                        help='With --incremental: send only articles new since the last digest')
+    parser.add_argument('--from-store', action='store_true',
+                        help='Build the digest from the SQLite article store without fetching feeds')
+    parser.add_argument('--feed-health', action='store_true',
+                        help='Print a per-feed health report from the article store and exit')
+    parser.add_argument('--report', default=RUN_REPORT_PATH, metavar='PATH',
+                        help='JSON run report with per-stage and per-feed metrics (default: run_report.json)')
+    parser.add_argument('--prometheus-file', metavar='PATH',
+                        help='Also write the metrics in Prometheus textfile-collector format')
+    parser.add_argument('--profile', metavar='DIR',
+                        help='Profile every stage (cProfile + tracemalloc) and write the results to DIR')
+    parser.add_argument('--record', metavar='DIR',
+                        help='Save every feed response to DIR for --replay')
+    parser.add_argument('--replay', metavar='DIR',
+                        help='Read feeds from a --record DIR instead of the network')
+    parser.add_argument('--feed-cache-max-age', type=int, default=FEED_CACHE_MAX_AGE_MINUTES, metavar='MINUTES',
+                        help='Use feeds the validator fetched within MINUTES (default: 30, 0 = always download)')
+    parser.add_argument('--fetch-workers', type=int, default=FETCH_WORKERS, metavar='N',
+                        help='Feeds downloaded at once while earlier ones are processed (default: 8, 1 = one by one)')
+    parser.add_argument('--categorize', choices=('keywords', 'vector'), default='keywords',
+                        help='Topic engine: keyword scoring per article, or one sparse-matrix batch per feed '
+                             '(same topics, needs numpy + scipy)')
+    parser.add_argument('--topic-history', type=int, default=0, metavar='DAYS',
+                        help='With --categorize vector: give articles without topic keywords the topic of the '
+                             'closest TF-IDF centroid of stored articles from the last DAYS')
+    parser.add_argument('--shard', metavar='I/N',
+                        help='Fetch and filter only shard I of N of the feeds and write a partial result (no digest)')
+    parser.add_argument('--partial', metavar='PATH',
+                        help='Partial result file for --shard (default: partial-I-of-N.json)')
+    parser.add_argument('--reduce', nargs='+', metavar='PATH',
+                        help='Build the digest from --shard partials (files or directories holding them)')
+    parser.add_argument('--artifact', default=ARTIFACT_PATH, metavar='PATH',
+                        help='Digest artifact written before sending (default: digest.jsonl)')
+    parser.add_argument('--from-artifact', metavar='PATH',
+                        help='Render and send the digest of an --artifact file - no fetching or processing')
+    return parser
+
+def parse_args(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    for hhmm in args.digest_at or ():
+        try:
+            parse_digest_time(hhmm)
+        except ValueError as e:
+            parser.error(f'--digest-at: {e}')
+    if args.shard:
+        try:
+            args.shard = parse_shard(args.shard)
+        except ValueError as e:
+            parser.error(f'--shard {args.shard}: {e}')
+    if (args.shard or args.reduce) and (args.incremental or args.delta or args.from_store or args.daemon):
+        parser.error('--shard / --reduce are full runs: not combinable with --incremental, --delta, '
+                     '--from-store or --daemon')
+    if args.shard and args.reduce:
+        parser.error('--shard and --reduce are separate steps')
+    if args.from_artifact and (args.shard or args.reduce or args.incremental or args.delta or args.from_store
+                               or args.daemon):
+        parser.error('--from-artifact only renders and sends: not combinable with other run modes')
+    return args
+
+# ============================================
+# ARTICLE STORE
+# ============================================
+def store_run(feeds, feed_stats, new_articles):
+    """Write fetch attempts and new articles to the SQLite store"""
+    try:
+        store = open_store()
+        record_feeds(store, feeds)
+
+        attempts = []
+        for feed_name, stats in feed_stats.items():
+            attempts.append({
+                'feed_url': feeds[feed_name]['url'],
+                'ok': not stats.get('error'),
+                'duration_ms': stats.get('duration_ms'),
+                'entries': stats.get('total', 0),
+                'recent': stats.get('recent', 0),
+                'relevant': stats.get('relevant', 0),
+                'duplicates': stats.get('duplicates', 0),
+                'error': stats.get('error')
+            })
+        record_fetch_attempts(store, attempts)
+
+        inserted = record_articles(store, new_articles)
+        store.close()
+        print(f'💾 Article store: {inserted} new articles, {len(attempts)} fetch attempts recorded')
+    except Exception as e:
+        print('⚠ Error writing article store: ' + str(e))
+
+def print_feed_health(days=7):
+    """Per-feed health over the last days, from the article store"""
+    store = open_store()
+    since = int(time.time()) - days * 86400
+
+    print('\n' + '=' * 60)
+    print(f'FEED HEALTH (last {days} days)')
+    print('=' * 60)
+
+    for name, acronym, url, attempts, successes, avg_ms, avg_relevant, last_ok in feed_health_report(store, since):
+        if not attempts:
+            print(f'  ⚪ {name}: never fetched')
+            continue
+        status = '✅' if successes == attempts else ('⚠️ ' if successes else '❌')
+        last_ok_str = datetime.utcfromtimestamp(last_ok).strftime('%Y-%m-%d %H:%M') if last_ok else 'never'
+        print(f'  {status} {name}: {successes}/{attempts} ok, avg {avg_ms or 0:.0f}ms, '
+              f'avg {avg_relevant or 0:.1f} relevant, last ok {last_ok_str}')
+
+# ============================================
+# TOPIC ENGINE
+# ============================================
+def set_vector_engine(config, history_days=0):
+    """Categorize with categorize_vector, optionally with centroids from the article store"""
+    from . import categorize_vector
+
+    if not categorize_vector.AVAILABLE:
+        print('⚠ --categorize vector needs numpy and scipy - using keyword categorization')
+        return
+
+    config['categorize_engine'] = 'vector'
+    config['topic_scanner'] = categorize_vector.topic_scanner(config['topic_index'])
+    if not history_days:
+        return
+
+    try:
+        store = open_store()
+        since = int(time.time()) - history_days * 86400
+        texts = [categorize_vector.article_text(a.title, a.description) for a in query_articles(store, since)]
+        store.close()
+    except Exception as e:
+        print('⚠ Error reading topic history: ' + str(e))
+        return
+
+    config['topic_centroids'] = categorize_vector.topic_centroids(texts, config['topic_index'])
+    if config['topic_centroids']:
+        print(f"✓ Topic centroids from {len(texts)} stored articles, {len(config['topic_centroids']['vocabulary'])} terms")
+    else:
+        print('⚠ No stored articles with topic keywords - no topic centroids')
+
+# ============================================
+# MODES
+# ============================================
+def resume(token):
+    """Deliver leftovers of the last digest from the outbox, no rebuild"""
+    if not token:
+        print('\n❌ ERROR: Missing TELEGRAM_BOT_TOKEN')
+        return 1
+
+    outbox = open_outbox()
+    run_id = latest_pending_run(outbox)
+
+    if not run_id:
+        print('\n✅ Outbox empty - nothing to resume')
+        return 0
+
+    print('\n' + '=' * 60)
+    print('RESUMING DELIVERY OF RUN ' + run_id)
+    print('=' * 60)
+
+    result = deliver_pending(outbox, token, run_id)
+    print(f"\nSent: {result['sent']}, rejected: {result['failed']}, still pending: {result['pending']}")
+    return 1 if result['pending'] else 0
+
+def render_and_send(config, token, articles, trending_topics, metrics, artifact=None, feed_stats=None):
+    """Render and send the digest, first writing it to the artifact path when given"""
+    date = datetime.now()  # The digest's date, in the artifact and the messages alike
+    if artifact:
+        with timed(metrics, 'artifact'):
+            write_artifact(artifact, articles, trending_topics, config['topics'], feed_stats, metrics['mode'], date)
+    with timed(metrics, 'render'):
+        deliveries = render(config['recipients'], articles, trending_topics, config['topics'], date)
+    with timed(metrics, 'send'):
+        send(deliveries, token)
+
+def digest_from_store(config, token, metrics, artifact=None):
+    """Build and send the digest from stored articles without fetching"""
+    store = open_store()
+    since = int(time.time()) - TIME_WINDOW_HOURS * 3600
+    stored = query_articles(store, since)
+
+    # Articles of different runs were only deduplicated within their run
+    articles = []
+    with timed(metrics, 'dedup'):
+        for article in reversed(stored):
+            if not is_duplicate_advanced(article, articles, config['entity_matcher']):
+                articles.append(article)
+
+    print(f'\n✓ Loaded {len(stored)} articles from the store ({len(stored) - len(articles)} cross-run duplicates)')
+    with timed(metrics, 'trending'):
+        trending_topics = trend(articles)
+    render_and_send(config, token, articles, trending_topics, metrics, artifact)
+    finish_run(metrics, len(articles))
+
+def process_feeds(config, feeds, metrics, seen_urls, now, state=None, archive=None, feed_cache=None,
+                  workers=FETCH_WORKERS):
+    """
+    Streaming fetch → filter → categorize, one feed at a time in feeds
+    order while the next feeds download (see stages.fetch_stream()).
+    A parsed feed is dropped as soon as its candidates are taken, so
+    memory holds at most FETCH_AHEAD feeds however many there are.
+    Every feed is filtered against the same run clock now (UTC epoch).
+    Advances the incremental state's high-water marks.
+    Yields: (feed_name, stats, articles) - the feed's categorized candidates
+    """
+    profiler = metrics.get('profiler')
+    stream = fetch_stream(feeds, archive, feed_cache, workers)
+    while True:
+        # Profiled per feed: with workers the fetch stage is the wait for the next parsed feed
+        with profile_stage(profiler, 'fetch'):
+            fetched = next(stream, None)
+        if fetched is None:
+            return
+
+        feed_name, result = fetched
+        feed_info = feeds[feed_name]
+        record_fetch(metrics, feed_name, feed_info, result)
+        high_water = state['high_water'].get(feed_info['url']) if state else None
+
+        with timed(metrics, 'relevance'):
+            candidates, stats = filter_entries(
+                feed_name, feed_info, result['feed'], config['keyword_matcher'], seen_urls, high_water, now
+            )
+        stats['duration_ms'] = result['duration_ms']
+        if result['error']:
+            stats['error'] = result['error']
+        if result.get('truncated'):
+            stats['truncated'] = result['truncated']
+        if result.get('entries_capped'):
+            stats['entries_capped'] = True
+
+        if state and stats['newest']:
+            state['high_water'][feed_info['url']] = max(high_water or 0, stats['newest'])
+
+        with timed(metrics, 'categorize'):
+            articles = categorize(candidates, config)
+        yield feed_name, stats, articles
+
+def report_results(feeds, feed_stats, articles, new_articles, metrics):
+    """Per-feed results and summaries after dedup; records the run in the article store"""
+    record_feed_counts(metrics, feed_stats)
+
+    print('\n' + '=' * 60)
+    print('RESULTS BY FEED')
+    print('=' * 60)
+    for feed_name, stats in feed_stats.items():
+        print('\n' + feed_name + ':')
+        print_feed_result(stats)
+
+    print_run_summary(articles, feed_stats, feeds)
+    store_run(feeds, feed_stats, new_articles)
+
+def run_once(config, token, metrics, incremental=False, delta=False, archive=None, feed_cache=None,
+             workers=FETCH_WORKERS, artifact=None):
+    """One full run: fetch → filter → categorize → dedup → trend → render → send"""
+    feeds = config['feeds']
+    now = int(time.time())  # One clock for the window of every feed and the carried-over articles
+    articles = []
+    seen_urls = set()
+    trend_counts = None
+    state = None
+
+    # Incremental mode - carry over processed articles
+    if incremental or delta:
+        state = load_state()
+        articles, expired = split_expired(state['articles'], TIME_WINDOW_HOURS, now)
+        seen_urls = {a.url for a in articles}
+        trend_counts = state['trend_counts']
+
+        if trend_counts and expired:
+            update_trend_counts(trend_counts, expired, remove=True)
+
+        print(f'Carried over {len(articles)} articles, evicted {len(expired)} outside the {TIME_WINDOW_HOURS}h window')
+
+    feed_stats = {}
+    new_articles = []
+    for feed_name, stats, candidates in process_feeds(config, feeds, metrics, seen_urls, now, state, archive,
+                                                      feed_cache, workers):
+        feed_stats[feed_name] = stats
+        with timed(metrics, 'dedup'):
+            new_articles.extend(dedup(candidates, articles, feed_stats, config['entity_matcher']))
+
+    report_results(feeds, feed_stats, articles, new_articles, metrics)
+
+    if state:
+        if trend_counts is None:
+            trend_counts = new_trend_counts(articles)
+        else:
+            update_trend_counts(trend_counts, new_articles)
+
+    with timed(metrics, 'trending'):
+        trending_topics = trend(articles, trend_counts)
+
+    if delta:
+        print(f'\n📨 Delta digest: {len(new_articles)} articles new since the last digest')
+        if new_articles:
+            render_and_send(config, token, new_articles, trending_topics, metrics, artifact, feed_stats)
+        else:
+            print('Nothing new - no digest sent')
+    else:
+        render_and_send(config, token, articles, trending_topics, metrics, artifact, feed_stats)
+    finish_run(metrics, len(new_articles) if delta else len(articles))
+
+    if state:
+        state['articles'] = articles
+        state['trend_counts'] = trend_counts
+        state['last_digest'] = datetime.now().isoformat(timespec='seconds')
+        save_state(state)
+        print(f'💾 Saved state: {len(articles)} articles for the next incremental run')
+
+def run_shard(config, metrics, shard, shards, path, archive=None, feed_cache=None, workers=FETCH_WORKERS):
+    """
+    Map side of a sharded run: fetch, filter and categorize the feeds of
+    one shard and write them as a partial result for reduce_partials()
+    """
+    feeds = shard_feeds(config['feeds'], shard, shards)
+    print(f"Shard {shard}/{shards}: {len(feeds)} of {len(config['feeds'])} feeds")
+
+    partial = new_partial(shard, shards)
+    count = 0
+    for feed_name, stats, articles in process_feeds(config, feeds, metrics, set(), int(time.time()), None, archive,
+                                                     feed_cache, workers):
+        add_feed(partial, feed_name, stats, articles, config['entity_matcher'])
+        count += len(articles)
+    write_partial(partial, metrics, path or PARTIAL_PATH.format(shard=shard, shards=shards))
+    finish_run(metrics, count)
+
+def reduce_partials(config, token, metrics, paths, artifact=None):
+    """
+    Reduce side of a sharded run: merge the shards' partials, then dedup,
+    trend, render and send - the same digest a single run_once() builds
+    """
+    feeds = config['feeds']
+    partials = load_partials(paths)
+    if not partials:
+        print('\n❌ ERROR: No shard partials found in ' + ', '.join(paths))
+        return 1
+
+    candidates, feed_stats, ngrams = merge_partials(partials, feeds, metrics)
+
+    articles = []
+    with timed(metrics, 'dedup'):
+        dedup(candidates, articles, feed_stats, config['entity_matcher'])
+    report_results(feeds, feed_stats, articles, articles, metrics)
+
+    with timed(metrics, 'trending'):
+        trending_topics = trend(articles, merged_trend_counts(articles, ngrams))
+    render_and_send(config, token, articles, trending_topics, metrics, artifact, feed_stats)
+    finish_run(metrics, len(articles))
+    return 0
+
+def send_artifact(config, token, metrics, path):
+    """
+    Render and send a digest from its artifact alone (re-send, another
+    edition, a changed message format): dated as the original digest,
+    topics in its order, for the current recipients
+    """
+    try:
+        artifact = load_artifact(path)
+    except (OSError, ValueError) as e:
+        print('\n❌ ERROR: ' + str(e))
+        return 1
+
+    articles = artifact['articles']
+    print(f"\n📦 Digest artifact {path}: {artifact['mode']} digest of {artifact['created']:%Y-%m-%d %H:%M} UTC, "
+          f"{len(articles)} articles, {len(artifact['trending'])} trending topics")
+
+    with timed(metrics, 'render'):
+        deliveries = render(config['recipients'], articles, artifact['trending'], artifact['topics'],
+                            artifact['date'])
+    with timed(metrics, 'send'):
+        send(deliveries, token)
+    finish_run(metrics, len(articles))
+    return 0
+
+# ============================================
+# ENTRY POINT
+# ============================================
+def main(argv=None, feed_cache=None):
+    """feed_cache: feeds already downloaded in this process ({url: compact feed}, see cli)"""
+    args = parse_args(argv)
+    socket.setdefaulttimeout(SOCKET_TIMEOUT)
+    token = os.getenv('TELEGRAM_BOT_TOKEN')
+
+    print('=' * 60)
+    print('Starting Financial News Aggregator...')
+    print('=' * 60)
+
+    if args.resume:
+        sys.exit(resume(token))
+
+    config = load_bundle()
+
+    if not config['feeds'] and not args.from_artifact:
+        print('ERROR: No feeds loaded!')
+        sys.exit(1)
+
+    if args.feed_health:
+        print_feed_health()
+        return
+
+    def set_engine(bundle):
+        if args.categorize == 'vector':
+            set_vector_engine(bundle, args.topic_history)
+
+    set_engine(config)
+
+    if args.daemon:
+        from .daemon import run_daemon
+        # A reloaded bundle is compiled from the config files alone: set the topic engine on it again
+        run_daemon(config, token, args.digest_at or DIGEST_TIMES_UTC, store_run,
+                   lambda metrics: write_metrics(metrics, args.report, args.prometheus_file), set_engine)
+        return
+
+    archive = None
+    if args.replay:
+        archive = {'mode': 'replay', 'dir': args.replay}
+        print('📼 Replaying feeds recorded in ' + args.replay)
+    elif args.record:
+        archive = {'mode': 'record', 'dir': args.record}
+
+    if args.from_artifact:
+        metrics = new_run_metrics('from-artifact')
+    elif args.from_store:
+        metrics = new_run_metrics('from-store')
+    elif args.shard:
+        metrics = new_run_metrics('shard')
+    elif args.reduce:
+        metrics = new_run_metrics('reduce')
+    else:
+        metrics = new_run_metrics('delta' if args.delta else 'incremental' if args.incremental else 'run')
+    if args.profile:
+        metrics['profiler'] = new_profiler(args.profile)
+
+    if args.from_artifact:
+        if send_artifact(config, token, metrics, args.from_artifact):
+            sys.exit(1)
+    elif args.from_store:
+        digest_from_store(config, token, metrics, args.artifact)
+    elif args.reduce:
+        if reduce_partials(config, token, metrics, args.reduce, args.artifact):
+            sys.exit(1)
+    else:
+        # --record / --replay archive real downloads, not the validator's copies
+        if archive:
+            feed_cache = None
+        elif feed_cache is None:
+            feed_cache = load_feed_cache(args.feed_cache_max_age)
+        # Stage profiles are per thread: profile one feed at a time
+        workers = 1 if args.profile else args.fetch_workers
+        if args.shard:
+            run_shard(config, metrics, *args.shard, args.partial, archive, feed_cache, workers)
+        else:
+            run_once(config, token, metrics, args.incremental, args.delta, archive, feed_cache, workers,
+                     args.artifact)
+    write_metrics(metrics, args.report, args.prometheus_file)
+
+    if args.profile:
+        dump_profiles(metrics['profiler'])
+
+    print('\n' + '=' * 60)
+    print('Script completed')
+    print('=' * 60)
@@ -0,0 +1,136 @@
+import calendar
+import time
+from datetime import datetime, timedelta
+
+# ============================================
+# CONFIGURATION
+# ============================================
+MIN_POLL_MINUTES = 5
+MAX_POLL_MINUTES = 180
+DEFAULT_POLL_MINUTES = 30  # Until we have seen a feed's cadence
+DIGEST_GRACE_MINUTES = 15  # A digest slot stays due this long after HH:MM
+
+# sy:updatePeriod -> minutes
+UPDATE_PERIOD_MINUTES = {
+    'hourly': 60,
+    'daily': 60 * 24,
+    'weekly': 60 * 24 * 7,
+    'monthly': 60 * 24 * 30,
+    'yearly': 60 * 24 * 365
+}
+
+# ============================================
+# PER-FEED SCHEDULE
+# ============================================
+def new_schedule():
+    """Schedule state for a feed that has never been polled"""
+    return {
+        'next_poll': 0,
+        'interval': DEFAULT_POLL_MINUTES,
+        'failures': 0,
+        'etag': None,
+        'modified': None
+    }
+
+def entry_timestamps(feed):
+    """UTC epoch seconds of every dated entry in a parsed feed"""
+    timestamps = []
+    for entry in feed.entries:
+        parsed = entry.get('published_parsed') or entry.get('updated_parsed')
+        if parsed:
+            try:
+                timestamps.append(calendar.timegm(parsed))
+            except (TypeError, ValueError, OverflowError):
+                pass
+    return timestamps
+
+def hint_minutes(feed):
+    """
+    Publisher hint for how often the feed changes, in minutes:
+    <ttl> or sy:updatePeriod / sy:updateFrequency. None if absent.
+    """
+    channel = feed.get('feed', {})
+
+    ttl = channel.get('ttl')
+    if ttl:
+        try:
+            return float(ttl)
+        except (TypeError, ValueError):
+            pass
+
+    period = str(channel.get('sy_updateperiod', '')).strip().lower()
+    if period in UPDATE_PERIOD_MINUTES:
+        try:
+            frequency = max(1, int(channel.get('sy_updatefrequency', 1)))
+        except (TypeError, ValueError):
+            frequency = 1
+        return UPDATE_PERIOD_MINUTES[period] / frequency
+
+    return None
+
+def cadence_minutes(timestamps):
+    """Median gap between consecutive publish times, in minutes (None if unknown)"""
+    timestamps = sorted(set(timestamps), reverse=True)[:30]
+    if len(timestamps) < 3:
+        return None
+
+    gaps = sorted((a - b) / 60 for a, b in zip(timestamps, timestamps[1:]))
+    return gaps[len(gaps) // 2]
+
+def record_poll(schedule, feed, timestamps, failed=False):
+    """
+    Update a feed's schedule after a poll.
+    Busy feeds are polled about once per new item, never more often than
+    their ttl / updatePeriod hint; failures back off exponentially.
+    """
+    if failed:
+        schedule['failures'] += 1
+        interval = DEFAULT_POLL_MINUTES * (2 ** schedule['failures'])
+    else:
+        schedule['failures'] = 0
+
+        # A 304 may omit the validators; keep the last ones sent
+        if feed is not None:
+            for key in ('etag', 'modified'):
+                if feed.get(key):
+                    schedule[key] = feed[key]
+
+        interval = cadence_minutes(timestamps) if timestamps else None
+        if interval is None:
+            interval = schedule['interval']
+
+        hint = hint_minutes(feed) if feed is not None else None
+        if hint:
+            interval = max(interval, hint)
+
+    schedule['interval'] = min(MAX_POLL_MINUTES, max(MIN_POLL_MINUTES, interval))
+    schedule['next_poll'] = time.time() + schedule['interval'] * 60
+    return schedule
+
+# ============================================
+# DIGEST SCHEDULE
+# ============================================
+def parse_digest_time(hhmm):
+    """'07:30' -> (7, 30); raises ValueError for anything but a valid 24-hour HH:MM"""
+    hour, sep, minute = hhmm.partition(':')
+    if not (sep and hour.isdigit() and minute.isdigit() and len(minute) == 2
+            and int(hour) < 24 and int(minute) < 60):
+        raise ValueError(f'{hhmm!r} is not a HH:MM time (00:00-23:59)')
+    return int(hour), int(minute)
+
+def due_digest_slot(digest_times, now=None):
+    """
+    Return 'YYYY-MM-DD HH:MM' for the digest time (UTC) that is currently
+    due, or None. A slot stays due for DIGEST_GRACE_MINUTES.
+    """
+    now = now or datetime.utcnow()
+
+    for hhmm in digest_times:
+        hour, minute = parse_digest_time(hhmm)
+        slot = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        if slot > now:
+            slot = slot - timedelta(days=1)
+        if now - slot <= timedelta(minutes=DIGEST_GRACE_MINUTES):
+            return slot.strftime('%Y-%m-%d %H:%M')
+
+    return None
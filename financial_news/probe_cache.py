@@ -0,0 +1,53 @@
+import json
+import os
+import time
+
+# ============================================
+# CONFIGURATION
+# ============================================
+PROBE_CACHE_PATH = 'discovery_cache.json'
+
+# How long a probe result is trusted, by outcome (hours)
+PROBE_TTL_HOURS = {
+    'ok': 24,        # Known-good: recent entries
+    'stale': 72,     # Entries, none recent
+    'empty': 72,     # Parsed, no entries
+    'http': 168,     # 404 / 410 / 5xx ...
+    'error': 168,    # DNS, TLS, refused ...
+    'timeout': 24    # Often transient
+}
+
+# ============================================
+# PROBE RESULT CACHE (discover_feeds.py)
+# ============================================
+# {url: {'outcome': one of PROBE_TTL_HOURS, 'checked_at': epoch, ...probe fields}}
+# A cached result is reused until its outcome's TTL runs out, so a re-run
+# only probes new or expired candidates.
+
+def load_probe_cache(path=PROBE_CACHE_PATH):
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_probe_cache(cache, path=PROBE_CACHE_PATH):
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(cache, f, indent=1, sort_keys=True)
+    os.replace(tmp_path, path)
+
+def fresh_probe(cache, url, now=None):
+    """The cached probe of url if it hasn't expired, else None"""
+    entry = cache.get(url)
+    if not entry:
+        return None
+
+    now = now or time.time()
+    ttl_hours = PROBE_TTL_HOURS.get(entry.get('outcome'), 0)
+    if now - entry.get('checked_at', 0) >= ttl_hours * 3600:
+        return None
+    return entry
+
+def store_probe(cache, url, result, now=None):
+    cache[url] = dict(result, checked_at=int(now or time.time()))
@@ -0,0 +1,126 @@
+from collections import defaultdict
+
+# ============================================
+# RECIPIENT PROFILES
+# ============================================
+# recipients.txt line format (everything after the chat id is optional):
+#   chat_id|topics=BANKING & FINANCE,INSURANCE|pubs=BS,ET|keywords=hdfc,lic|max_parts=3
+#
+# topics / pubs narrow the digest, keywords add any article mentioning
+# one of them on top, max_parts caps the number of messages sent.
+
+def default_profile():
+    """Profile that receives the full digest"""
+    return {'topics': None, 'pubs': None, 'keywords': None, 'max_parts': None}
+
+def parse_recipient_line(line):
+    """
+    Parse one recipients.txt line
+    Returns: (chat_id, profile)
+    """
+    parts = [p.strip() for p in line.split('|')]
+    chat_id = parts[0]
+    profile = default_profile()
+
+    for field in parts[1:]:
+        if '=' not in field:
+            continue
+
+        key, value = field.split('=', 1)
+        key = key.strip().lower()
+        values = tuple(v.strip() for v in value.split(',') if v.strip())
+
+        if key == 'topics':
+            profile['topics'] = tuple(sorted(v.upper() for v in values))
+        elif key in ('pubs', 'publications'):
+            profile['pubs'] = tuple(sorted(values))
+        elif key == 'keywords':
+            profile['keywords'] = tuple(sorted(v.lower() for v in values))
+        elif key == 'max_parts':
+            try:
+                profile['max_parts'] = max(1, int(value))
+            except ValueError:
+                pass
+
+    return chat_id, profile
+
+# ============================================
+# SHARED MATCHING INDEX
+# ============================================
+def build_match_index(articles):
+    """
+    Build the index over the article set shared by all recipients.
+    Topic / publication postings are built once; keyword postings are
+    filled in on first use and reused by every profile naming that keyword.
+    """
+    index = {
+        'articles': articles,
+        'all_ids': frozenset(range(len(articles))),
+        'by_topic': defaultdict(set),
+        'by_pub': defaultdict(set),
+        'texts': None,
+        'keyword_hits': {}
+    }
+
+    for i, article in enumerate(articles):
+        index['by_topic'][article.topic.upper()].add(i)
+        index['by_pub'][article.publication].add(i)
+
+    return index
+
+def keyword_hits(index, keyword):
+    """Article ids whose title/description contain keyword (cached)"""
+    if keyword not in index['keyword_hits']:
+        if index['texts'] is None:
+            index['texts'] = [(a.title + ' ' + a.description).lower() for a in index['articles']]
+        index['keyword_hits'][keyword] = frozenset(
+            i for i, text in enumerate(index['texts']) if keyword in text
+        )
+    return index['keyword_hits'][keyword]
+
+def select_articles(index, profile):
+    """Return the frozenset of article ids a profile subscribes to"""
+    if not profile['topics'] and not profile['pubs'] and not profile['keywords']:
+        return index['all_ids']
+
+    selected = set()
+
+    if profile['topics'] or profile['pubs']:
+        selected = set(index['all_ids'])
+        if profile['topics']:
+            selected &= set().union(*(index['by_topic'].get(t, ()) for t in profile['topics']))
+        if profile['pubs']:
+            selected &= set().union(*(index['by_pub'].get(p, ()) for p in profile['pubs']))
+
+    for keyword in profile['keywords'] or ():
+        selected |= keyword_hits(index, keyword)
+
+    return frozenset(selected)
+
+# ============================================
+# RENDER CACHE
+# ============================================
+def render_for_recipients(recipients, articles, render):
+    """
+    Build the message parts for every (chat_id, profile) recipient.
+    render(article_subset) is called once per distinct selection, so
+    recipients sharing a profile share the rendered parts.
+    Returns: (list of (chat_id, messages), number of renders)
+    """
+    index = build_match_index(articles)
+    cache = {}
+    deliveries = []
+
+    for chat_id, profile in recipients:
+        selected = select_articles(index, profile)
+
+        if selected not in cache:
+            cache[selected] = render([articles[i] for i in sorted(selected)])
+
+        messages = cache[selected]
+        if profile['max_parts']:
+            messages = messages[:profile['max_parts']]
+
+        deliveries.append((chat_id, messages))
+
+    return deliveries, len(cache)
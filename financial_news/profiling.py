@@ -0,0 +1,79 @@
+import cProfile
+import json
+import os
+import pstats
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+
+# ============================================
+# CONFIGURATION
+# ============================================
+TOP_ALLOCATIONS = 15  # Allocation sites kept per stage
+
+# ============================================
+# PER-STAGE cProfile + tracemalloc
+# ============================================
+# --profile DIR writes, for every stage that ran:
+#   DIR/<stage>.pstats   cProfile stats (python -m pstats DIR/dedup.pstats)
+#   DIR/memory.json      {stage: {'peak_kb', 'top_allocations': [{'site', 'size_kb', 'count'}]}}
+# tracemalloc is restarted for every stage, so peak_kb is the most the
+# stage itself had allocated at once and top_allocations are the blocks
+# it allocated and still held when it finished. A stage that runs several
+# times adds up into one entry (peak_kb is the highest of the runs).
+
+def new_profiler(profile_dir, top_n=TOP_ALLOCATIONS):
+    os.makedirs(profile_dir, exist_ok=True)
+    return {'dir': profile_dir, 'top_n': top_n, 'stages': {}}
+
+@contextmanager
+def profile_stage(profiler, stage):
+    """Profile the block as stage; does nothing when profiler is None"""
+    if profiler is None:
+        yield
+        return
+
+    entry = profiler['stages'].setdefault(stage, {
+        'profile': cProfile.Profile(), 'peak': 0, 'sizes': Counter(), 'counts': Counter()
+    })
+
+    # Fresh start: only this stage's allocations are traced
+    tracemalloc.start(1)
+    entry['profile'].enable()
+    try:
+        yield
+    finally:
+        entry['profile'].disable()
+        snapshot = tracemalloc.take_snapshot()
+        entry['peak'] = max(entry['peak'], tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+
+        for stat in snapshot.statistics('lineno'):
+            site = str(stat.traceback[0])
+            entry['sizes'][site] += stat.size
+            entry['counts'][site] += stat.count
+
+def dump_profiles(profiler):
+    """Write the .pstats files and memory.json, print the peak per stage"""
+    memory = {}
+
+    print('\n' + '=' * 60)
+    print('PROFILE (' + profiler['dir'] + ')')
+    print('=' * 60)
+
+    for stage, entry in profiler['stages'].items():
+        entry['profile'].dump_stats(os.path.join(profiler['dir'], stage + '.pstats'))
+        memory[stage] = {
+            'peak_kb': round(entry['peak'] / 1024, 1),
+            'top_allocations': [
+                {'site': site, 'size_kb': round(size / 1024, 1), 'count': entry['counts'][site]}
+                for site, size in entry['sizes'].most_common(profiler['top_n'])
+            ]
+        }
+
+        total_time = pstats.Stats(entry['profile']).total_tt
+        print(f"{stage}: {total_time:.3f}s profiled, peak {memory[stage]['peak_kb']:.0f} KB allocated")
+
+    with open(os.path.join(profiler['dir'], 'memory.json'), 'w') as f:
+        json.dump(memory, f, indent=2)
+    print('📦 Stage profiles written to ' + profiler['dir'])
@@ -0,0 +1,114 @@
+from collections import defaultdict
+from datetime import datetime
+
+from .config import MESSAGE_CHAR_LIMIT
+
+# ============================================
+# ESCAPE MARKDOWN
+# ============================================
+def escape_markdown_title(text):
+    """Escape only ] and \ for Telegram Markdown"""
+    text = text.replace('\\', '\\\\')
+    text = text.replace(']', '\\]')
+    return text
+
+# ============================================
+# BUILD TELEGRAM MESSAGES
+# ============================================
+def build_messages(articles, trending_topics, topics, date=None):
+    """Build the digest message parts for a set of articles (dated date, default: today)"""
+    date = date or datetime.now()
+    if not articles:
+        msg = '*Financial News Digest*\n' + date.strftime('%B %d, %Y') + '\n\nNo relevant articles found today.'
+        return [msg]
+    
+    articles = sorted(articles, key=lambda x: x.ts, reverse=True)
+    
+    by_topic = defaultdict(lambda: defaultdict(list))
+    for article in articles:
+        by_topic[article.topic][article.publication].append(article)
+    
+    messages = []
+    
+    # HEADER MESSAGE
+    header_msg = '*Financial News Digest*\n'
+    header_msg = header_msg + date.strftime('%B %d, %Y') + '\n\n'
+    
+    total_articles = len(articles)
+    all_pubs = set(article.publication for article in articles)
+    
+    header_msg = header_msg + str(total_articles) + ' articles from ' + str(len(all_pubs)) + ' publications\n'
+    header_msg = header_msg + '━━━━━━━━━━━━━━━━━\n\n'
+    
+    # Add trending section
+    if trending_topics:
+        header_msg = header_msg + '*🔥 TRENDING TODAY*\n\n'
+    
+        for trending in trending_topics:
+            header_msg = header_msg + '*' + trending['topic'] + '* (' + str(trending['count']) + ' articles)\n'
+            header_msg = header_msg + trending['summary'] + '\n\n'
+    
+        header_msg = header_msg + '━━━━━━━━━━━━━━━━━\n\n'
+    
+    messages.append(header_msg)
+    
+    # Build content messages with LARGER limit (3800 chars)
+    current_msg = ''
+    
+    for topic_config in topics:
+        topic_name = topic_config['name']
+    
+        if topic_name not in by_topic:
+            continue
+    
+        publications_in_topic = by_topic[topic_name]
+    
+        if not publications_in_topic:
+            continue
+    
+        topic_header = '*' + topic_name + '*\n\n'
+    
+        if current_msg and len(current_msg) + len(topic_header) > MESSAGE_CHAR_LIMIT:
+            messages.append(current_msg)
+            current_msg = ''
+    
+        current_msg = current_msg + topic_header
+    
+        for pub_acronym in sorted(publications_in_topic.keys()):
+            articles_from_pub = publications_in_topic[pub_acronym]
+        
+            if not articles_from_pub:
+                continue
+        
+            articles_from_pub = sorted(articles_from_pub, key=lambda x: x.ts, reverse=True)
+        
+            pub_header = '_' + pub_acronym + '_\n'
+        
+            if len(current_msg) + len(pub_header) > MESSAGE_CHAR_LIMIT:
+                messages.append(current_msg)
+                current_msg = topic_header + pub_header
+            else:
+                current_msg = current_msg + pub_header
+        
+            for i, article in enumerate(articles_from_pub, 1):
+                title_short = article.title
+            
+                if len(title_short) > 75:
+                    title_short = title_short[:72] + '...'
+            
+                title_escaped = escape_markdown_title(title_short)
+            
+                article_line = str(i) + '. [' + title_escaped + '](' + article.url + ')\n'
+            
+                if len(current_msg) + len(article_line) > MESSAGE_CHAR_LIMIT:
+                    messages.append(current_msg)
+                    current_msg = topic_header + pub_header + article_line
+                else:
+                    current_msg = current_msg + article_line
+        
+            current_msg = current_msg + '\n'
+    
+    if current_msg.strip():
+        messages.append(current_msg)
+    
+    return messages
@@ -0,0 +1,172 @@
+import glob
+import json
+import os
+import zlib
+from collections import Counter
+from datetime import datetime, timezone
+
+from .article import article_to_dict, article_from_dict
+from .dedup import article_signature
+from .metrics import write_atomic, add_stage_ms
+from .trending import title_ngrams
+
+# ============================================
+# CONFIGURATION
+# ============================================
+PARTIAL_VERSION = 1
+PARTIAL_PATH = 'partial-{shard}-of-{shards}.json'
+
+# ============================================
+# PARTITIONING
+# ============================================
+def parse_shard(value):
+    """'2/4' -> (2, 4); shards are numbered 1..N"""
+    shard, _, shards = value.partition('/')
+    shard, shards = int(shard), int(shards)
+    if not 1 <= shard <= shards:
+        raise ValueError(f'shard {shard} not in 1..{shards}')
+    return shard, shards
+
+def shard_of(url, shards):
+    """Shard (1..shards) of a feed URL - crc32, stable across processes and machines unlike hash()"""
+    return zlib.crc32(url.encode('utf-8')) % shards + 1
+
+def shard_feeds(feeds, shard, shards):
+    """The feeds of one shard, in feeds.txt order"""
+    return {name: info for name, info in feeds.items() if shard_of(info['url'], shards) == shard}
+
+# ============================================
+# PARTIAL RESULTS (map side)
+# ============================================
+# {
+#   'version': PARTIAL_VERSION,
+#   'shard': 1..shards, 'shards': N, 'created': ISO UTC time,
+#   'feeds': {feed_name: {'stats': filter stats,
+#                         'candidates': [article_to_dict() + 'ngrams': [bigrams, trigrams]]}},
+#   'metrics': {'stages': {stage: ms}, 'feeds': run metrics of the shard's feeds}
+# }
+
+def new_partial(shard, shards):
+    return {
+        'version': PARTIAL_VERSION,
+        'shard': shard,
+        'shards': shards,
+        'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'feeds': {},
+        'metrics': None
+    }
+
+def add_feed(partial, feed_name, stats, articles, matcher=None):
+    """
+    Categorized articles of one feed, with their dedup signature and trend n-grams precomputed
+    matcher: the config bundle's entity_matcher
+    """
+    candidates = []
+    for article in articles:
+        article_signature(article, matcher)
+        data = article_to_dict(article)
+        data['ngrams'] = list(title_ngrams(article.title))
+        candidates.append(data)
+    partial['feeds'][feed_name] = {'stats': stats, 'candidates': candidates}
+
+def write_partial(partial, metrics, path):
+    partial['metrics'] = {'stages': metrics['stages'], 'feeds': metrics['feeds']}
+    write_atomic(path, json.dumps(partial, separators=(',', ':')))
+    count = sum(len(feed['candidates']) for feed in partial['feeds'].values())
+    print(f"\n💾 Shard {partial['shard']}/{partial['shards']}: {count} candidates from "
+          f"{len(partial['feeds'])} feeds written to {path}")
+
+# ============================================
+# MERGE (reduce side)
+# ============================================
+def partial_paths(paths):
+    """Partial files given directly or found (recursively) in directories, e.g. downloaded CI artifacts"""
+    found = []
+    for path in paths:
+        if os.path.isdir(path):
+            found.extend(sorted(glob.glob(os.path.join(path, '**', '*.json'), recursive=True)))
+        else:
+            found.append(path)
+    return found
+
+def load_partials(paths):
+    """
+    Load partial results; warns about missing shards and ignores files
+    that are not partials or belong to a different shard count
+    Returns: list of partials ordered by shard
+    """
+    partials = {}
+    shards = None
+    for path in partial_paths(paths):
+        try:
+            with open(path, 'r') as f:
+                partial = json.load(f)
+        except Exception as e:
+            print(f'⚠ Skipping {path}: {e}')
+            continue
+
+        if not isinstance(partial, dict) or partial.get('version') != PARTIAL_VERSION:
+            print(f'⚠ Skipping {path}: not a version {PARTIAL_VERSION} partial')
+            continue
+        if shards is None:
+            shards = partial['shards']
+        if partial['shards'] != shards:
+            print(f"⚠ Skipping {path}: shard {partial['shard']}/{partial['shards']}, expected N = {shards}")
+            continue
+        partials[partial['shard']] = partial
+
+    if shards:
+        missing = [str(shard) for shard in range(1, shards + 1) if shard not in partials]
+        print(f'✓ Loaded {len(partials)} of {shards} shard partials')
+        if missing:
+            print(f"⚠ Missing shards {', '.join(missing)} - their feeds are not in this digest")
+
+    return [partials[shard] for shard in sorted(partials)]
+
+def merge_partials(partials, feeds, metrics):
+    """
+    Combine shard partials in feeds.txt order, as if one process had
+    filtered every feed: a link already taken by an earlier feed is
+    dropped, like filter_entries() does with seen_urls. Shard metrics
+    are added to metrics.
+    Returns: (candidates, feed_stats, ngrams) - candidates are Articles
+    in single-run order, ngrams maps article url -> (bigrams, trigrams)
+    """
+    by_feed = {}
+    for partial in partials:
+        by_feed.update(partial['feeds'])
+        for stage, ms in partial['metrics']['stages'].items():
+            add_stage_ms(metrics, stage, ms)
+
+    feed_metrics = {}
+    for partial in partials:
+        feed_metrics.update(partial['metrics']['feeds'])
+
+    candidates = []
+    feed_stats = {}
+    ngrams = {}
+    seen_urls = set()
+    for feed_name in feeds:
+        if feed_name not in by_feed:
+            continue
+        feed_stats[feed_name] = by_feed[feed_name]['stats']
+        if feed_name in feed_metrics:
+            metrics['feeds'][feed_name] = feed_metrics[feed_name]
+
+        for data in by_feed[feed_name]['candidates']:
+            if data['url'] in seen_urls:
+                continue
+            seen_urls.add(data['url'])
+            candidates.append(article_from_dict(data))
+            ngrams[data['url']] = data['ngrams']
+
+    return candidates, feed_stats, ngrams
+
+def merged_trend_counts(articles, ngrams):
+    """Trend counts of articles from the shards' n-grams (same result as update_trend_counts())"""
+    trend_counts = {'bigrams': Counter(), 'trigrams': Counter()}
+    for article in articles:
+        bigrams, trigrams = ngrams[article.url]
+        trend_counts['bigrams'].update(bigrams)
+        trend_counts['trigrams'].update(trigrams)
+    return trend_counts
@@ -0,0 +1,475 @@
+import socket
+import sys
+import time
+import calendar
+from array import array
+from collections import defaultdict, Counter
+
+from .config import (TIME_WINDOW_HOURS, MIN_ARTICLES_FOR_TRENDING, MAX_TRENDING_TOPICS, FETCH_WORKERS, FETCH_AHEAD,
+                     MAX_FEED_ENTRIES)
+from .article import make_article
+from .entry_text import clean_description, entry_is_relevant
+from .http_fetch import timed_get
+from .fetch_pool import stream_parallel
+from .feed_stream import new_entry_cap, count_entry_ends, cut_at_cap
+from .metrics import timed
+from .feed_archive import record_response, replay_response
+from .feed_cache import cached_feed
+from .categorize import categorize_indexed
+from .dedup import is_duplicate_advanced
+from .trending import identify_trending_wordcloud, update_trend_counts
+from .render import build_messages
+from .profiles import render_for_recipients
+from .outbox import open_outbox, new_run_id, enqueue_digest, deliver_pending
+
+# ============================================
+# STAGE: FETCH
+# ============================================
+def fetch_feed(url, etag=None, modified=None, archive=None):
+    """
+    Download and parse one RSS feed (conditional GET when etag/modified given)
+    archive records the response or replays it (see feed_archive)
+    Only the first MAX_FEED_ENTRIES entries and MAX_BODY_BYTES are read:
+    feed['truncated'] is 'bytes' when the byte cap cut the document, and
+    feed['entries_capped'] is True when the entry cap stopped the download
+    (expected for long feeds - filter_entries() reads no further)
+    Returns: (parsed feed, timings) - timed_get() timings plus parse_ms
+    """
+    import feedparser
+
+    headers = {}
+    if etag:
+        headers['If-None-Match'] = etag
+    if modified:
+        headers['If-Modified-Since'] = modified
+
+    cap = new_entry_cap(MAX_FEED_ENTRIES)
+    if archive and archive['mode'] == 'replay':
+        response = replay_response(archive['dir'], url)
+        count_entry_ends(cap, response['body'])
+    else:
+        response = timed_get(url, headers, on_chunk=lambda data: count_entry_ends(cap, data))
+        if archive:
+            record_response(archive['dir'], url, response)
+    timings = response['timings']
+
+    start = time.perf_counter()
+    if response['status'] == 304:
+        feed = feedparser.FeedParserDict(bozo=False, entries=[], feed=feedparser.FeedParserDict())
+    else:
+        response_headers = dict(response['headers'])
+        response_headers.setdefault('content-location', response['url'])
+        feed = feedparser.parse(cut_at_cap(cap, response['body']), response_headers=response_headers)
+    timings['parse_ms'] = (time.perf_counter() - start) * 1000
+
+    # A cut document is unterminated XML: feedparser keeps its entries but sets bozo
+    if response.get('truncated'):
+        feed['truncated'] = response['truncated']
+    if cap['stopped']:
+        feed['entries_capped'] = True
+
+    feed['status'] = response['status']
+    feed['href'] = response['url']
+    feed['headers'] = response['headers']
+    if 'etag' in response['headers']:
+        feed['etag'] = response['headers']['etag']
+    if 'last-modified' in response['headers']:
+        feed['modified'] = response['headers']['last-modified']
+    if 'recorded_at' in response:
+        feed['recorded_at'] = response['recorded_at']
+
+    return feed, timings
+
+def fetch_one(feed_name, feed_info, etag=None, modified=None, archive=None, cached=None, echo=True):
+    """
+    Fetch one feed and record how it went
+    cached is the feed_cache entry to use instead of downloading
+    echo=False keeps the progress lines in result['log'] instead of
+    printing them (fetches on worker threads, see fetch_stream())
+    Returns: {'feed': parsed feed or None, 'duration_ms': int, 'error': str or None,
+              'timings': fetch_feed() timings or None, 'cached': bool,
+              'truncated': 'bytes' / None, 'entries_capped': bool, 'log': [lines]}
+    """
+    log = []
+
+    def say(line):
+        if echo:
+            print(line)
+        else:
+            log.append(line)
+
+    say('\n' + feed_name + ':')
+
+    if cached:
+        feed = cached_feed(cached)
+        age_minutes = (time.time() - cached['fetched_at']) / 60
+        say(f'  Total entries: {len(feed.entries)} (fetched by the feed tools {age_minutes:.0f} min ago)')
+        return {'feed': feed, 'duration_ms': 0, 'error': None, 'timings': None, 'cached': True, 'truncated': None,
+                'entries_capped': False, 'log': log}
+
+    start = time.time()
+    feed = None
+    timings = None
+    error = None
+
+    try:
+        feed, timings = fetch_feed(feed_info['url'], etag, modified, archive)
+    except socket.timeout:
+        say('  ⏱️  TIMEOUT - Skipping')
+        error = 'timeout'
+    except Exception as e:
+        say('  ❌ Error: ' + str(e)[:50])
+        error = str(e)[:100]
+
+    if feed is not None:
+        if feed['status'] >= 400:
+            error = 'HTTP ' + str(feed['status'])
+        elif feed.get('bozo') and not feed.entries:
+            error = str(feed.get('bozo_exception', 'parse error'))[:100]
+        say('  Total entries: ' + str(len(feed.entries)))
+        if feed.get('truncated'):
+            say(f"  ✂️  Truncated ({feed['truncated']} cap)")
+        if feed.get('entries_capped'):
+            say(f'  Read the first {MAX_FEED_ENTRIES} entries (entry cap)')
+
+    return {'feed': feed, 'duration_ms': int((time.time() - start) * 1000), 'error': error, 'timings': timings,
+            'cached': False, 'truncated': feed.get('truncated') if feed is not None else None,
+            'entries_capped': bool(feed is not None and feed.get('entries_capped')), 'log': log}
+
+def fetch_stream(feeds, archive=None, feed_cache=None, workers=FETCH_WORKERS, ahead=FETCH_AHEAD):
+    """
+    Fetch stage as a stream: yields (feed_name, fetch_one() result) in
+    feeds order while later feeds download on worker threads. At most
+    ahead feeds are in flight or parsed and waiting, so a slow consumer
+    holds the downloads back instead of piling up parsed feeds.
+    Feeds found in feed_cache ({url: compact feed}) are not downloaded.
+    workers=1 fetches on the calling thread, one feed per next()
+    """
+    print('\n' + '=' * 60)
+    print('FETCHING ARTICLES FROM ' + str(len(feeds)) + ' FEEDS')
+    print('=' * 60)
+    print(f'Time window: {TIME_WINDOW_HOURS} hours')
+
+    feed_cache = feed_cache or {}
+    cached_count = sum(1 for feed_info in feeds.values() if feed_info['url'] in feed_cache)
+    if cached_count:
+        print(f'♻️  {cached_count} of {len(feeds)} feeds already fetched by the feed tools')
+
+    if workers <= 1:
+        for feed_name, feed_info in feeds.items():
+            yield feed_name, fetch_one(feed_name, feed_info, archive=archive, cached=feed_cache.get(feed_info['url']))
+        return
+
+    names = list(feeds)
+    urls = [feeds[feed_name]['url'] for feed_name in names]
+
+    def fetch_feed_at(i):
+        return fetch_one(names[i], feeds[names[i]], archive=archive, cached=feed_cache.get(urls[i]), echo=False)
+
+    for feed_name, result in zip(names, stream_parallel(urls, fetch_feed_at, max_workers=workers, ahead=ahead)):
+        print('\n'.join(result['log']))
+        yield feed_name, result
+
+# ============================================
+# STAGE: FILTER (time window + relevance)
+# ============================================
+# A parsed feed becomes one batch of columns, so the window, high-water
+# and seen-URL checks are whole-column passes against one UTC clock, and
+# only the entries that pass them are read any further (description,
+# relevance) or become Articles:
+# {
+#   'published': array('q') of UTC epoch seconds (NO_DATE when missing or unparsable),
+#   'titles': [stripped title], 'links': [stripped link],
+#   'entries': the entries themselves, for the survivors' descriptions
+# }
+NO_DATE = -2 ** 63
+
+def entry_batch(entries):
+    published = array('q')
+    titles = []
+    links = []
+    for entry in entries:
+        parsed = entry.get('published_parsed')
+        try:
+            published.append(calendar.timegm(parsed) if parsed else NO_DATE)
+        except (TypeError, ValueError, OverflowError):
+            published.append(NO_DATE)
+        titles.append(str(entry.get('title') or '').strip())
+        links.append(str(entry.get('link') or '').strip())
+    return {'published': published, 'titles': titles, 'links': links, 'entries': entries}
+
+def filter_entries(feed_name, feed_info, feed, keyword_matcher, seen_urls, high_water=None, now=None):
+    """
+    Keep the recent, keyword-relevant, not-yet-seen entries of one feed.
+    keyword_matcher is the config bundle's compiled keyword automaton.
+    Entries published at or before high_water (epoch) were handled by a
+    previous run and are skipped. now is the run's clock (UTC epoch,
+    default: the current time); a replayed feed is filtered as of the
+    time it was recorded.
+    Returns: (candidates, stats) - candidates are (Article, description
+    text) pairs whose topic is filled in by categorize(); the description
+    text is the summary without HTML, up to MAX_DESCRIPTION_CHARS
+    """
+    stats = {'total': 0, 'recent': 0, 'relevant': 0, 'duplicates': 0, 'already_processed': 0, 'newest': None}
+
+    if feed is None or not feed.entries:
+        return [], stats
+
+    stats['total'] = len(feed.entries)
+    if 'recorded_at' in feed:
+        now = int(feed['recorded_at'])
+    elif now is None:
+        now = int(time.time())
+
+    batch = entry_batch(feed.entries[:100])
+    published = batch['published']
+    titles = batch['titles']
+    links = batch['links']
+
+    dated = [ts for ts in published if ts != NO_DATE]
+    if dated:
+        stats['newest'] = max(dated)
+    if high_water:
+        stats['already_processed'] = sum(1 for ts in dated if ts <= high_water)
+
+    # Undated entries count as recent
+    window_start = now - TIME_WINDOW_HOURS * 3600
+    processed_until = high_water or NO_DATE
+    recent = [i for i, ts in enumerate(published)
+              if ts == NO_DATE or (ts >= window_start and ts > processed_until)]
+    stats['recent'] = len(recent)
+
+    unseen = [i for i in recent if titles[i] and links[i] and links[i] not in seen_urls]
+
+    candidates = []
+    for i in unseen:
+        link = links[i]
+        if link in seen_urls:
+            continue  # Listed twice in this feed
+
+        try:
+            entry = batch['entries'][i]
+            description = entry.get('summary', '') or entry.get('description', '')
+            is_relevant, description_text = entry_is_relevant(titles[i], description, keyword_matcher)
+
+            if is_relevant:
+                if description_text is None:  # Relevant by title: categorize() needs the text anyway
+                    description_text = clean_description(description)
+                seen_urls.add(link)
+                ts = published[i] if published[i] != NO_DATE else now
+                article = make_article(feed_name, feed_info['acronym'], titles[i], link, ts, '', description_text)
+                candidates.append((article, description_text))
+        except Exception:
+            continue
+
+    return candidates, stats
+
+# ============================================
+# STAGE: CATEGORIZE
+# ============================================
+def categorize(candidates, config):
+    """
+    Assign a topic to every candidate; returns the Articles
+    config['categorize_engine'] == 'vector' scores all candidates in one
+    batch (see categorize_vector) with config['topic_scanner'], and
+    config['topic_centroids'] if set
+    """
+    if config.get('categorize_engine') == 'vector':
+        from .categorize_vector import article_text, categorize_batch
+        texts = [article_text(article.title, description) for article, description in candidates]
+        topics = categorize_batch(texts, config['topic_index'], config.get('topic_centroids'), config['topic_scanner'])
+    else:
+        topics = [categorize_indexed(article.title, description, config['topic_index'], config['topic_matcher'])
+                  for article, description in candidates]
+
+    articles = []
+    for (article, _), topic in zip(candidates, topics):
+        article.topic = sys.intern(topic)
+        articles.append(article)
+    return articles
+
+# ============================================
+# STAGE: DEDUP
+# ============================================
+def dedup(new_articles, articles, feed_stats, matcher=None):
+    """
+    Append the new articles that are not duplicates of articles (in order),
+    counting relevant / duplicates per source feed in feed_stats
+    matcher: the config bundle's entity_matcher
+    Returns: the articles that were kept
+    """
+    kept = []
+    for article in new_articles:
+        stats = feed_stats[article.source]
+        # Advanced deduplication (Option A)
+        if not is_duplicate_advanced(article, articles, matcher):
+            articles.append(article)
+            kept.append(article)
+            stats['relevant'] += 1
+        else:
+            stats['duplicates'] += 1
+    return kept
+
+def ingest_feed(feed_name, feed_info, feed, config, articles, seen_urls, feed_stats, metrics, high_water=None,
+                now=None):
+    """Filter, categorize and dedup one parsed feed; returns the new articles"""
+    with timed(metrics, 'relevance'):
+        candidates, feed_stats[feed_name] = filter_entries(
+            feed_name, feed_info, feed, config['keyword_matcher'], seen_urls, high_water, now
+        )
+    with timed(metrics, 'categorize'):
+        candidates = categorize(candidates, config)
+    with timed(metrics, 'dedup'):
+        kept = dedup(candidates, articles, feed_stats, config['entity_matcher'])
+    print_feed_result(feed_stats[feed_name])
+    return kept
+
+def print_feed_result(stats):
+    print(f'  Recent ({TIME_WINDOW_HOURS}hrs): ' + str(stats['recent']))
+    print('  Relevant: ' + str(stats['relevant']))
+    if stats['duplicates'] > 0:
+        print('  Duplicates skipped: ' + str(stats['duplicates']))
+    if stats['already_processed'] > 0:
+        print('  Already processed: ' + str(stats['already_processed']))
+    if stats.get('truncated'):
+        print(f"  Truncated: {stats['truncated']} cap reached")
+
+# ============================================
+# STAGE: TREND
+# ============================================
+def trend(articles, trend_counts=None):
+    """Run trending detection when there are enough articles"""
+    trending_topics = []
+
+    if len(articles) >= MIN_ARTICLES_FOR_TRENDING:
+        print('\n' + '=' * 60)
+        print('IDENTIFYING TRENDING TOPICS (WORD CLOUD + FILTERS)')
+        print('=' * 60)
+        print(f'Articles available: {len(articles)}')
+
+        trending_topics = identify_trending_wordcloud(articles, top_n=MAX_TRENDING_TOPICS, trend_counts=trend_counts)
+
+        if trending_topics:
+            print(f'\n✓ Found {len(trending_topics)} trending topics:')
+            for i, trending in enumerate(trending_topics, 1):
+                print(f"  {i}. {trending['topic']}: {trending['count']} articles")
+            print('\n✅ Trending analysis complete (OPTION C: Noise filter + Diversity check)')
+        else:
+            print('\n⚠️  No significant trending topics found')
+    else:
+        print(f'\n⚠️  Trending detection: SKIPPED (only {len(articles)} articles, need {MIN_ARTICLES_FOR_TRENDING}+)')
+
+    print('=' * 60)
+    return trending_topics
+
+def new_trend_counts(articles):
+    """Trend n-gram counts for a fresh article set"""
+    return update_trend_counts({'bigrams': Counter(), 'trigrams': Counter()}, articles)
+
+# ============================================
+# STAGE: RENDER (once per distinct profile)
+# ============================================
+def render(recipients, articles, trending_topics, topics, date=None):
+    """Returns: list of (chat_id, messages) - dated date (default: today)"""
+    deliveries, render_count = render_for_recipients(
+        recipients,
+        articles,
+        lambda subset: build_messages(subset, trending_topics, topics, date)
+    )
+
+    if deliveries:
+        part_counts = [len(msgs) for _, msgs in deliveries]
+        print('\n📊 Split into ' + str(min(part_counts)) + '-' + str(max(part_counts)) + ' messages per recipient')
+    print(f'📊 {render_count} distinct digests rendered for {len(recipients)} recipients')
+
+    return deliveries
+
+# ============================================
+# STAGE: SEND (via durable outbox)
+# ============================================
+def send(deliveries, token):
+    """Journal the deliveries in the outbox and deliver them"""
+    if not token:
+        print('\n❌ ERROR: Missing TELEGRAM_BOT_TOKEN')
+        return
+    if not deliveries:
+        print('\n❌ ERROR: No recipients found')
+        return
+
+    try:
+        outbox = open_outbox()
+        run_id = new_run_id()
+        queued = enqueue_digest(outbox, run_id, deliveries)
+
+        print('\n' + '=' * 60)
+        print('SENDING TO ' + str(len(deliveries)) + ' RECIPIENTS')
+        print('=' * 60)
+        print(f'Queued {queued} parts in outbox (run {run_id})')
+
+        result = deliver_pending(outbox, token, run_id)
+
+        if result['pending']:
+            print(f"\n⚠️  {result['pending']} parts still pending - run with --resume to finish delivery")
+        else:
+            print('\n✅ ALL MESSAGES SENT!')
+        if result['failed']:
+            print(f"❌ {result['failed']} parts rejected by Telegram")
+
+    except Exception as e:
+        print('\n❌ ERROR: ' + str(e))
+
+# ============================================
+# RUN SUMMARIES
+# ============================================
+def print_run_summary(articles, feed_stats, feeds):
+    """Print deduplication, publication and topic summaries"""
+    duplicate_count = sum(stats.get('duplicates', 0) for stats in feed_stats.values())
+
+    print('\n' + '=' * 60)
+    print('DEDUPLICATION SUMMARY')
+    print('=' * 60)
+
+    total_before_dedup = len(articles) + duplicate_count
+    dedup_percentage = (duplicate_count / total_before_dedup * 100) if total_before_dedup > 0 else 0
+
+    print(f'Articles before deduplication: {total_before_dedup}')
+    print(f'Duplicates removed: {duplicate_count}')
+    print(f'Unique articles remaining: {len(articles)}')
+    print(f'Reduction: {dedup_percentage:.1f}%')
+    print(f'Method: Entity extraction + First-7-words matching')
+
+    capped = sum(1 for stats in feed_stats.values() if stats.get('entries_capped'))
+    truncated = sum(1 for stats in feed_stats.values() if stats.get('truncated'))
+    if capped:
+        print(f'Feeds read up to the {MAX_FEED_ENTRIES}-entry cap: {capped}')
+    if truncated:
+        print(f'⚠ Feeds truncated by the byte cap: {truncated}')
+
+    print('\n' + '=' * 60)
+    print('SUMMARY BY PUBLICATION')
+    print('=' * 60)
+
+    all_publications = set()
+    for feed_name, feed_info in feeds.items():
+        all_publications.add(feed_info['acronym'])
+
+    for pub in sorted(all_publications):
+        pub_feeds = {k: v for k, v in feed_stats.items() if feeds.get(k, {}).get('acronym') == pub}
+        if pub_feeds:
+            total_rel = sum(f['relevant'] for f in pub_feeds.values())
+            print(pub + ': ' + str(total_rel) + ' articles from ' + str(len(pub_feeds)) + ' feeds')
+
+    print('\nTotal unique articles: ' + str(len(articles)))
+
+    print('\n' + '=' * 60)
+    print('SUMMARY BY TOPIC')
+    print('=' * 60)
+
+    topic_counts = defaultdict(int)
+    for article in articles:
+        topic_counts[article.topic] += 1
+
+    for topic in sorted(topic_counts.keys()):
+        print(topic + ': ' + str(topic_counts[topic]) + ' articles')
+
+    print('=' * 60)
@@ -0,0 +1,170 @@
+import re
+from collections import Counter
+
+# ============================================
+# WORD CLOUD TRENDING - OPTION C (BLOCKLIST + DIVERSITY)
+# ============================================
+def title_ngrams(title):
+    """Bigrams and trigrams of a title used for trending (stop words removed)"""
+    # Stop words
+    stop_words = {
+        'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+        'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'be',
+        'been', 'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will',
+        'would', 'could', 'should', 'may', 'might', 'can', 'says', 'said',
+        'after', 'amid', 'over', 'up', 'down', 'out', 'its', 'new', 'this',
+        'that', 'these', 'those'
+    }
+    
+    title = title.lower()
+    title = re.sub(r'[^\w\s]', ' ', title)
+    words = title.split()
+    words = [w for w in words if w not in stop_words and len(w) > 3]
+    
+    bigrams = [words[i] + ' ' + words[i + 1] for i in range(len(words) - 1)]
+    trigrams = [words[i] + ' ' + words[i + 1] + ' ' + words[i + 2] for i in range(len(words) - 2)]
+    
+    return bigrams, trigrams
+
+def update_trend_counts(trend_counts, articles, remove=False):
+    """Add (or remove) the n-grams of articles to trend_counts {'bigrams', 'trigrams'}"""
+    for article in articles:
+        bigrams, trigrams = title_ngrams(article.title)
+        if remove:
+            trend_counts['bigrams'].subtract(bigrams)
+            trend_counts['trigrams'].subtract(trigrams)
+        else:
+            trend_counts['bigrams'].update(bigrams)
+            trend_counts['trigrams'].update(trigrams)
+    
+    if remove:
+        # Drop phrases that no longer occur
+        trend_counts['bigrams'] = +trend_counts['bigrams']
+        trend_counts['trigrams'] = +trend_counts['trigrams']
+    
+    return trend_counts
+
+def identify_trending_wordcloud(articles, top_n=10, trend_counts=None):
+    """
+    Identify trending topics using word cloud approach
+    OPTION C: Filters noise phrases + requires diversity
+    trend_counts: precomputed n-gram counts of articles (incremental runs)
+    """
+    
+    if len(articles) < 50:
+        return []
+    
+    print('  Analyzing article titles for trending phrases...')
+    
+    # OPTION C - PART 1: NOISE PHRASES BLOCKLIST
+    noise_phrases = {
+        'share price', 'price live', 'live updates', 'stock market today',
+        'share price live', 'price live updates', 'live update',
+        'stock today', 'market today', 'trading guide', 'buy sell',
+        'stocks watch', 'stocks buy', 'price target', 'price action',
+        'intraday trading', 'stock tips', 'buy or sell', 'stock analysis',
+        'technical analysis', 'price movement', 'stock recommendation',
+        'share update', 'stock update', 'market update', 'trading tips',
+        'stock pick', 'share target', 'stock view', 'market view'
+    }
+    
+    # Count bigrams and trigrams from titles
+    if trend_counts is None:
+        trend_counts = update_trend_counts({'bigrams': Counter(), 'trigrams': Counter()}, articles)
+    
+    bigram_counter = trend_counts['bigrams']
+    trigram_counter = trend_counts['trigrams']
+    
+    # Find top phrases (prefer longer phrases)
+    top_phrases = []
+    
+    # Get top trigrams (3-word phrases) - LOWERED THRESHOLD
+    for phrase, count in trigram_counter.most_common(30):
+        # OPTION C - FILTER: Skip noise phrases
+        if any(noise in phrase for noise in noise_phrases):
+            continue
+        
+        if count >= 2:  # LOWERED from 3 to 2
+            top_phrases.append({'phrase': phrase, 'count': count, 'type': 'trigram'})
+    
+    # Get top bigrams (2-word phrases) - LOWERED THRESHOLD
+    for phrase, count in bigram_counter.most_common(50):
+        # OPTION C - FILTER: Skip noise phrases
+        if any(noise in phrase for noise in noise_phrases):
+            continue
+        
+        if count >= 3:  # LOWERED from 5 to 3
+            # Don't add if already part of a trigram
+            is_subset = False
+            for existing in top_phrases:
+                if phrase in existing['phrase']:
+                    is_subset = True
+                    break
+            if not is_subset:
+                top_phrases.append({'phrase': phrase, 'count': count, 'type': 'bigram'})
+    
+    # Sort by count
+    top_phrases.sort(key=lambda x: x['count'], reverse=True)
+    
+    # Take more candidates (we'll filter with diversity check)
+    top_phrases = top_phrases[:top_n * 2]
+    
+    print(f'  Found {len(top_phrases)} candidate phrases')
+    
+    # For each trending phrase, find matching articles and create summary
+    trending_results = []
+    
+    for phrase_data in top_phrases:
+        phrase = phrase_data['phrase']
+        
+        # Find articles containing this phrase
+        matching_articles = []
+        for article in articles:
+            if phrase in article.title.lower():
+                matching_articles.append(article)
+        
+        # OPTION C - PART 2: DIVERSITY CHECK
+        # Check if articles are actually diverse (not just repetitive tickers)
+        unique_titles = set()
+        for article in matching_articles:
+            # Get core of title (remove numbers, percentages, company names)
+            core_title = article.title.lower()
+            # Remove numbers and percentages
+            core_title = re.sub(r'\d+(?:\.\d+)?%?', '', core_title)
+            core_title = re.sub(r'rs\.?\s*\d+(?:,\d+)*(?:\.\d+)?', '', core_title)
+            # Remove common stock ticker words
+            for noise in ['live', 'update', 'updates', 'today', 'now']:
+                core_title = core_title.replace(noise, '')
+            # Keep first 40 chars as signature
+            core_title = core_title.strip()[:40]
+            if core_title:
+                unique_titles.add(core_title)
+        
+        # LOWERED THRESHOLDS: 2 unique stories, 3 total articles
+        if len(unique_titles) >= 2 and len(matching_articles) >= 3:
+            # Generate summary from top 3 article titles
+            summary_titles = []
+            for article in matching_articles[:3]:
+                title = article.title
+                # Clean title
+                for prefix in ['Exclusive:', 'Breaking:', 'Opinion:', 'Analysis:']:
+                    title = title.replace(prefix, '').strip()
+                if len(title) > 80:
+                    title = title[:77] + '...'
+                summary_titles.append(title)
+            
+            summary = ' • '.join(summary_titles)
+            
+            trending_results.append({
+                'topic': phrase.title(),
+                'count': len(matching_articles),
+                'summary': summary
+            })
+            
+            # Stop if we have enough
+            if len(trending_results) >= top_n:
+                break
+    
+    print(f'  After diversity filtering: {len(trending_results)} trending topics')
+    
+    return trending_results
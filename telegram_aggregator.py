@@ -1,823 +1,5 @@
-import os
-from datetime import datetime, timedelta
-import feedparser
-import requests
-from collections import defaultdict, Counter
-import socket
-import re
+# Kept so existing workflows and cron jobs can still run `python telegram_aggregator.py`
+from financial_news.pipeline import main
 
-# Set global timeout for all network operations
-socket.setdefaulttimeout(10)
-
-token = os.getenv('TELEGRAM_BOT_TOKEN')
-chat = os.getenv('TELEGRAM_CHAT_ID')
-
-print('=' * 60)
-print('Starting Financial News Aggregator...')
-print('=' * 60)
-
-# ============================================
-# CONFIGURATION
-# ============================================
-MIN_ARTICLES_FOR_TRENDING = 50
-MAX_TRENDING_TOPICS = 10  # Show top 10 trending topics
-MESSAGE_CHAR_LIMIT = 3800  # Increased from 2500 to fit more per message
-TIME_WINDOW_HOURS = 24  # 24 hours = 1 day of news
-
-# ============================================
-# LOAD RECIPIENTS from recipients.txt
-# ============================================
-def load_recipients():
-    """Load recipient chat IDs from recipients.txt file"""
-    recipients = []
-    
-    if chat:
-        recipients.append(chat)
-        print('✓ Added primary recipient from secret')
-    
-    try:
-        with open('recipients.txt', 'r') as f:
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith('#') or line == 'TELEGRAM_CHAT_ID':
-                    continue
-                recipients.append(line)
-        print('✓ Loaded ' + str(len(recipients)) + ' total recipients')
-        return recipients
-    except FileNotFoundError:
-        print('⚠ recipients.txt not found')
-        return recipients
-    except Exception as e:
-        print('⚠ Error loading recipients: ' + str(e))
-        return recipients
-
-# ============================================
-# LOAD KEYWORDS from keywords.txt
-# ============================================
-def load_keywords():
-    """Load keywords from keywords.txt file"""
-    keywords = []
-    
-    try:
-        with open('keywords.txt', 'r') as f:
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith('#'):
-                    continue
-                keywords.append(line.lower())
-        print('✓ Loaded ' + str(len(keywords)) + ' keywords')
-        return keywords
-    except FileNotFoundError:
-        print('⚠ keywords.txt not found - using minimal defaults')
-        return ['bank', 'banking', 'finance', 'insurance', 'market', 'economy']
-    except Exception as e:
-        print('⚠ Error loading keywords: ' + str(e))
-        return ['bank', 'banking', 'finance', 'insurance', 'market', 'economy']
-
-# ============================================
-# LOAD FEEDS from feeds.txt
-# ============================================
-def load_feeds():
-    """Load RSS feeds from feeds.txt file with acronyms"""
-    feeds = {}
-    
-    try:
-        with open('feeds.txt', 'r') as f:
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith('#'):
-                    continue
-                
-                if '|' in line:
-                    parts = line.split('|')
-                    
-                    if len(parts) == 3:
-                        feed_name = parts[0].strip()
-                        acronym = parts[1].strip()
-                        url = parts[2].strip()
-                        feeds[feed_name] = {'url': url, 'acronym': acronym}
-                    elif len(parts) == 2:
-                        feed_name = parts[0].strip()
-                        url = parts[1].strip()
-                        acronym = feed_name.split(' ')[0] if ' ' in feed_name else feed_name
-                        feeds[feed_name] = {'url': url, 'acronym': acronym}
-        
-        print('✓ Loaded ' + str(len(feeds)) + ' RSS feeds')
-        return feeds
-    except FileNotFoundError:
-        print('⚠ feeds.txt not found')
-        return {}
-    except Exception as e:
-        print('⚠ Error loading feeds: ' + str(e))
-        return {}
-
-# ============================================
-# LOAD TOPICS from topics.txt
-# ============================================
-def load_topics():
-    """Load topic categorization from topics.txt file"""
-    topics = []
-    
-    try:
-        with open('topics.txt', 'r') as f:
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith('#'):
-                    continue
-                
-                if '|' in line:
-                    parts = line.split('|', 1)
-                    if len(parts) == 2:
-                        topic_name = parts[0].strip()
-                        keywords_str = parts[1].strip()
-                        keywords = [kw.strip().lower() for kw in keywords_str.split(',')]
-                        
-                        topics.append({
-                            'name': topic_name,
-                            'keywords': keywords
-                        })
-        
-        print('✓ Loaded ' + str(len(topics)) + ' topic categories')
-        return topics
-    except FileNotFoundError:
-        print('⚠ topics.txt not found - using minimal defaults')
-        return [
-            {'name': 'BANKING & FINANCE', 'keywords': ['bank', 'banking', 'loan', 'credit']},
-            {'name': 'OTHER NEWS', 'keywords': ['other', 'news']}
-        ]
-    except Exception as e:
-        print('⚠ Error loading topics: ' + str(e))
-        return [{'name': 'OTHER NEWS', 'keywords': ['other', 'news']}]
-
-# ============================================
-# ESCAPE MARKDOWN
-# ============================================
-def escape_markdown_title(text):
-    """Escape only ] and \ for Telegram Markdown"""
-    text = text.replace('\\', '\\\\')
-    text = text.replace(']', '\\]')
-    return text
-
-# ============================================
-# ADVANCED DEDUPLICATION - OPTION A
-# ============================================
-
-def extract_entities(title):
-    """
-    Extract key entities from title (companies, banks, people, organizations)
-    Returns set of entity strings
-    """
-    title_upper = title.upper()
-    
-    # Common financial entities
-    entities = set()
-    
-    # Indian banks and financial institutions
-    banks = [
-        'HDFC', 'ICICI', 'SBI', 'AXIS', 'KOTAK', 'INDUSIND', 'YES BANK', 'IDFC',
-        'PNB', 'BOB', 'BOI', 'CANARA', 'UNION BANK', 'INDIAN BANK',
-        'FEDERAL BANK', 'RBL', 'BANDHAN', 'AU SMALL FINANCE', 'IDBI'
-    ]
-    
-    # Insurance companies
-    insurance = [
-        'LIC', 'ICICI PRUDENTIAL', 'HDFC LIFE', 'SBI LIFE', 'MAX LIFE',
-        'BAJAJ ALLIANZ', 'RELIANCE GENERAL', 'IFFCO TOKIO', 'TATA AIG'
-    ]
-    
-    # Major companies
-    companies = [
-        'RELIANCE', 'TCS', 'INFOSYS', 'WIPRO', 'HCL', 'TATA', 'ADANI',
-        'BHARTI AIRTEL', 'MARUTI', 'MAHINDRA', 'ITC', 'LARSEN', 'L&T',
-        'ASIAN PAINTS', 'ULTRATECH', 'BAJAJ', 'GODREJ', 'VEDANTA',
-        'CIPLA', 'SUN PHARMA', 'DR REDDY', 'DIVIS'
-    ]
-    
-    # Regulators and institutions
-    institutions = [
-        'RBI', 'SEBI', 'IRDAI', 'NPCI', 'NITI AAYOG', 'FINANCE MINISTRY',
-        'MINISTRY OF FINANCE', 'SUPREME COURT', 'CBDT', 'GST COUNCIL'
-    ]
-    
-    all_entities = banks + insurance + companies + institutions
-    
-    for entity in all_entities:
-        if entity in title_upper:
-            entities.add(entity)
-    
-    # Extract numbers (percentages, amounts)
-    numbers = re.findall(r'\d+(?:\.\d+)?%|\d+(?:,\d+)*(?:\.\d+)?', title)
-    entities.update(numbers)
-    
-    return entities
-
-def extract_first_n_words(title, n=7):
-    """
-    Extract first N meaningful words from title
-    Removes common stop words
-    """
-    stop_words = {
-        'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-        'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were',
-        'says', 'said', 'after', 'amid', 'over'
-    }
-    
-    # Clean and tokenize
-    text = title.lower()
-    text = re.sub(r'[^\w\s]', ' ', text)
-    words = text.split()
-    
-    # Keep meaningful words
-    meaningful = []
-    for word in words:
-        if word not in stop_words and len(word) > 2:
-            meaningful.append(word)
-        if len(meaningful) >= n:
-            break
-    
-    return set(meaningful)
-
-def is_duplicate_advanced(new_article, existing_articles):
-    """
-    Advanced deduplication using:
-    1. Entity matching (same companies/banks mentioned)
-    2. First-N-words matching (similar opening)
-    
-    Returns True if duplicate detected
-    """
-    new_title = new_article['title']
-    new_entities = extract_entities(new_title)
-    new_words = extract_first_n_words(new_title, n=7)
-    
-    for existing in existing_articles:
-        existing_title = existing['title']
-        existing_entities = extract_entities(existing_title)
-        existing_words = extract_first_n_words(existing_title, n=7)
-        
-        # Check 1: Entity overlap
-        if new_entities and existing_entities:
-            common_entities = new_entities.intersection(existing_entities)
-            
-            # If they share 2+ entities, likely same story
-            if len(common_entities) >= 2:
-                return True
-            
-            # If they share 1 major entity AND similar words, likely duplicate
-            if len(common_entities) >= 1:
-                word_overlap = len(new_words.intersection(existing_words))
-                total_words = len(new_words.union(existing_words))
-                
-                if total_words > 0:
-                    word_similarity = word_overlap / total_words
-                    if word_similarity >= 0.5:  # 50% word overlap
-                        return True
-        
-        # Check 2: First-7-words matching
-        if new_words and existing_words:
-            word_overlap = len(new_words.intersection(existing_words))
-            total_words = len(new_words.union(existing_words))
-            
-            if total_words > 0:
-                word_similarity = word_overlap / total_words
-                
-                # If 70%+ of first words match, it's a duplicate
-                if word_similarity >= 0.7:
-                    return True
-    
-    return False
-
-# ============================================
-# CATEGORIZE ARTICLE
-# ============================================
-def categorize_article(title, description, topics):
-    """Categorize article using scoring"""
-    text = (title + ' ' + str(description)).lower()
-    
-    topic_scores = {}
-    
-    for topic in topics:
-        score = 0
-        for keyword in topic['keywords']:
-            if keyword in text:
-                score += 1
-        
-        if score > 0:
-            topic_scores[topic['name']] = score
-    
-    if topic_scores:
-        best_topic = max(topic_scores, key=topic_scores.get)
-        return best_topic
-    
-    return 'OTHER NEWS'
-
-# ============================================
-# WORD CLOUD TRENDING - OPTION C (BLOCKLIST + DIVERSITY)
-# ============================================
-def identify_trending_wordcloud(articles, top_n=10):
-    """
-    Identify trending topics using word cloud approach
-    OPTION C: Filters noise phrases + requires diversity
-    """
-    
-    if len(articles) < 50:
-        return []
-    
-    print('  Analyzing article titles for trending phrases...')
-    
-    # OPTION C - PART 1: NOISE PHRASES BLOCKLIST
-    noise_phrases = {
-        'share price', 'price live', 'live updates', 'stock market today',
-        'share price live', 'price live updates', 'live update',
-        'stock today', 'market today', 'trading guide', 'buy sell',
-        'stocks watch', 'stocks buy', 'price target', 'price action',
-        'intraday trading', 'stock tips', 'buy or sell', 'stock analysis',
-        'technical analysis', 'price movement', 'stock recommendation',
-        'share update', 'stock update', 'market update', 'trading tips',
-        'stock pick', 'share target', 'stock view', 'market view'
-    }
-    
-    # Stop words
-    stop_words = {
-        'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-        'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'be',
-        'been', 'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will',
-        'would', 'could', 'should', 'may', 'might', 'can', 'says', 'said',
-        'after', 'amid', 'over', 'up', 'down', 'out', 'its', 'new', 'this',
-        'that', 'these', 'those'
-    }
-    
-    # Extract all words and bigrams from titles
-    word_counter = Counter()
-    bigram_counter = Counter()
-    trigram_counter = Counter()
-    
-    for article in articles:
-        title = article['title'].lower()
-        title = re.sub(r'[^\w\s]', ' ', title)
-        words = title.split()
-        words = [w for w in words if w not in stop_words and len(w) > 3]
-        
-        # Count words
-        word_counter.update(words)
-        
-        # Count bigrams
-        for i in range(len(words) - 1):
-            bigram = words[i] + ' ' + words[i + 1]
-            bigram_counter[bigram] += 1
-        
-        # Count trigrams
-        for i in range(len(words) - 2):
-            trigram = words[i] + ' ' + words[i + 1] + ' ' + words[i + 2]
-            trigram_counter[trigram] += 1
-    
-    # Find top phrases (prefer longer phrases)
-    top_phrases = []
-    
-    # Get top trigrams (3-word phrases) - LOWERED THRESHOLD
-    for phrase, count in trigram_counter.most_common(30):
-        # OPTION C - FILTER: Skip noise phrases
-        if any(noise in phrase for noise in noise_phrases):
-            continue
-        
-        if count >= 2:  # LOWERED from 3 to 2
-            top_phrases.append({'phrase': phrase, 'count': count, 'type': 'trigram'})
-    
-    # Get top bigrams (2-word phrases) - LOWERED THRESHOLD
-    for phrase, count in bigram_counter.most_common(50):
-        # OPTION C - FILTER: Skip noise phrases
-        if any(noise in phrase for noise in noise_phrases):
-            continue
-        
-        if count >= 3:  # LOWERED from 5 to 3
-            # Don't add if already part of a trigram
-            is_subset = False
-            for existing in top_phrases:
-                if phrase in existing['phrase']:
-                    is_subset = True
-                    break
-            if not is_subset:
-                top_phrases.append({'phrase': phrase, 'count': count, 'type': 'bigram'})
-    
-    # Sort by count
-    top_phrases.sort(key=lambda x: x['count'], reverse=True)
-    
-    # Take more candidates (we'll filter with diversity check)
-    top_phrases = top_phrases[:top_n * 2]
-    
-    print(f'  Found {len(top_phrases)} candidate phrases')
-    
-    # For each trending phrase, find matching articles and create summary
-    trending_results = []
-    
-    for phrase_data in top_phrases:
-        phrase = phrase_data['phrase']
-        
-        # Find articles containing this phrase
-        matching_articles = []
-        for article in articles:
-            if phrase in article['title'].lower():
-                matching_articles.append(article)
-        
-        # OPTION C - PART 2: DIVERSITY CHECK
-        # Check if articles are actually diverse (not just repetitive tickers)
-        unique_titles = set()
-        for article in matching_articles:
-            # Get core of title (remove numbers, percentages, company names)
-            core_title = article['title'].lower()
-            # Remove numbers and percentages
-            core_title = re.sub(r'\d+(?:\.\d+)?%?', '', core_title)
-            core_title = re.sub(r'rs\.?\s*\d+(?:,\d+)*(?:\.\d+)?', '', core_title)
-            # Remove common stock ticker words
-            for noise in ['live', 'update', 'updates', 'today', 'now']:
-                core_title = core_title.replace(noise, '')
-            # Keep first 40 chars as signature
-            core_title = core_title.strip()[:40]
-            if core_title:
-                unique_titles.add(core_title)
-        
-        # LOWERED THRESHOLDS: 2 unique stories, 3 total articles
-        if len(unique_titles) >= 2 and len(matching_articles) >= 3:
-            # Generate summary from top 3 article titles
-            summary_titles = []
-            for article in matching_articles[:3]:
-                title = article['title']
-                # Clean title
-                for prefix in ['Exclusive:', 'Breaking:', 'Opinion:', 'Analysis:']:
-                    title = title.replace(prefix, '').strip()
-                if len(title) > 80:
-                    title = title[:77] + '...'
-                summary_titles.append(title)
-            
-            summary = ' • '.join(summary_titles)
-            
-            trending_results.append({
-                'topic': phrase.title(),
-                'count': len(matching_articles),
-                'summary': summary
-            })
-            
-            # Stop if we have enough
-            if len(trending_results) >= top_n:
-                break
-    
-    print(f'  After diversity filtering: {len(trending_results)} trending topics')
-    
-    return trending_results
-
-# Load configuration
-RECIPIENTS = load_recipients()
-keywords = load_keywords()
-feeds = load_feeds()
-topics = load_topics()
-
-if not feeds:
-    print('ERROR: No feeds loaded!')
-    exit(1)
-
-articles = []
-feed_stats = {}
-seen_urls = set()
-duplicate_count = 0
-
-# ============================================
-# PROCESS RSS FEEDS
-# ============================================
-print('\n' + '=' * 60)
-print('FETCHING ARTICLES FROM ' + str(len(feeds)) + ' FEEDS')
-print('=' * 60)
-print(f'Time window: {TIME_WINDOW_HOURS} hours')
-
-for feed_name, feed_info in feeds.items():
-    try:
-        url = feed_info['url']
-        acronym = feed_info['acronym']
-        
-        print('\n' + feed_name + ':')
-        
-        try:
-            feed = feedparser.parse(url, request_headers={
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            })
-        except socket.timeout:
-            print('  ⏱️  TIMEOUT - Skipping')
-            feed_stats[feed_name] = {'total': 0, 'recent': 0, 'relevant': 0}
-            continue
-        except Exception as e:
-            print('  ❌ Error: ' + str(e)[:50])
-            feed_stats[feed_name] = {'total': 0, 'recent': 0, 'relevant': 0}
-            continue
-        
-        total_entries = len(feed.entries)
-        print('  Total entries: ' + str(total_entries))
-        
-        if not feed.entries:
-            print('  No entries found')
-            feed_stats[feed_name] = {'total': 0, 'recent': 0, 'relevant': 0}
-            continue
-        
-        recent_count = 0
-        source_count = 0
-        feed_duplicates = 0
-        
-        for entry in feed.entries[:100]:
-            try:
-                pub_date = None
-                if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                    try:
-                        pub_date = datetime(*entry.published_parsed[:6])
-                    except:
-                        pass
-                
-                if pub_date:
-                    age_hours = (datetime.now() - pub_date).total_seconds() / 3600
-                    if age_hours <= TIME_WINDOW_HOURS:  # 24 hours
-                        recent_count += 1
-                    else:
-                        continue
-                else:
-                    recent_count += 1
-                
-                title = entry.get('title', '').strip()
-                description = entry.get('summary', '') or entry.get('description', '')
-                link = entry.get('link', '').strip()
-                
-                if not title or not link:
-                    continue
-                
-                if link in seen_urls:
-                    continue
-                
-                text = (title + ' ' + str(description)).lower()
-                is_relevant = any(kw in text for kw in keywords)
-                
-                if is_relevant:
-                    seen_urls.add(link)
-                    time_str = pub_date.strftime('%H:%M') if pub_date else 'Recent'
-                    
-                    topic = categorize_article(title, description, topics)
-                    
-                    new_article = {
-                        'source': feed_name,
-                        'publication': acronym,
-                        'title': title,
-                        'url': link,
-                        'time': time_str,
-                        'date': pub_date or datetime.now(),
-                        'topic': topic,
-                        'description': description
-                    }
-                    
-                    # Advanced deduplication (Option A)
-                    if not is_duplicate_advanced(new_article, articles):
-                        articles.append(new_article)
-                        source_count += 1
-                    else:
-                        feed_duplicates += 1
-                        duplicate_count += 1
-                        
-            except Exception as e:
-                continue
-        
-        feed_stats[feed_name] = {
-            'total': total_entries,
-            'recent': recent_count,
-            'relevant': source_count
-        }
-        
-        print(f'  Recent ({TIME_WINDOW_HOURS}hrs): ' + str(recent_count))
-        print('  Relevant: ' + str(source_count))
-        if feed_duplicates > 0:
-            print('  Duplicates skipped: ' + str(feed_duplicates))
-        
-    except Exception as e:
-        print('  ❌ Error: ' + str(e)[:50])
-        feed_stats[feed_name] = {'total': 0, 'recent': 0, 'relevant': 0}
-        continue
-
-# ============================================
-# DEDUPLICATION SUMMARY
-# ============================================
-print('\n' + '=' * 60)
-print('DEDUPLICATION SUMMARY')
-print('=' * 60)
-
-total_before_dedup = len(articles) + duplicate_count
-dedup_percentage = (duplicate_count / total_before_dedup * 100) if total_before_dedup > 0 else 0
-
-print(f'Articles before deduplication: {total_before_dedup}')
-print(f'Duplicates removed: {duplicate_count}')
-print(f'Unique articles remaining: {len(articles)}')
-print(f'Reduction: {dedup_percentage:.1f}%')
-print(f'Method: Entity extraction + First-7-words matching')
-
-# ============================================
-# SUMMARY
-# ============================================
-print('\n' + '=' * 60)
-print('SUMMARY BY PUBLICATION')
-print('=' * 60)
-
-all_publications = set()
-for feed_name, feed_info in feeds.items():
-    all_publications.add(feed_info['acronym'])
-
-for pub in sorted(all_publications):
-    pub_feeds = {k: v for k, v in feed_stats.items() if feeds.get(k, {}).get('acronym') == pub}
-    if pub_feeds:
-        total_rel = sum(f['relevant'] for f in pub_feeds.values())
-        print(pub + ': ' + str(total_rel) + ' articles from ' + str(len(pub_feeds)) + ' feeds')
-
-print('\nTotal unique articles: ' + str(len(articles)))
-
-print('\n' + '=' * 60)
-print('SUMMARY BY TOPIC')
-print('=' * 60)
-
-topic_counts = defaultdict(int)
-for article in articles:
-    topic_counts[article['topic']] += 1
-
-for topic in sorted(topic_counts.keys()):
-    print(topic + ': ' + str(topic_counts[topic]) + ' articles')
-
-print('=' * 60)
-
-# ============================================
-# WORD CLOUD TRENDING DETECTION
-# ============================================
-trending_topics = []
-
-if len(articles) >= MIN_ARTICLES_FOR_TRENDING:
-    print('\n' + '=' * 60)
-    print('IDENTIFYING TRENDING TOPICS (WORD CLOUD + FILTERS)')
-    print('=' * 60)
-    print(f'Articles available: {len(articles)}')
-    
-    trending_topics = identify_trending_wordcloud(articles, top_n=MAX_TRENDING_TOPICS)
-    
-    if trending_topics:
-        print(f'\n✓ Found {len(trending_topics)} trending topics:')
-        for i, trending in enumerate(trending_topics, 1):
-            print(f"  {i}. {trending['topic']}: {trending['count']} articles")
-        print('\n✅ Trending analysis complete (OPTION C: Noise filter + Diversity check)')
-    else:
-        print('\n⚠️  No significant trending topics found')
-else:
-    print(f'\n⚠️  Trending detection: SKIPPED (only {len(articles)} articles, need {MIN_ARTICLES_FOR_TRENDING}+)')
-
-print('=' * 60)
-
-# ============================================
-# BUILD TELEGRAM MESSAGE
-# ============================================
-if not articles:
-    msg = '*Financial News Digest*\n' + datetime.now().strftime('%B %d, %Y') + '\n\nNo relevant articles found today.'
-    messages = [msg]
-else:
-    articles.sort(key=lambda x: x['date'], reverse=True)
-    
-    by_topic = defaultdict(lambda: defaultdict(list))
-    for article in articles:
-        by_topic[article['topic']][article['publication']].append(article)
-    
-    messages = []
-    
-    # HEADER MESSAGE
-    header_msg = '*Financial News Digest*\n'
-    header_msg = header_msg + datetime.now().strftime('%B %d, %Y') + '\n\n'
-    
-    total_articles = len(articles)
-    all_pubs = set(article['publication'] for article in articles)
-    
-    header_msg = header_msg + str(total_articles) + ' articles from ' + str(len(all_pubs)) + ' publications\n'
-    header_msg = header_msg + '━━━━━━━━━━━━━━━━━\n\n'
-    
-    # Add trending section
-    if trending_topics:
-        header_msg = header_msg + '*🔥 TRENDING TODAY*\n\n'
-        
-        for trending in trending_topics:
-            header_msg = header_msg + '*' + trending['topic'] + '* (' + str(trending['count']) + ' articles)\n'
-            header_msg = header_msg + trending['summary'] + '\n\n'
-        
-        header_msg = header_msg + '━━━━━━━━━━━━━━━━━\n\n'
-    
-    messages.append(header_msg)
-    
-    # Build content messages with LARGER limit (3800 chars)
-    current_msg = ''
-    
-    for topic_config in topics:
-        topic_name = topic_config['name']
-        
-        if topic_name not in by_topic:
-            continue
-        
-        publications_in_topic = by_topic[topic_name]
-        
-        if not publications_in_topic:
-            continue
-        
-        topic_header = '*' + topic_name + '*\n\n'
-        
-        if current_msg and len(current_msg) + len(topic_header) > MESSAGE_CHAR_LIMIT:
-            messages.append(current_msg)
-            current_msg = ''
-        
-        current_msg = current_msg + topic_header
-        
-        for pub_acronym in sorted(publications_in_topic.keys()):
-            articles_from_pub = publications_in_topic[pub_acronym]
-            
-            if not articles_from_pub:
-                continue
-            
-            articles_from_pub = sorted(articles_from_pub, key=lambda x: x['date'], reverse=True)
-            
-            pub_header = '_' + pub_acronym + '_\n'
-            
-            if len(current_msg) + len(pub_header) > MESSAGE_CHAR_LIMIT:
-                messages.append(current_msg)
-                current_msg = topic_header + pub_header
-            else:
-                current_msg = current_msg + pub_header
-            
-            for i, article in enumerate(articles_from_pub, 1):
-                title_short = article['title']
-                
-                if len(title_short) > 75:
-                    title_short = title_short[:72] + '...'
-                
-                title_escaped = escape_markdown_title(title_short)
-                
-                article_line = str(i) + '. [' + title_escaped + '](' + article['url'] + ')\n'
-                
-                if len(current_msg) + len(article_line) > MESSAGE_CHAR_LIMIT:
-                    messages.append(current_msg)
-                    current_msg = topic_header + pub_header + article_line
-                else:
-                    current_msg = current_msg + article_line
-            
-            current_msg = current_msg + '\n'
-    
-    if current_msg.strip():
-        messages.append(current_msg)
-
-print('\n📊 Split into ' + str(len(messages)) + ' messages')
-
-# ============================================
-# SEND TO ALL RECIPIENTS
-# ============================================
-if not token:
-    print('\n❌ ERROR: Missing TELEGRAM_BOT_TOKEN')
-elif not RECIPIENTS:
-    print('\n❌ ERROR: No recipients found')
-else:
-    try:
-        url = 'https://api.telegram.org/bot' + token + '/sendMessage'
-        
-        print('\n' + '=' * 60)
-        print('SENDING TO ' + str(len(RECIPIENTS)) + ' RECIPIENTS')
-        print('=' * 60)
-        
-        for recipient in RECIPIENTS:
-            print('\n📤 Sending to: ' + str(recipient)[:3] + '...')
-            
-            for i, msg in enumerate(messages):
-                print('  Part ' + str(i + 1) + '/' + str(len(messages)))
-                
-                data = {
-                    'chat_id': recipient,
-                    'text': msg,
-                    'parse_mode': 'Markdown',
-                    'disable_web_page_preview': True
-                }
-                
-                try:
-                    response = requests.post(url, json=data, timeout=15)
-                    
-                    if response.status_code == 200:
-                        print('  ✅ Sent')
-                    else:
-                        print('  ❌ Error: ' + str(response.status_code))
-                        try:
-                            print('  Response: ' + str(response.json()))
-                        except:
-                            pass
-                except requests.Timeout:
-                    print('  ⚠️  Timeout')
-                except Exception as e:
-                    print('  ❌ Error: ' + str(e)[:50])
-                
-                if i < len(messages) - 1:
-                    import time
-                    time.sleep(1)
-        
-        print('\n✅ ALL MESSAGES SENT!')
-            
-    except Exception as e:
-        print('\n❌ ERROR: ' + str(e))
-
-print('\n' + '=' * 60)
-print('Script completed')
-print('=' * 60)
+if __name__ == '__main__':
+    main()